@@ -0,0 +1,167 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+
+# ==========================================
+# 빌드 단계 AI 분석 미리 생성 (공고 페이지에 포함)
+# ==========================================
+# - 같은 공고를 방문자마다 다시 분석하지 않도록, 페이지를 만들 때 공고당 한 번만 "[데이터 분석 요청]" 을
+#   LLM 백엔드에 보내고 결과를 페이지 데이터(PAGE.insight)에 넣음 → 방문자는 서버 호출 없이 바로 봄
+# - 기본은 꺼짐. 환경변수 AI_INSIGHTS=http|stub 또는 main.py / main_private.py --ai-insights http|stub
+#   · http: 채팅 서버(app.py / asgi_app.py)의 /chat/batch 로 AI_INSIGHTS_BATCH 건씩 묶어 요청,
+#           묶음은 최대 AI_INSIGHTS_CONCURRENCY 개만 동시에 보냄 (주소: AI_INSIGHTS_URL, 기본 RENDER_SERVER_URL)
+#           로컬 스텁: python benchmarks/stub_llm.py + HF_BASE_URL 로 띄운 app.py 주소를 AI_INSIGHTS_URL 로
+#   · stub: 네트워크 없이 고정 형식의 답변 생성 (빌드/화면 확인용)
+# - 결과는 디스크 캐시(.ai_insights_cache)에 (백엔드, 프롬프트 판, 질문, 공고 내용) 해시로 저장
+#   → 공고 내용이 그대로면 다음 실행에서는 다시 요청하지 않음
+# - 실패하거나 서버가 오류 문구(⚠ ...)를 돌려준 항목은 저장하지 않고 페이지에도 넣지 않음 (다음 실행에서 재시도)
+
+CACHE_DIR = os.environ.get("AI_INSIGHTS_CACHE_DIR", ".ai_insights_cache")
+BATCH_SIZE = int(os.environ.get("AI_INSIGHTS_BATCH", 10))
+CONCURRENCY = int(os.environ.get("AI_INSIGHTS_CONCURRENCY", 2))
+PROMPT_VERSION = 1  # 질문 문구/형식을 바꾸면 올려서 캐시를 새로 만듦
+REQUEST_MESSAGE = "[데이터 분석 요청] 이 공고에 합격하려면 어떤 역량과 경험을 어떻게 강조해야 하는지 분석해 주세요."
+
+def insight_request(org_name, title, content_text):
+    # 페이지 챗봇이 보내는 것과 같은 형식의 (질문, 공고 정보) 한 건
+    summary = " ".join(content_text.split())[:1000]
+    context = f"[현재 공고 정보]\n기업명: {org_name}\n공고제목: {title}\n공고내용요약: {summary}..."
+    return {"message": REQUEST_MESSAGE, "context": context}
+
+def usable(answer):
+    return isinstance(answer, str) and answer.strip() != "" and not answer.startswith("⚠")
+
+# ------------------------------------------
+# LLM 백엔드 (generate(항목 목록) → 답변 목록, 실패한 항목은 None)
+# ------------------------------------------
+class HttpBackend:
+    name = "http"
+
+    def __init__(self, url, timeout=600):
+        self.url = url.rstrip("/") + "/batch"
+        self.timeout = timeout  # 무료 서버 기상 시간 + 묶음 처리 시간
+
+    def generate(self, items):
+        res = requests.post(self.url, json={"requests": items}, timeout=self.timeout)
+        res.raise_for_status()
+        answers = [None] * len(items)
+        for result in res.json().get("results", []):
+            if result.get("error") is None and 0 <= result.get("index", -1) < len(items):
+                answers[result["index"]] = result.get("response")
+        return answers
+
+class StubBackend:
+    name = "stub"
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    def generate(self, items):
+        if self.delay: time.sleep(self.delay)
+        return [self.answer(item) for item in items]
+
+    def answer(self, item):
+        org = item["context"].split("기업명: ", 1)[-1].split("\n", 1)[0]
+        return (
+            f"**1. ✅ [핵심 역량 발견]**: (스텁) {org} 공고의 핵심 역량 요약\n\n"
+            f"**2. 🎯 [공고 적용 전략]**: (스텁) 직무 경험을 공고 요건과 연결하는 전략\n\n"
+            f"**3. ⚠️ [합격의 한 끗 차이]**: (스텁) 행동 중심 자소서 안내"
+        )
+
+def make_backend(kind, url):
+    if kind == "http": return HttpBackend(os.environ.get("AI_INSIGHTS_URL") or url)
+    if kind == "stub": return StubBackend()
+    raise ValueError(f"알 수 없는 AI 분석 백엔드: {kind} (http / stub)")
+
+# ------------------------------------------
+# 미리 생성 (디스크 캐시 → 없는 것만 묶음 요청)
+# ------------------------------------------
+class InsightGenerator:
+    def __init__(self, backend, cache_dir=CACHE_DIR, batch_size=BATCH_SIZE, concurrency=CONCURRENCY):
+        self.backend = backend
+        self.cache_dir = cache_dir
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.lock = threading.Lock()
+        self.counts = {"cached": 0, "generated": 0, "failed": 0}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def cache_key(self, item):
+        raw = json.dumps([self.backend.name, PROMPT_VERSION, item["message"], item["context"]], ensure_ascii=False)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def _load(self, key):
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f: return json.load(f)["response"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _store(self, key, answer):
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"response": answer, "backend": self.backend.name,
+                       "created": datetime.now().isoformat(timespec="seconds")}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _count(self, name, n=1):
+        with self.lock: self.counts[name] += n
+
+    def _run_batch(self, batch):
+        # batch: [(키, 항목)] → 묶음 하나 요청. 묶음 전체가 실패해도 다른 묶음은 계속
+        try:
+            answers = self.backend.generate([item for _, item in batch])
+        except Exception as e:
+            print(f"    ⚠ AI 분석 묶음 실패 ({len(batch)}건): {e}")
+            answers = [None] * len(batch)
+        results = {}
+        for (key, _), answer in zip(batch, answers):
+            if usable(answer):
+                self._store(key, answer)
+                results[key] = answer
+                self._count("generated")
+            else:
+                self._count("failed")
+        return results
+
+    def generate(self, items):
+        # items: insight_request() 목록 → 같은 순서의 답변 목록 (실패한 항목은 None)
+        keys = [self.cache_key(item) for item in items]
+        answers = {}
+        missing = {}
+        for key, item in zip(keys, items):
+            if key in answers or key in missing: continue  # 같은 내용의 공고는 한 번만
+            cached = self._load(key)
+            if cached is not None:
+                answers[key] = cached
+                self._count("cached")
+            else:
+                missing[key] = item
+
+        todo = list(missing.items())
+        batches = [todo[i:i + self.batch_size] for i in range(0, len(todo), self.batch_size)]
+        if batches:
+            print(f"🧠 AI 분석 생성: {len(todo)}건 ({len(batches)}묶음, 동시 {self.concurrency}묶음, 백엔드 {self.backend.name})")
+            with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                for results in pool.map(self._run_batch, batches):
+                    answers.update(results)
+        return [answers.get(key) for key in keys]
+
+    def report(self, label=""):
+        c = self.counts
+        print(f"🧠 [{label}] AI 분석: 캐시 {c['cached']} · 새로 생성 {c['generated']} · 실패 {c['failed']}")
+
+def from_env(kind, url):
+    # kind: 명령줄 값 (없으면 환경변수 AI_INSIGHTS) → InsightGenerator, 꺼져 있으면 None
+    kind = kind or os.environ.get("AI_INSIGHTS", "")
+    if not kind or kind == "off": return None
+    return InsightGenerator(make_backend(kind, url))
@@ -1,14 +1,25 @@
 import os
 import json
+import hashlib
 import random
 import time
 import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 from huggingface_hub import InferenceClient
-from duckduckgo_search import DDGS
-from flask import Flask, request, jsonify, Response
+from flask import Flask, request, jsonify, Response, stream_with_context
 from flask_cors import CORS
+from db_index import SubstringIndex
+from tfidf_index import TfidfIndex, available as tfidf_available
+from ttl_cache import TTLCache, SingleFlight, LeaderCancelled
+from web_search import WebSearch
+from keyword_matcher import KeywordMatcher
+from metrics import (
+    REGISTRY, CONTENT_TYPE as METRICS_CONTENT_TYPE, CHAT_REQUESTS, CHAT_SECONDS, LLM_SECONDS,
+    SEARCH_WEB_SECONDS, SEARCH_DB_SECONDS, CONTEXT_CHARS, ERRORS
+)
+from profiling import PROFILER, stage, annotate
 
 # ======================================================
 # 1. 설정 및 보안 (원본 유지)
@@ -17,7 +28,9 @@ if not load_dotenv('config.env'):
     print("ℹ [알림] config.env 파일을 찾을 수 없습니다. (Render 서버 환경 변수 사용 시 정상)")
 
 HF_TOKEN = os.getenv("HF_TOKEN")
-client = InferenceClient(api_key=HF_TOKEN)
+# [선택] OpenAI 호환 LLM 주소 (부하 테스트용 로컬 스텁 등). 비어 있으면 Hugging Face 사용
+HF_BASE_URL = os.getenv("HF_BASE_URL") or None
+client = InferenceClient(base_url=HF_BASE_URL, api_key=HF_TOKEN)
 MODEL_ID = "Qwen/Qwen2.5-7B-Instruct"
 
 app = Flask(__name__)
@@ -27,9 +40,19 @@ CORS(app)
 # 2. 기능: DB 로드 & 검색 (원본 유지)
 # ======================================================
 ALL_DB_DATA = []
+DB_INDEX = SubstringIndex([])
+DB_RANKER = None  # 질문 전체로 관련도 순 검색 (numpy/scipy 가 없으면 None → 첫 단어 검색만 사용)
+# 서버가 만들어 두는 파일(색인 저장본 등) 보관 폴더. 실행 위치(cwd)와 무관하게 app.py 옆 data/ 가 기본
+DATA_DIR = os.environ.get("DATA_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+TFIDF_CACHE_FILE = os.environ.get("DB_TFIDF_CACHE") or None  # None → load_database() 때의 DATA_DIR/db_tfidf.npz
+EVIDENCE_K = int(os.environ.get("DB_EVIDENCE_K", 3))
+EVIDENCE_CHARS = 700  # 참고 자소서 한 건당 프롬프트에 넣을 최대 글자 수
+# 이 점수(코사인) 미만은 관련 없는 문서로 보고 버림 → 남는 게 없으면 첫 단어 검색으로
+# (1,500자 안팎 문서 기준 무관한 질문 0.007~0.014, 관련 있는 질문의 1위 0.05 이상)
+EVIDENCE_MIN_SCORE = float(os.environ.get("DB_EVIDENCE_MIN_SCORE", 0.03))
 
 def load_database():
-    global ALL_DB_DATA
+    global ALL_DB_DATA, DB_INDEX, DB_RANKER
     try:
         with open('db1.json', 'r', encoding='utf-8') as f1: data1 = json.load(f1)
         with open('db2.json', 'r', encoding='utf-8') as f2: data2 = json.load(f2)
@@ -39,38 +62,87 @@ def load_database():
         ALL_DB_DATA = ["(데이터 로드 실패) 기본 합격 예시 데이터"]
         print("⚠ [주의] DB 파일을 찾을 수 없어 기본 데이터로 실행합니다.")
 
+    # [성능] 매 요청마다 전체를 훑지 않도록 부분 문자열 색인을 한 번만 생성
+    start = time.time()
+    DB_INDEX = SubstringIndex(ALL_DB_DATA)
+    print(f"🔎 [서버] 검색 색인 생성 완료 ({time.time() - start:.2f}초)")
+
+    # [성능] 문자 n-gram TF-IDF 색인 (저장본이 있고 DB 가 그대로면 다시 만들지 않고 읽음)
+    if tfidf_available():
+        # 저장 위치는 부를 때 정함 (벤치마크 등이 DATA_DIR 을 임시 폴더로 바꿔 둘 수 있음)
+        DB_RANKER = TfidfIndex.load_or_build(ALL_DB_DATA, TFIDF_CACHE_FILE or os.path.join(DATA_DIR, "db_tfidf.npz"))
+    else:
+        DB_RANKER = None
+        print("ℹ [알림] numpy/scipy 가 없어 관련도 순 검색 없이 실행합니다. (pip install numpy scipy)")
+
+def _sample_db(keyword):
+    # [성능] 결과 전체를 만들지 않고 색인 후보에서 하나만 무작위 추출 (지표 기록은 호출한 쪽에서)
+    result = DB_INDEX.sample(keyword, random)
+    return result if result is not None else ""
+
 def search_db(keyword):
-    results = [item for item in ALL_DB_DATA if keyword in item]
-    return random.choice(results) if results else ""
+    with SEARCH_DB_SECONDS.time(method="keyword"), stage("search_db"):
+        return _sample_db(keyword)
+
+def retrieve_evidence(user_input):
+    # 질문 전체와 가장 비슷한 합격 자소서 상위 EVIDENCE_K 건 (색인이 없거나 EVIDENCE_MIN_SCORE 이상인 문서가 없으면 첫 단어 검색)
+    # 검색 시간은 요청당 한 번, 실제로 답을 낸 방식(tfidf / keyword)으로 기록 (대체 검색 시간까지 포함)
+    start = time.perf_counter()
+    with stage("search_db"):
+        hits = DB_RANKER.search(user_input, k=EVIDENCE_K, min_score=EVIDENCE_MIN_SCORE) if DB_RANKER is not None else []
+        if hits:
+            method = "tfidf"
+            result = "\n\n".join(f"({rank}) {str(ALL_DB_DATA[doc])[:EVIDENCE_CHARS]}" for rank, (doc, _) in enumerate(hits, 1))
+        else:
+            method = "keyword"
+            result = _sample_db(user_input.split()[0])
+    SEARCH_DB_SECONDS.observe(time.perf_counter() - start, method=method)
+    return result
 
 # ======================================================
 # 3. 기능: 웹 검색 & 의도 분류 (원본 유지)
 # ======================================================
+# [성능] 검색 결과 캐시(10분) + 중복 호출 합치기 + 회로 차단기 (장애 시 마지막 정상 결과 사용)
+WEB_SEARCH = WebSearch(
+    ttl=int(os.environ.get("SEARCH_CACHE_TTL", 600)),
+    stale_ttl=int(os.environ.get("SEARCH_STALE_TTL", 86400))
+)
+
 def search_web(query):
+    start = time.perf_counter()
     try:
-        with DDGS() as ddgs:
-            results = list(ddgs.text(query, max_results=2))
-            if not results: return "최신 정보를 찾을 수 없습니다."
-            return "\n".join([f"- {r['title']}: {r['body']}" for r in results])
+        with stage("search_web"):
+            results = WEB_SEARCH.search(query)
     except Exception as e:
+        SEARCH_WEB_SECONDS.observe(time.perf_counter() - start, outcome="error")
+        ERRORS.inc(path="search_web")
         return f"검색 시스템 일시 오류: {e}"
+    SEARCH_WEB_SECONDS.observe(time.perf_counter() - start, outcome="ok" if results else "empty")
+    if not results: return "최신 정보를 찾을 수 없습니다."
+    return "\n".join([f"- {r['title']}: {r['body']}" for r in results])
+
+# [성능] 키워드 사전은 한 번만 컴파일하고, 질문은 사전당 한 번만 훑음
+BAD_WORDS = KeywordMatcher(['시발', '병신', '개새끼', '꺼져', '죽어', '미친', 'ㅗ', '씨발', '놈', '새끼'])
+SEARCH_KEYWORDS = KeywordMatcher(['주가', '날씨', '뉴스', '정보', '검색', '전망', '연봉', '이슈', '동향'])
+CHAT_KEYWORDS = KeywordMatcher(['안녕', '하이', 'ㅎㅇ', '반가', '고마', '감사', '시작', '테스트'])
 
 def classify_intent(user_input):
-    bad_words = ['시발', '병신', '개새끼', '꺼져', '죽어', '미친', 'ㅗ', '씨발', '놈', '새끼']
-    if any(word in user_input for word in bad_words): return "INSULT"
+    if BAD_WORDS.any_in(user_input): return "INSULT"
     
-    search_keywords = ['주가', '날씨', '뉴스', '정보', '검색', '전망', '연봉', '이슈', '동향']
-    if any(x in user_input for x in search_keywords): return "SEARCH"
+    if SEARCH_KEYWORDS.any_in(user_input): return "SEARCH"
     
-    chat_keywords = ['안녕', '하이', 'ㅎㅇ', '반가', '고마', '감사', '시작', '테스트']
-    if len(user_input) < 5 or any(x in user_input for x in chat_keywords): return "CHAT"
+    if len(user_input) < 5 or CHAT_KEYWORDS.any_in(user_input): return "CHAT"
     
     return "CONSULTING"
 
 # ======================================================
 # 4. 기능: 답변 생성 (★기존 영업 로직 + 뉴스 대응 추가★)
 # ======================================================
-def ask_kim_pro(user_input, context=""):
+INSULT_REPLY = "🚫 예의를 갖춰 질문해 주세요. 김진호 합격연구소는 비매너 채팅에 응답하지 않습니다."
+
+def build_messages(user_input, context="", web_info=None):
+    # 의도 분류 → 프롬프트 구성. LLM 을 부르지 않는 경우(INSULT)는 messages=None
+    # web_info: 비동기 서버(asgi_app.py)가 미리 검색해 둔 결과 (없으면 여기서 검색)
     intent = classify_intent(user_input)
     
     NO_CHINESE_RULE = """
@@ -80,10 +152,10 @@ def ask_kim_pro(user_input, context=""):
     """
     
     if intent == "INSULT":
-        return "🚫 예의를 갖춰 질문해 주세요. 김진호 합격연구소는 비매너 채팅에 응답하지 않습니다."
+        return intent, None
     
     elif intent == "SEARCH":
-        info = search_web(user_input)
+        info = web_info if web_info is not None else search_web(user_input)
         sys_msg = f"당신은 '김진호 합격연구소' AI 비서입니다. 검색 결과를 요약하고 전문가의 도움이 필요하다고 덧붙이세요.\n{NO_CHINESE_RULE}"
         user_msg = f"[검색 결과]:\n{info}\n\n[질문]: {user_input}"
         
@@ -145,7 +217,7 @@ def ask_kim_pro(user_input, context=""):
             
         # Case 4: DB 기반 질문 (기존 기능)
         else:
-            evidence = search_db(user_input.split()[0])
+            evidence = retrieve_evidence(user_input)
             sys_msg = f"당신은 AI 연구원입니다. 합격 DB를 기반으로 답하되, 김진호 소장의 행동 설계를 강조하세요.\n{NO_CHINESE_RULE}"
             user_msg = f"[참고 DB]: {evidence}\n\n[질문]: {user_input}"
         
@@ -153,23 +225,149 @@ def ask_kim_pro(user_input, context=""):
         sys_msg = f"당신은 친절한 상담사입니다. 한국어로 인사하고 자소서 고민을 물어보세요.\n{NO_CHINESE_RULE}"
         user_msg = user_input
 
+    return intent, [
+        {"role": "system", "content": sys_msg},
+        {"role": "user", "content": user_msg}
+    ]
+
+# [캐시] 같은 키워드 칩 / 같은 뉴스 버튼 클릭은 (의도, 질문, 컨텍스트)가 동일하므로
+# 답변을 재사용하고, 동시에 들어온 동일 요청은 LLM 호출 한 번으로 합칩니다.
+# (오류 답변은 저장하지 않음)
+ANSWER_CACHE = TTLCache(
+    max_size=int(os.environ.get("ANSWER_CACHE_SIZE", 512)),
+    ttl=int(os.environ.get("ANSWER_CACHE_TTL", 3600))
+)
+ANSWER_FLIGHT = SingleFlight()
+
+def answer_cache_key(intent, user_input, context=""):
+    message = " ".join(user_input.split())
+    context_hash = hashlib.sha1(" ".join(context.split()).encode("utf-8")).hexdigest()
+    return (intent, message, context_hash)
+
+def generate_answer(user_input, context=""):
+    # 캐시를 거치지 않는 실제 LLM 호출 (실패 시 예외 그대로 전달)
+    with stage("build_messages"):
+        intent, messages = build_messages(user_input, context)
+    start = time.perf_counter()
     try:
-        response = client.chat_completion(
-            model=MODEL_ID,
-            messages=[
-                {"role": "system", "content": sys_msg},
-                {"role": "user", "content": user_msg}
-            ],
-            max_tokens=800, 
-            temperature=0.7
-        )
-        return response.choices[0].message.content
+        with stage("llm"):
+            response = client.chat_completion(
+                model=MODEL_ID,
+                messages=messages,
+                max_tokens=800, 
+                temperature=0.7
+            )
+    except Exception:
+        LLM_SECONDS.observe(time.perf_counter() - start, mode="sync", outcome="error")
+        raise
+    LLM_SECONDS.observe(time.perf_counter() - start, mode="sync", outcome="ok")
+    return response.choices[0].message.content
+
+def ask_kim_pro(user_input, context=""):
+    with stage("intent"):
+        intent = classify_intent(user_input)
+    annotate(intent=intent)
+    if intent == "INSULT": return INSULT_REPLY
+
+    with stage("cache"):
+        key = answer_cache_key(intent, user_input, context)
+        cached = ANSWER_CACHE.get(key)
+    annotate(cache="hit" if cached is not None else "miss")
+    if cached is not None: return cached
+
+    def fill():
+        answer = generate_answer(user_input, context)
+        ANSWER_CACHE.set(key, answer)
+        return answer
+
+    try:
+        # 같은 질문을 이미 다른 요청이 생성 중이면 기다린 시간이 answer 에 잡힘 (그 아래 단계 없음)
+        with stage("answer"):
+            return ANSWER_FLIGHT.do(key, fill)
     except Exception as e:
+        ERRORS.inc(path="llm")
         return f"⚠ AI 서버 연결 지연: {e}"
 
+def ask_kim_pro_stream(user_input, context=""):
+    # [스트리밍] 답변 전체를 기다리지 않고 토큰이 도착하는 대로 내보냄
+    with stage("intent"):
+        intent = classify_intent(user_input)
+    annotate(intent=intent)
+    if intent == "INSULT":
+        yield INSULT_REPLY
+        return
+
+    with stage("cache"):
+        key = answer_cache_key(intent, user_input, context)
+        cached = ANSWER_CACHE.get(key)
+    annotate(cache="hit" if cached is not None else "miss")
+    if cached is not None:
+        yield cached
+        return
+
+    # 같은 질문이 이미 생성 중이면 그 결과를 기다렸다가 한 번에 전달
+    # (그 요청이 중간에 끊기면 부분 답변은 받지 않고 다시 시도 → 이번에는 직접 생성할 수 있음)
+    while True:
+        call, leader = ANSWER_FLIGHT.begin(key)
+        if leader: break
+        try:
+            with stage("answer"):
+                shared = ANSWER_FLIGHT.wait(call)
+        except LeaderCancelled:
+            continue
+        except Exception as e:
+            ERRORS.inc(path="llm_stream")
+            yield f"⚠ AI 서버 연결 지연: {e}"
+            return
+        yield shared
+        return
+
+    answer = ""
+    start = None
+    try:
+        with stage("build_messages"):
+            intent, messages = build_messages(user_input, context)
+        start = time.perf_counter()
+        # 스트리밍의 llm 단계에는 토큰을 내보내는(클라이언트가 받아 가는) 시간도 포함됨
+        with stage("llm"):
+            for chunk in client.chat_completion(
+                model=MODEL_ID,
+                messages=messages,
+                max_tokens=800, 
+                temperature=0.7,
+                stream=True
+            ):
+                token = chunk.choices[0].delta.content
+                if token:
+                    if not answer: annotate(first_token_ms=round((time.perf_counter() - start) * 1000, 2))
+                    answer += token
+                    yield token
+    except Exception as e:
+        if start is not None: LLM_SECONDS.observe(time.perf_counter() - start, mode="stream", outcome="error")
+        ERRORS.inc(path="llm_stream")
+        ANSWER_FLIGHT.finish(key, call, error=e)
+        yield f"⚠ AI 서버 연결 지연: {e}"
+        return
+    except GeneratorExit:
+        # 사용자가 도중에 연결을 끊음 → 부분 답변은 캐시/공유하지 않고, 기다리던 요청은 다시 생성
+        if start is not None: LLM_SECONDS.observe(time.perf_counter() - start, mode="stream", outcome="cancelled")
+        ANSWER_FLIGHT.finish(key, call, error=LeaderCancelled())
+        raise
+
+    LLM_SECONDS.observe(time.perf_counter() - start, mode="stream", outcome="ok")
+    ANSWER_CACHE.set(key, answer)
+    ANSWER_FLIGHT.finish(key, call, result=answer)
+
 # ======================================================
 # 5. 웹 통신 API (원본 유지)
 # ======================================================
+def observe_request(endpoint, user_msg, context_data):
+    # 요청 수 / context 크기 기록 후, 처리 시간을 잴 타이머(with 블록) 반환
+    intent = classify_intent(user_msg)
+    CHAT_REQUESTS.inc(endpoint=endpoint, intent=intent)
+    CONTEXT_CHARS.observe(len(context_data), endpoint=endpoint)
+    return CHAT_SECONDS.time(endpoint=endpoint, intent=intent)
+
 @app.route('/chat', methods=['POST'])
 def chat_endpoint():
     try:
@@ -181,15 +379,134 @@ def chat_endpoint():
         if context_data:
             print(f"📄 [데이터 감지]: {len(context_data)}자")
 
-        answer = ask_kim_pro(user_msg, context=context_data)
+        with PROFILER.request("chat", user_msg, request.headers), observe_request("chat", user_msg, context_data):
+            answer = ask_kim_pro(user_msg, context=context_data)
         
         print(f"📤 [답변]: {answer[:30]}...")
         return jsonify({'response': answer})
         
     except Exception as e:
+        ERRORS.inc(path="chat_endpoint")
         print(f"❌ 서버 에러: {e}")
         return jsonify({'response': "서버 오류 발생"})
 
+def sse_event(payload, event=None):
+    # Server-Sent Events 한 건 (토큰의 줄바꿈이 깨지지 않도록 JSON 으로 감쌈)
+    head = f"event: {event}\n" if event else ""
+    return f"{head}data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+@app.route('/chat/stream', methods=['POST'])
+def chat_stream_endpoint():
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        ERRORS.inc(path="stream_endpoint")
+        return jsonify({'error': "잘못된 요청입니다"}), 400
+    user_msg = data.get('message', '')
+    context_data = data.get('context', '')
+
+    print(f"📩 [스트리밍 질문]: {user_msg}")
+    if context_data:
+        print(f"📄 [데이터 감지]: {len(context_data)}자")
+
+    profile = PROFILER.request("stream", user_msg, request.headers)
+
+    def generate():
+        # 프록시가 응답 헤더를 바로 넘기도록 주석 한 줄을 먼저 보냄
+        yield ": stream-start\n\n"
+        answer = ""
+        try:
+            with profile, observe_request("stream", user_msg, context_data):
+                for token in ask_kim_pro_stream(user_msg, context=context_data):
+                    answer += token
+                    yield sse_event({'token': token})
+        except Exception as e:
+            ERRORS.inc(path="stream_endpoint")
+            print(f"❌ 스트리밍 에러: {e}")
+            yield sse_event({'token': "서버 오류 발생"})
+        yield sse_event({}, event="done")
+        print(f"📤 [스트리밍 답변]: {answer[:30]}...")
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# [배치] 빌드/QA 스크립트가 여러 (message, context) 를 한 번에 요청 → 제한된 동시 실행으로 처리
+# 요청: {"requests": [{"message": "...", "context": "..."}, ...], "stream": false}
+# 응답: {"results": [...]} (요청 순서대로) 또는 stream=true 면 끝나는 순서대로 한 줄씩 (NDJSON)
+# 항목별 결과는 {"index", "response"} 또는 {"index", "error"} (한 항목의 오류가 배치 전체를 실패시키지 않음)
+BATCH_MAX_ITEMS = int(os.environ.get("BATCH_MAX_ITEMS", 500))
+BATCH_CONCURRENCY = int(os.environ.get("BATCH_CONCURRENCY", 8))
+# 서버 전체의 배치 동시 실행 상한 (배치 여러 개가 동시에 와도 LLM 호출이 BATCH_CONCURRENCY 개를 넘지 않음)
+# 첫 배치 요청 때 만듦 (asgi_app.py 가 이 모듈을 import 할 때는 만들지 않음)
+BATCH_EXECUTOR = None
+_BATCH_EXECUTOR_LOCK = threading.Lock()
+
+def batch_executor():
+    global BATCH_EXECUTOR
+    with _BATCH_EXECUTOR_LOCK:
+        if BATCH_EXECUTOR is None:
+            BATCH_EXECUTOR = ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY)
+        return BATCH_EXECUTOR
+
+def parse_batch(data):
+    # 요청 본문 → 항목 목록 (형식이 틀리면 ValueError → 400)
+    items = data.get('requests') if isinstance(data, dict) else None
+    if not isinstance(items, list) or not items:
+        raise ValueError("requests 는 비어 있지 않은 목록이어야 합니다")
+    if len(items) > BATCH_MAX_ITEMS:
+        raise ValueError(f"한 번에 최대 {BATCH_MAX_ITEMS}건까지 처리합니다 (요청: {len(items)}건)")
+    return items
+
+def parse_batch_item(item):
+    # 항목 하나 → (message, context) (형식이 틀리면 ValueError → 그 항목만 error)
+    if not isinstance(item, dict) or not isinstance(item.get('message'), str):
+        raise ValueError("message(문자열)가 필요합니다")
+    context_data = item.get('context') or ''
+    if not isinstance(context_data, str):
+        raise ValueError("context 는 문자열이어야 합니다")
+    return item['message'], context_data
+
+def run_batch_item(index, item, headers=None):
+    try:
+        user_msg, context_data = parse_batch_item(item)
+        with PROFILER.request("batch", user_msg, headers), observe_request("batch", user_msg, context_data):
+            return {'index': index, 'response': ask_kim_pro(user_msg, context=context_data)}
+    except Exception as e:
+        ERRORS.inc(path="batch_item")
+        return {'index': index, 'error': str(e)}
+
+@app.route('/chat/batch', methods=['POST'])
+def chat_batch_endpoint():
+    data = request.get_json(silent=True)
+    try:
+        items = parse_batch(data)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    print(f"📦 [배치 질문]: {len(items)}건")
+    headers = request.headers
+    executor = batch_executor()
+    futures = [executor.submit(run_batch_item, i, item, headers) for i, item in enumerate(items)]
+    if not data.get('stream'):
+        return jsonify({'results': [future.result() for future in futures]})
+
+    def generate():
+        try:
+            for future in as_completed(futures):
+                yield json.dumps(future.result(), ensure_ascii=False) + "\n"
+        except GeneratorExit:
+            # 연결이 끊기면 아직 시작하지 않은 항목은 취소
+            for future in futures: future.cancel()
+            raise
+
+    return Response(
+        generate(),
+        mimetype="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 # ======================================================
 # 6. 서버 유지 (Keep-alive) (원본 유지)
 # ======================================================
@@ -201,7 +518,42 @@ def keep_alive():
             print("⏰ [알림] 서버 잠자기 방지(Ping) 완료")
         except: pass
 
-threading.Thread(target=keep_alive, daemon=True).start()
+# import 만으로는 시작하지 않음 (asgi_app.py 가 이 모듈을 import 함)
+# python app.py 로 실행하면 바로, gunicorn 등으로 띄우면 첫 요청 때 한 번 시작
+_KEEP_ALIVE_STARTED = False
+_KEEP_ALIVE_LOCK = threading.Lock()
+
+def start_keep_alive():
+    global _KEEP_ALIVE_STARTED
+    with _KEEP_ALIVE_LOCK:
+        if _KEEP_ALIVE_STARTED: return
+        _KEEP_ALIVE_STARTED = True
+    threading.Thread(target=keep_alive, daemon=True).start()
+
+@app.before_request
+def _start_keep_alive_once():
+    if not _KEEP_ALIVE_STARTED: start_keep_alive()
+
+@app.route('/cache/stats')
+def cache_stats():
+    # 캐시 크기 조정용 적중/실패/축출 카운터
+    return jsonify({
+        'answer_cache': ANSWER_CACHE.stats(),
+        'answer_single_flight_shared': ANSWER_FLIGHT.shared,
+        'web_search': WEB_SEARCH.stats()
+    })
+
+@app.route('/metrics')
+def metrics_endpoint():
+    # Prometheus 텍스트 형식 (의도별 요청 수/지연, LLM·웹검색·DB검색 시간, context 크기, 오류 수)
+    return Response(REGISTRY.render(), content_type=METRICS_CONTENT_TYPE)
+
+@app.route('/debug/profiles')
+def profiles_endpoint():
+    # 최근 프로파일 기록 (최신순). PROFILE_TOKEN 이 없거나 토큰이 틀리면 404
+    if not PROFILER.authorized(request.headers, request.args.get('token')):
+        return Response("Not Found", status=404, mimetype="text/plain")
+    return jsonify({'profiles': PROFILER.snapshot()})
 
 @app.route('/robots.txt')
 def robots():
@@ -213,6 +565,7 @@ def home():
 
 if __name__ == "__main__":
     load_database()
+    start_keep_alive()
     print("\n🚀 [김진호 연구소] AI 웹 서버 가동 중")
     print("   - 모드: 3단 논법 영업 / 토큰 최적화 / 24시간 가동")
     # [중요] Render 포트 설정 유지
@@ -0,0 +1,342 @@
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+from huggingface_hub import AsyncInferenceClient
+
+from app import (
+    MODEL_ID, HF_TOKEN, HF_BASE_URL, INSULT_REPLY, ANSWER_CACHE, ANSWER_FLIGHT, WEB_SEARCH, BATCH_CONCURRENCY,
+    answer_cache_key, build_messages, classify_intent, load_database, search_web, sse_event, observe_request,
+    parse_batch, parse_batch_item
+)
+from metrics import REGISTRY, CONTENT_TYPE as METRICS_CONTENT_TYPE, LLM_SECONDS, ERRORS
+from profiling import PROFILER, stage, annotate
+from ttl_cache import AsyncSingleFlight, LeaderCancelled
+
+# ======================================================
+# 비동기(ASGI) 서버 모드
+# ======================================================
+# - app.py 의 Flask 서버와 같은 경로(/, /robots.txt, /chat, /chat/stream, /chat/batch, /cache/stats, /metrics, /debug/profiles)를 제공합니다.
+# - LLM 호출은 AsyncInferenceClient 로 await 하므로 응답을 기다리는 동안
+#   워커 스레드를 붙잡지 않습니다. (수백 개의 동시 요청을 하나의 프로세스가 처리)
+# - DuckDuckGo 검색 라이브러리는 동기 전용이라, 전용 스레드 풀에서 실행하고 await 합니다.
+#
+# 실행: uvicorn asgi_app:app --host 0.0.0.0 --port $PORT
+
+async_client = AsyncInferenceClient(base_url=HF_BASE_URL, api_key=HF_TOKEN)
+SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=int(os.environ.get("SEARCH_WORKERS", 8)))
+# 답변 캐시(ANSWER_CACHE)는 app.py 와 공유, 중복 호출 합치기만 asyncio 버전 사용
+ASYNC_FLIGHT = AsyncSingleFlight()
+# /chat/batch 항목의 서버 전체 동시 실행 상한 (app.py 의 BATCH_EXECUTOR 와 같은 값)
+BATCH_SEMAPHORE = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+CORS_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"GET, POST, OPTIONS"),
+    (b"access-control-allow-headers", b"Content-Type, X-Profile, X-Profile-Trace"),
+]
+
+# ======================================================
+# 1. 답변 생성 (app.py 의 프롬프트 로직 재사용)
+# ======================================================
+async def build_messages_async(user_input, context=""):
+    web_info = None
+    if classify_intent(user_input) == "SEARCH":
+        loop = asyncio.get_running_loop()
+        # 검색 스레드에는 프로파일이 넘어가지 않으므로 기다리는 쪽에서 시간을 잼
+        with stage("search_web"):
+            web_info = await loop.run_in_executor(SEARCH_EXECUTOR, search_web, user_input)
+    return build_messages(user_input, context, web_info=web_info)
+
+async def generate_answer_async(user_input, context=""):
+    with stage("build_messages"):
+        intent, messages = await build_messages_async(user_input, context)
+    start = time.perf_counter()
+    try:
+        with stage("llm"):
+            response = await async_client.chat_completion(
+                model=MODEL_ID,
+                messages=messages,
+                max_tokens=800,
+                temperature=0.7
+            )
+    except Exception:
+        LLM_SECONDS.observe(time.perf_counter() - start, mode="sync", outcome="error")
+        raise
+    LLM_SECONDS.observe(time.perf_counter() - start, mode="sync", outcome="ok")
+    return response.choices[0].message.content
+
+async def ask_kim_pro_async(user_input, context=""):
+    with stage("intent"):
+        intent = classify_intent(user_input)
+    annotate(intent=intent)
+    if intent == "INSULT": return INSULT_REPLY
+
+    with stage("cache"):
+        key = answer_cache_key(intent, user_input, context)
+        cached = ANSWER_CACHE.get(key)
+    annotate(cache="hit" if cached is not None else "miss")
+    if cached is not None: return cached
+
+    async def fill():
+        answer = await generate_answer_async(user_input, context)
+        ANSWER_CACHE.set(key, answer)
+        return answer
+
+    try:
+        with stage("answer"):
+            return await ASYNC_FLIGHT.do(key, fill)
+    except Exception as e:
+        ERRORS.inc(path="llm")
+        return f"⚠ AI 서버 연결 지연: {e}"
+
+async def ask_kim_pro_stream_async(user_input, context=""):
+    with stage("intent"):
+        intent = classify_intent(user_input)
+    annotate(intent=intent)
+    if intent == "INSULT":
+        yield INSULT_REPLY
+        return
+
+    with stage("cache"):
+        key = answer_cache_key(intent, user_input, context)
+        cached = ANSWER_CACHE.get(key)
+    annotate(cache="hit" if cached is not None else "miss")
+    if cached is not None:
+        yield cached
+        return
+
+    # 생성 중인 요청이 중간에 끊기면 부분 답변은 받지 않고 다시 시도 (app.py 와 같음)
+    while True:
+        future, leader = ASYNC_FLIGHT.begin(key)
+        if leader: break
+        try:
+            with stage("answer"):
+                shared = await ASYNC_FLIGHT.wait(future)
+        except LeaderCancelled:
+            continue
+        except Exception as e:
+            ERRORS.inc(path="llm_stream")
+            yield f"⚠ AI 서버 연결 지연: {e}"
+            return
+        yield shared
+        return
+
+    answer = ""
+    start = None
+    try:
+        with stage("build_messages"):
+            intent, messages = await build_messages_async(user_input, context)
+        start = time.perf_counter()
+        with stage("llm"):
+            stream = await async_client.chat_completion(
+                model=MODEL_ID,
+                messages=messages,
+                max_tokens=800,
+                temperature=0.7,
+                stream=True
+            )
+            async for chunk in stream:
+                token = chunk.choices[0].delta.content
+                if token:
+                    if not answer: annotate(first_token_ms=round((time.perf_counter() - start) * 1000, 2))
+                    answer += token
+                    yield token
+    except Exception as e:
+        if start is not None: LLM_SECONDS.observe(time.perf_counter() - start, mode="stream", outcome="error")
+        ERRORS.inc(path="llm_stream")
+        ASYNC_FLIGHT.finish(key, future, error=e)
+        yield f"⚠ AI 서버 연결 지연: {e}"
+        return
+    except (GeneratorExit, asyncio.CancelledError):
+        if start is not None: LLM_SECONDS.observe(time.perf_counter() - start, mode="stream", outcome="cancelled")
+        ASYNC_FLIGHT.finish(key, future, error=LeaderCancelled())
+        raise
+
+    LLM_SECONDS.observe(time.perf_counter() - start, mode="stream", outcome="ok")
+    ANSWER_CACHE.set(key, answer)
+    ASYNC_FLIGHT.finish(key, future, result=answer)
+
+# ======================================================
+# 2. ASGI 요청/응답 도우미
+# ======================================================
+async def read_json(receive):
+    body = b""
+    while True:
+        message = await receive()
+        body += message.get("body", b"")
+        if not message.get("more_body"): break
+    try:
+        return json.loads(body or b"{}")
+    except ValueError:
+        return {}
+
+async def send_response(send, status, body, content_type):
+    if isinstance(body, str): body = body.encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", content_type.encode()), *CORS_HEADERS],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+async def send_json(send, payload, status=200):
+    await send_response(send, status, json.dumps(payload, ensure_ascii=False), "application/json")
+
+# ======================================================
+# 3. 라우트
+# ======================================================
+async def chat_endpoint(scope, receive, send):
+    try:
+        data = await read_json(receive)
+        user_msg = data.get('message', '')
+        context_data = data.get('context', '')
+
+        print(f"📩 [질문]: {user_msg}")
+        if context_data:
+            print(f"📄 [데이터 감지]: {len(context_data)}자")
+
+        with PROFILER.request("chat", user_msg, scope["headers"]), observe_request("chat", user_msg, context_data):
+            answer = await ask_kim_pro_async(user_msg, context=context_data)
+
+        print(f"📤 [답변]: {answer[:30]}...")
+        await send_json(send, {'response': answer})
+
+    except Exception as e:
+        ERRORS.inc(path="chat_endpoint")
+        print(f"❌ 서버 에러: {e}")
+        await send_json(send, {'response': "서버 오류 발생"})
+
+async def chat_stream_endpoint(scope, receive, send):
+    # 응답 헤더(200)를 보내기 전에 요청 본문을 확인 → 형식이 틀리면 400
+    try:
+        data = await read_json(receive)
+        if not isinstance(data, dict): raise ValueError("요청 본문은 JSON 객체여야 합니다")
+        user_msg = data.get('message', '')
+        context_data = data.get('context', '')
+    except Exception as e:
+        ERRORS.inc(path="stream_endpoint")
+        print(f"❌ 스트리밍 요청 오류: {e}")
+        await send_json(send, {'error': "잘못된 요청입니다"}, status=400)
+        return
+    print(f"📩 [스트리밍 질문]: {user_msg}")
+
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [
+            (b"content-type", b"text/event-stream; charset=utf-8"),
+            (b"cache-control", b"no-cache"),
+            (b"x-accel-buffering", b"no"),
+            *CORS_HEADERS,
+        ],
+    })
+
+    async def emit(text):
+        await send({"type": "http.response.body", "body": text.encode("utf-8"), "more_body": True})
+
+    await emit(": stream-start\n\n")
+    answer = ""
+    try:
+        with PROFILER.request("stream", user_msg, scope["headers"]), observe_request("stream", user_msg, context_data):
+            async for token in ask_kim_pro_stream_async(user_msg, context=context_data):
+                answer += token
+                await emit(sse_event({'token': token}))
+    except Exception as e:
+        ERRORS.inc(path="stream_endpoint")
+        print(f"❌ 스트리밍 에러: {e}")
+        await emit(sse_event({'token': "서버 오류 발생"}))
+    await emit(sse_event({}, event="done"))
+    await send({"type": "http.response.body", "body": b""})
+    print(f"📤 [스트리밍 답변]: {answer[:30]}...")
+
+async def run_batch_item_async(index, item, headers=None):
+    async with BATCH_SEMAPHORE:
+        try:
+            user_msg, context_data = parse_batch_item(item)
+            with PROFILER.request("batch", user_msg, headers), observe_request("batch", user_msg, context_data):
+                return {'index': index, 'response': await ask_kim_pro_async(user_msg, context=context_data)}
+        except Exception as e:
+            ERRORS.inc(path="batch_item")
+            return {'index': index, 'error': str(e)}
+
+async def chat_batch_endpoint(scope, receive, send):
+    data = await read_json(receive)
+    try:
+        items = parse_batch(data)
+    except ValueError as e:
+        await send_json(send, {'error': str(e)}, status=400)
+        return
+
+    print(f"📦 [배치 질문]: {len(items)}건")
+    tasks = [asyncio.ensure_future(run_batch_item_async(i, item, scope["headers"])) for i, item in enumerate(items)]
+    try:
+        if not data.get('stream'):
+            await send_json(send, {'results': await asyncio.gather(*tasks)})
+            return
+
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"application/x-ndjson"),
+                (b"cache-control", b"no-cache"),
+                (b"x-accel-buffering", b"no"),
+                *CORS_HEADERS,
+            ],
+        })
+        for done in asyncio.as_completed(tasks):
+            line = json.dumps(await done, ensure_ascii=False) + "\n"
+            await send({"type": "http.response.body", "body": line.encode("utf-8"), "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        # 연결이 끊기거나 도중에 실패하면 남은 항목은 취소
+        for task in tasks: task.cancel()
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                load_database()
+                print("\n🚀 [김진호 연구소] AI 웹 서버 가동 중 (ASGI 비동기 모드)")
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                SEARCH_EXECUTOR.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    if scope["type"] != "http": return
+
+    method, path = scope["method"], scope["path"]
+    if method == "OPTIONS":
+        await send_response(send, 204, b"", "text/plain")
+    elif path == "/chat" and method == "POST":
+        await chat_endpoint(scope, receive, send)
+    elif path == "/chat/stream" and method == "POST":
+        await chat_stream_endpoint(scope, receive, send)
+    elif path == "/chat/batch" and method == "POST":
+        await chat_batch_endpoint(scope, receive, send)
+    elif path == "/cache/stats":
+        await send_json(send, {
+            'answer_cache': ANSWER_CACHE.stats(),
+            'answer_single_flight_shared': ANSWER_FLIGHT.shared + ASYNC_FLIGHT.shared,
+            'web_search': WEB_SEARCH.stats()
+        })
+    elif path == "/metrics":
+        await send_response(send, 200, REGISTRY.render(), METRICS_CONTENT_TYPE)
+    elif path == "/debug/profiles":
+        token = parse_qs(scope["query_string"].decode()).get("token", [None])[0]
+        if PROFILER.authorized(scope["headers"], token):
+            await send_json(send, {'profiles': PROFILER.snapshot()})
+        else:
+            await send_response(send, 404, "Not Found", "text/plain")
+    elif path == "/robots.txt":
+        await send_response(send, 200, "User-agent: *\nAllow: /", "text/plain")
+    elif path == "/":
+        await send_response(send, 200, "🤖 김진호 합격연구소 AI 서버 정상 작동 중", "text/html; charset=utf-8")
+    else:
+        await send_response(send, 404, "Not Found", "text/plain")
@@ -0,0 +1,103 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from stub_llm import serve
+
+# ==========================================
+# 동시 요청 처리량 비교: Flask(gunicorn sync) vs ASGI(uvicorn)
+# ==========================================
+# 로컬 스텁 LLM(고정 지연)을 띄우고, 두 서버에 같은 수의 동시 /chat 요청을 보냅니다.
+# 사용법: python benchmarks/bench_asgi_load.py --concurrency 50 --delay 2 --workers 2
+# (gunicorn, uvicorn 및 requirements.txt 의 패키지가 설치되어 있어야 합니다)
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+STUB_PORT = 8900
+SERVERS = {
+    "flask-gunicorn-sync": lambda port, workers: [
+        sys.executable, "-m", "gunicorn", "-w", str(workers), "-b", f"127.0.0.1:{port}", "app:app"],
+    "asgi-uvicorn": lambda port, workers: [
+        sys.executable, "-m", "uvicorn", "asgi_app:app", "--host", "127.0.0.1", "--port", str(port),
+        "--log-level", "warning"],
+}
+
+def wait_ready(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/robots.txt", timeout=1)
+            return True
+        except Exception:
+            time.sleep(0.3)
+    return False
+
+def one_request(port, timeout, index):
+    # '안녕하세요' → CHAT 의도: DB/웹 검색 없이 LLM 호출만 측정
+    # 요청마다 번호를 붙여 답변 캐시 / 중복 호출 합치기(ANSWER_CACHE, ANSWER_FLIGHT)에 걸리지 않게 함
+    body = json.dumps({"message": f"안녕하세요 {index}", "context": ""}).encode("utf-8")
+    req = urllib.request.Request(f"http://127.0.0.1:{port}/chat", data=body,
+                                 headers={"Content-Type": "application/json"})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as res:
+            ok = "response" in json.loads(res.read())
+    except Exception:
+        ok = False
+    return ok, time.perf_counter() - start
+
+def run_load(port, concurrency, timeout):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda i: one_request(port, timeout, i), range(concurrency)))
+    wall = time.perf_counter() - start
+    latencies = sorted(t for ok, t in results if ok)
+    return {
+        "ok": len(latencies),
+        "failed": concurrency - len(latencies),
+        "wall_sec": round(wall, 2),
+        "throughput_rps": round(len(latencies) / wall, 2),
+        "p50_sec": round(statistics.median(latencies), 2) if latencies else None,
+        "p95_sec": round(latencies[int(len(latencies) * 0.95) - 1], 2) if latencies else None,
+    }
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--delay", type=float, default=2.0, help="스텁 LLM 응답 지연(초)")
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn sync 워커 수")
+    parser.add_argument("--timeout", type=float, default=120)
+    args = parser.parse_args()
+
+    stub = serve(STUB_PORT, args.delay)
+    threading.Thread(target=stub.serve_forever, daemon=True).start()
+    env = dict(os.environ, HF_BASE_URL=f"http://127.0.0.1:{STUB_PORT}", HF_TOKEN="stub")
+
+    report = {}
+    for idx, (name, command) in enumerate(SERVERS.items()):
+        port = 8910 + idx
+        proc = subprocess.Popen(command(port, args.workers), cwd=ROOT, env=env,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            if not wait_ready(port):
+                print(f"❌ {name} 서버가 뜨지 않았습니다.")
+                continue
+            report[name] = run_load(port, args.concurrency, args.timeout)
+            print(f"📊 {name}: {report[name]}")
+        finally:
+            proc.terminate()
+            proc.wait()
+
+    stub.shutdown()
+    # 이상적인 처리량: 모든 요청이 동시에 LLM 을 기다리면 wall ≈ delay
+    print(f"\n(참고) 동시 {args.concurrency}건 × 지연 {args.delay}초 → 이상적 wall ≈ {args.delay}초")
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
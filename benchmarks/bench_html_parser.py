@@ -0,0 +1,162 @@
+import argparse
+import contextlib
+import glob
+import io
+import os
+import sys
+import time
+import warnings
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+warnings.filterwarnings("ignore", message="It looks like you're using an HTML parser")  # RSS 를 HTML 파서로 읽는 것은 기존 동작
+
+import collector
+import html_parser
+import main
+import main_private
+import synthetic
+
+# ==========================================
+# HTML 파서 백엔드 비교 (파싱 시간 / 추출 시간 / 추출 결과 일치 여부)
+# ==========================================
+# - 실제 추출 함수(main.parse_job_urls, main.parse_job_detail, main.parse_google_news,
+#   collector.parse_listing_page, main_private.parse_private_detail)를 백엔드만 바꿔 실행
+# - 결과가 html.parser 와 같은지 표본마다 비교 (달라지면 '불일치' 로 표시)
+# - 표본: benchmarks/samples/<종류>/*  (--record 로 실제 사이트에서 저장)
+#   표본 폴더가 없으면 jobs_html / jobs_private_html 의 본문과 합성 목록·RSS 로 대신함
+#
+# 사용법: python benchmarks/bench_html_parser.py [--record] [--rounds 3]
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "samples")
+KINDS = ["alio_list", "alio_detail", "incruit_list", "incruit_detail", "news_rss"]
+
+# ------------------------------------------
+# 표본 준비
+# ------------------------------------------
+def record_samples(n_pages=3):
+    from http_client import HttpClient
+    client = HttpClient()
+    targets = {
+        "alio_list": [f"https://job.alio.go.kr/recruit.do?pageNo={p}" for p in range(1, n_pages + 1)],
+        "incruit_list": [f"{collector.TARGET_URLS[0]}&page={p}" for p in range(1, n_pages + 1)],
+        "news_rss": [f"https://news.google.com/rss/search?q={q}&hl=ko&gl=KR&ceid=KR:ko" for q in ["%ED%95%9C%EA%B5%AD%EC%A0%84%EB%A0%A5", "%EC%82%BC%EC%84%B1"]],
+    }
+    alio_list = client.get(targets["alio_list"][0], headers=main.HEADERS).text
+    targets["alio_detail"] = main.parse_job_urls(alio_list)[:n_pages]
+    incruit_jobs = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        collector.parse_listing_page(collector.fetch_listing_page(targets["incruit_list"][0]), incruit_jobs, set())
+    targets["incruit_detail"] = [job["link"] for job in incruit_jobs[:n_pages]]
+
+    for kind, urls in targets.items():
+        os.makedirs(os.path.join(SAMPLES_DIR, kind), exist_ok=True)
+        for i, url in enumerate(urls):
+            res = client.get(url, headers=collector.HEADERS)
+            with open(os.path.join(SAMPLES_DIR, kind, f"{i:02d}.html"), "wb") as f: f.write(res.content)
+            print(f"💾 {kind}/{i:02d}.html ← {url} ({len(res.content) // 1024} KB)")
+
+def load_samples():
+    samples = {}
+    for kind in KINDS:
+        paths = sorted(glob.glob(os.path.join(SAMPLES_DIR, kind, "*")))
+        samples[kind] = [open(p, "rb").read() for p in paths]
+    if all(samples.values()): return samples, "benchmarks/samples"
+
+    # 저장된 표본이 없으면: 상세 = 생성된 페이지에 들어 있는 원문 본문, 목록·RSS = 합성
+    print("ℹ️ benchmarks/samples 가 없어 생성 페이지 본문 + 합성 목록/RSS 로 측정합니다 (--record 로 실제 표본 저장)")
+    def detail_pages(folder, selector):
+        pages = []
+        for path in sorted(glob.glob(os.path.join(ROOT, folder, "*.html"))):
+            with open(path, "rb") as f:
+                soup = html_parser.make_soup(f.read(), parser="html.parser", from_encoding="utf-8")
+            title = soup.select_one(".job-title")
+            info = soup.select_one(".job-title + div")
+            body = soup.select_one(selector) or soup.select_one(".content-body")
+            org = info.strong.text if info and info.strong else ""
+            pages.append((
+                f'<html><body><div class="topInfo"><h2>{org}</h2></div><h2 class="titleH2">{title.text if title else ""}</h2>'
+                f'<table><tr><td>{info.text if info else ""}</td></tr></table>{body}</body></html>'
+            ).encode("utf-8"))
+        return pages
+
+    return {
+        "alio_list": [synthetic.make_alio_listing(page=p).encode("utf-8") for p in range(1, 6)],
+        "alio_detail": detail_pages("jobs_html", "#tab-1"),
+        "incruit_list": [synthetic.make_incruit_listing(seed=s).encode("utf-8") for s in range(5)],
+        "incruit_detail": detail_pages("jobs_private_html", ".job_view_box"),
+        "news_rss": [synthetic.make_news_rss(q) for q in synthetic.ORGS],
+    }, "생성 페이지 + 합성"
+
+# ------------------------------------------
+# 추출 함수 (운영 코드 그대로)
+# ------------------------------------------
+def extract(kind, raw):
+    if kind == "alio_list":
+        return main.parse_job_urls(raw.decode("utf-8", "replace"))
+    if kind == "alio_detail":
+        return main.parse_job_detail(raw, "https://job.alio.go.kr/recruitview.do?idx=1", "1")
+    if kind == "incruit_list":
+        jobs = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            collector.parse_listing_page(raw.decode("utf-8", "replace"), jobs, set())
+        return jobs
+    if kind == "incruit_detail":
+        return main_private.parse_private_detail(raw.decode("utf-8", "replace"), {"title": "제목", "company": "회사"})
+    if kind == "news_rss":
+        return main.parse_google_news(raw)
+
+class ForcedParser:
+    # 각 모듈의 make_soup 을 바꿔 끼워 지정 백엔드로만 파싱하고, 파싱 시간만 따로 잼
+    def __init__(self, parser):
+        self.parser = parser
+        self.parse_seconds = 0.0
+
+    def __call__(self, markup, keep_markup=False, from_encoding=None, parser=None, parse_only=None):
+        start = time.perf_counter()
+        soup = html_parser.make_soup(markup, from_encoding=from_encoding, parser=self.parser, parse_only=parse_only)
+        self.parse_seconds += time.perf_counter() - start
+        return soup
+
+def run(kind, pages, parser, rounds):
+    forced = ForcedParser(parser)
+    originals = {m: m.make_soup for m in (main, collector, main_private)}
+    for module in originals: module.make_soup = forced
+    try:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            results = [extract(kind, raw) for raw in pages]
+        total = time.perf_counter() - start
+    finally:
+        for module, fn in originals.items(): module.make_soup = fn
+    n = rounds * len(pages)
+    return results, forced.parse_seconds / n * 1000, (total - forced.parse_seconds) / n * 1000
+
+def main_bench():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--record", action="store_true", help="실제 사이트에서 표본 페이지 저장 (네트워크 필요)")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.record: record_samples()
+    samples, source = load_samples()
+    backends = html_parser.available_parsers()
+    print(f"표본: {source} / 백엔드: {', '.join(backends)} / 기본 선택: 목록·RSS={html_parser.FAST_PARSER}, 상세=html.parser")
+    print(f"{'종류':<16}{'표본':>5}  {'백엔드':<12}{'파싱 ms':>10}{'추출 ms':>10}  결과")
+
+    for kind in KINDS:
+        pages = samples[kind]
+        if not pages: continue
+        baseline = None
+        for backend in [html_parser.SAFE_PARSER] + [b for b in backends if b != html_parser.SAFE_PARSER]:
+            results, parse_ms, select_ms = run(kind, pages, backend, args.rounds)
+            if baseline is None:
+                baseline, verdict = results, "기준"
+            else:
+                same = sum(a == b for a, b in zip(baseline, results))
+                verdict = "일치" if same == len(pages) else f"불일치 {len(pages) - same}/{len(pages)}"
+            print(f"{kind:<16}{len(pages):>5}  {backend:<12}{parse_ms:>10.2f}{select_ms:>10.2f}  {verdict}")
+
+if __name__ == "__main__":
+    main_bench()
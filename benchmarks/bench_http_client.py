@@ -0,0 +1,108 @@
+import argparse
+import http.server
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from http_client import HttpClient
+
+# ==========================================
+# 공용 HTTP 클라이언트 연결 재사용 효과 측정 (로컬 가짜 서버, 네트워크 불필요)
+# ==========================================
+# - 기존 방식: 요청마다 requests.get → 매번 새 연결 (TCP + TLS 핸드셰이크)
+# - 새 방식:   HttpClient().get → 호스트별 연결 풀에서 keep-alive 연결 재사용
+# - 서버가 새 연결을 받을 때 --connect-delay ms 만큼 지연 → 실제 사이트까지의 왕복 시간 흉내
+#
+# 사용법: python benchmarks/bench_http_client.py [--requests 100] [--tls] [--connect-delay 30]
+
+BODY = ("<html><body>" + "<a href='/recruitview.do?idx=1'>공고</a>" * 200 + "</body></html>").encode("utf-8")
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+    disable_nagle_algorithm = True  # 실제 웹 서버처럼 TCP_NODELAY (헤더/본문 분할 전송 시 40ms 지연 방지)
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+class StubServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, connect_delay, ssl_context=None):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.connect_delay = connect_delay
+        self.ssl_context = ssl_context
+        self.connections = 0
+
+    def get_request(self):
+        sock, addr = super().get_request()
+        self.connections += 1
+        time.sleep(self.connect_delay)  # 새 연결 1회당 왕복 지연
+        if self.ssl_context:
+            sock = self.ssl_context.wrap_socket(sock, server_side=True)
+        return sock, addr
+
+def make_cert(tmpdir):
+    cert, key = os.path.join(tmpdir, "cert.pem"), os.path.join(tmpdir, "key.pem")
+    subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+                    "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1",
+                    "-keyout", key, "-out", cert], check=True, capture_output=True)
+    return cert, key
+
+def run(label, server, url, fetch, n):
+    server.connections = 0
+    start = time.perf_counter()
+    total_bytes = 0
+    for _ in range(n):
+        total_bytes += len(fetch(url).content)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<22} {elapsed:7.2f}s  요청당 {elapsed / n * 1000:6.1f}ms  새 연결 {server.connections:4d}개  ({total_bytes // 1024} KB)")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--connect-delay", type=float, default=30, help="새 연결마다 추가되는 지연 (ms)")
+    parser.add_argument("--tls", action="store_true", help="자체 서명 인증서로 HTTPS 서버 사용 (openssl 필요)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ssl_context, verify = None, True
+        if args.tls:
+            cert, key = make_cert(tmpdir)
+            ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            ssl_context.load_cert_chain(cert, key)
+            verify = cert
+
+        server = StubServer(args.connect_delay / 1000, ssl_context)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"{'https' if args.tls else 'http'}://127.0.0.1:{server.server_port}/recruit.do"
+
+        print(f"요청 {args.requests}건, 새 연결 지연 {args.connect_delay:.0f}ms, {'HTTPS' if args.tls else 'HTTP'}")
+        cold = run("requests.get (매번 연결)", server, url,
+                   lambda u: requests.get(u, timeout=10, verify=verify), args.requests)
+
+        client = HttpClient()
+        pooled = run("HttpClient (keep-alive)", server, url,
+                     lambda u: client.get(u, timeout=10, verify=verify), args.requests)
+
+        print(f"→ {cold / pooled:.1f}배 빠름")
+        client.report("bench")
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
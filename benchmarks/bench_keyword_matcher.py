@@ -0,0 +1,84 @@
+import glob
+import html
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from keyword_matcher import KeywordMatcher
+
+# ==========================================
+# 키워드 매칭 마이크로 벤치마크 (jobs_html 실제 공고 본문 사용)
+# ==========================================
+# 기존 방식 any(k in text ...) / [k for k in keywords if k in text] 과
+# KeywordMatcher.any_in() / found() / find_all()(한 번 훑기, 위치 포함) 을 사전 크기(현재 14개 → 1,000개)별로 비교합니다.
+# found() 는 사전이 SINGLE_PASS_MIN 개 이상일 때만 한 번 훑기를 씀
+# 사용법: python benchmarks/bench_keyword_matcher.py
+
+BASE_KEYWORDS = ["소통", "협력", "도전", "책임", "분석", "성실", "윤리", "고객", "안전", "혁신", "창의", "전문성", "리더십", "글로벌"]
+
+def load_posting_texts():
+    texts = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "jobs_html", "*.html")) + glob.glob(os.path.join(ROOT, "jobs_private_html", "*.html"))):
+        with open(path, encoding="utf-8") as f: page = f.read()
+        body = page.split('class="content-body">', 1)[-1].split('<div style="margin-top:50px', 1)[0]
+        texts.append(html.unescape(re.sub(r"<[^>]+>", " ", body)))
+    return texts
+
+def grow_dictionary(texts, size):
+    # 본문에 실제로 나오는 2~4글자 한글 단어로 사전을 키움 (일부는 없는 단어)
+    words = []
+    for word in re.findall(r"[가-힣]{2,4}", " ".join(texts)):
+        if word not in words: words.append(word)
+    extra = [w for w in words if w not in BASE_KEYWORDS][: max(0, size - len(BASE_KEYWORDS)) // 2]
+    missing = [w + "뷁" for w in extra]
+    return (BASE_KEYWORDS + extra + missing)[:size]
+
+def bench(fn, texts, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts: fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best / len(texts) * 1e6  # 문서당 µs
+
+def naive_positions(keywords, text):
+    # 키워드마다 str.find 반복 → 모든 (시작 위치, 키워드), 겹치는 것 포함
+    hits = []
+    for k in keywords:
+        pos = text.find(k)
+        while pos >= 0:
+            hits.append((pos, k))
+            pos = text.find(k, pos + 1)
+    return sorted(hits)
+
+def main():
+    texts = load_posting_texts()
+    if not texts:
+        print("❌ jobs_html / jobs_private_html 에 공고 파일이 없습니다."); return
+    avg_len = sum(map(len, texts)) // len(texts)
+    print(f"📄 공고 {len(texts)}건 (평균 {avg_len:,}자)")
+    print(f"   {'사전 크기':>8} {'any 기존(µs)':>13} {'any_in(µs)':>11} {'found 기존(µs)':>15} {'found(µs)':>10} {'위치 기존(µs)':>14} {'find_all(µs)':>13} {'컴파일(ms)':>11}")
+
+    for size in [14, 50, 100, 300, 1000]:
+        keywords = grow_dictionary(texts, size)
+        start = time.perf_counter()
+        matcher = KeywordMatcher(keywords)
+        compile_ms = (time.perf_counter() - start) * 1000
+        for text in texts:
+            assert matcher.any_in(text) == any(k in text for k in keywords)
+            assert matcher.found(text) == [k for k in matcher.keywords if k in text]
+            assert sorted(matcher.find_all(text)) == naive_positions(keywords, text)
+        any_naive = bench(lambda t: any(k in t for k in keywords), texts)
+        any_fast = bench(matcher.any_in, texts)
+        found_naive = bench(lambda t: [k for k in keywords if k in t], texts)
+        found_fast = bench(matcher.found, texts)
+        pos_naive = bench(lambda t: naive_positions(keywords, t), texts)
+        pos_fast = bench(matcher.find_all, texts)
+        print(f"   {len(keywords):>8} {any_naive:>13.2f} {any_fast:>11.2f} {found_naive:>15.1f} {found_fast:>10.1f} {pos_naive:>14.1f} {pos_fast:>13.1f} {compile_ms:>11.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_html_parser import load_samples  # 표본 로딩 / 경고 필터 / 경로 설정 공유
+
+import collector
+import html_parser
+import main
+
+# ==========================================
+# 목록 페이지 부분 파싱(SoupStrainer) 효과 측정
+# ==========================================
+# - 전체 트리: 기존처럼 문서 전체를 파싱한 뒤 find_all / select
+# - 부분 파싱: main.parse_job_urls / collector.parse_listing_page (필요한 요소만 트리로 만듦)
+# - 페이지당 CPU 시간과 tracemalloc 최대 메모리, 추출 결과 일치 여부 출력
+#
+# 사용법: python benchmarks/bench_listing_strainer.py [--rounds 20]
+#   (실제 표본은 python benchmarks/bench_html_parser.py --record 로 저장)
+
+def alio_full(html, parser):
+    soup = html_parser.make_soup(html, parser=parser)
+    urls = []
+    for link in soup.find_all('a', href=True):
+        if 'recruitview.do' in link['href'] and 'idx=' in link['href']:
+            urls.append(link['href'] if link['href'].startswith("http") else "https://job.alio.go.kr" + link['href'])
+    return urls
+
+def with_parser(module, parser, fn):
+    original = module.make_soup
+    module.make_soup = lambda markup, parse_only=None, **kw: html_parser.make_soup(markup, parser=parser, parse_only=parse_only)
+    try:
+        return fn()
+    finally:
+        module.make_soup = original
+
+def alio_strained(html, parser):
+    return with_parser(main, parser, lambda: main.parse_job_urls(html))
+
+def incruit_strained(html, parser):
+    jobs = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        with_parser(collector, parser, lambda: collector.parse_listing_page(html, jobs, set()))
+    return jobs
+
+def incruit_full(html, parser):
+    # 부분 파싱 이전처럼 전체 트리로 만든 뒤 운영 코드와 같은 항목 해석
+    jobs = []
+    original = collector.make_soup
+    collector.make_soup = lambda markup, parse_only=None, **kw: html_parser.make_soup(markup, parser=parser)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            collector.parse_listing_page(html, jobs, set())
+    finally:
+        collector.make_soup = original
+    return jobs
+
+def measure(fn, pages, parser, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for html in pages: fn(html, parser)
+    cpu_ms = (time.perf_counter() - start) / (rounds * len(pages)) * 1000
+
+    peak = 0
+    for html in pages:
+        tracemalloc.start()
+        fn(html, parser)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return cpu_ms, peak / 1024
+
+def main_bench():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    samples, source = load_samples()
+    pages = {
+        "alio_list": [raw.decode("utf-8", "replace") for raw in samples["alio_list"]],
+        "incruit_list": [raw.decode("utf-8", "replace") for raw in samples["incruit_list"]],
+    }
+    cases = {
+        "alio_list": (alio_full, alio_strained),
+        "incruit_list": (incruit_full, incruit_strained),
+    }
+
+    print(f"표본: {source}")
+    print(f"{'종류':<14}{'백엔드':<13}{'전체 ms':>9}{'부분 ms':>9}{'전체 KB':>10}{'부분 KB':>10}  결과")
+    for kind, (full_fn, strained_fn) in cases.items():
+        for backend in html_parser.available_parsers():
+            full_ms, full_kb = measure(full_fn, pages[kind], backend, args.rounds)
+            part_ms, part_kb = measure(strained_fn, pages[kind], backend, args.rounds)
+            same = all(full_fn(h, backend) == strained_fn(h, backend) for h in pages[kind])
+            print(f"{kind:<14}{backend:<13}{full_ms:>9.2f}{part_ms:>9.2f}{full_kb:>10.0f}{part_kb:>10.0f}  {'일치' if same else '불일치'}")
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,54 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from db_index import SubstringIndex
+from synthetic import make_essays
+
+# ==========================================
+# search_db 벤치마크: 선형 스캔 vs 부분 문자열 색인
+# ==========================================
+# 사용법: python benchmarks/bench_search_db.py --sizes 10000 100000 1000000
+
+QUERIES = ["저는", "소통", "리더십", "문제해결", "갈등 조율", "협", "없는단어"]
+
+def linear_search(data, keyword):
+    return [item for item in data if keyword in item]
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def run(size, repeat):
+    data = make_essays(size)
+    start = time.perf_counter()
+    index = SubstringIndex(data)
+    build_sec = time.perf_counter() - start
+    print(f"\n📦 {size:,}건 (색인 생성 {build_sec:.2f}초)")
+    # 선형 = 기존 리스트 컴프리헨션, 전체 = index.search(), 추출 = search_db 가 쓰는 index.sample()
+    print(f"   {'검색어':<10} {'결과수':>9} {'선형(ms)':>10} {'전체(ms)':>10} {'추출(ms)':>10}")
+
+    rng = random.Random(0)
+    for q in QUERIES:
+        t_linear, expected = timed(lambda: linear_search(data, q), repeat)
+        t_index, got = timed(lambda: index.search(q), repeat)
+        t_sample, picked = timed(lambda: index.sample(q, rng), repeat)
+        assert got == expected, f"결과 불일치: {q}"
+        assert (picked in expected) if expected else picked is None
+        print(f"   {q:<10} {len(got):>9,} {t_linear * 1000:>10.3f} {t_index * 1000:>10.3f} {t_sample * 1000:>10.4f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size, args.repeat)
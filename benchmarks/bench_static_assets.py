@@ -0,0 +1,79 @@
+import argparse
+import glob
+import gzip
+import os
+import re
+import statistics
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import main
+import main_private
+from static_assets import inline_json
+
+# ==========================================
+# 공용 CSS/JS 정적 파일 분리 효과 측정 (사이트 전체 크기 / 페이지당 전송량)
+# ==========================================
+# - 전: 저장소에 있는 생성 페이지 그대로 (<style> / <script> 를 페이지마다 포함)
+# - 후: 같은 페이지에서 인라인 <style> / <script> 를 static/ 링크 + 페이지 데이터 JSON 으로 바꾼 것
+#       + 공용 CSS/JS 파일 1벌 (main.JOB_CSS / JOB_JS, main_private.JOB_CSS / JOB_JS)
+# - 페이지당 전송량: 첫 방문 = 페이지 + CSS + JS, 재방문(다른 공고) = 페이지만 (CSS/JS 는 브라우저 캐시)
+# - 원본 바이트와 gzip 바이트를 함께 출력
+#
+# 사용법: python benchmarks/bench_static_assets.py
+
+STYLE_RE = re.compile(r'\s*<style>.*?</style>', re.S)
+SCRIPT_RE = re.compile(r'\s*<script>(?:(?!<script>).)*?</script>(?=\s*</body>)', re.S)
+ORG_RE = re.compile(r'기관명: <strong>(.*?)</strong>')
+LINK = '\n    <link rel="stylesheet" href="static/job.0123456789.css">'
+SCRIPTS = '\n    <script id="page-data" type="application/json">{}</script>\n    <script src="static/job.0123456789.js"></script>'
+
+def gz_size(text):
+    return len(gzip.compress(text.encode("utf-8"), mtime=0))
+
+def convert(html, org_name):
+    page_data = inline_json({"org_name": org_name, "consult_link": main.MY_CONSULTING_LINK, "render_server_url": main.RENDER_SERVER_URL})
+    html = STYLE_RE.sub(lambda m: LINK, html, count=1)
+    return SCRIPT_RE.sub(lambda m: SCRIPTS.format(page_data), html, count=1)
+
+def measure(folder, module):
+    before, after = [], []
+    for path in sorted(glob.glob(os.path.join(ROOT, folder, "*.html"))):
+        with open(path, "r", encoding="utf-8") as f: html = f.read()
+        if "<style>" not in html: continue  # 이미 정적 파일을 쓰는 페이지
+        org = ORG_RE.search(html)
+        before.append(html)
+        after.append(convert(html, org.group(1) if org else ""))
+    assets = [module.JOB_CSS, module.JOB_JS]
+    return before, after, assets
+
+def report(label, before, after, assets):
+    if not before:
+        print(f"{label}: 비교할 (인라인 방식) 페이지가 없습니다")
+        return
+    n = len(before)
+    asset_raw = sum(len(a.encode("utf-8")) for a in assets)
+    asset_gz = sum(gz_size(a) for a in assets)
+    b_raw = [len(h.encode("utf-8")) for h in before]
+    a_raw = [len(h.encode("utf-8")) for h in after]
+    b_gz = [gz_size(h) for h in before]
+    a_gz = [gz_size(h) for h in after]
+
+    kb = lambda x: f"{x / 1024:,.1f}KB"
+    print(f"[{label}] 페이지 {n}개 · 공용 CSS+JS {kb(asset_raw)} (gzip {kb(asset_gz)})")
+    print(f"  사이트 전체        전 {kb(sum(b_raw)):>11}  후 {kb(sum(a_raw) + asset_raw):>11}"
+          f"   | gzip 전 {kb(sum(b_gz)):>10}  후 {kb(sum(a_gz) + asset_gz):>10}")
+    print(f"  페이지당 (중앙값)  전 {kb(statistics.median(b_raw)):>11}  후 {kb(statistics.median(a_raw)):>11}"
+          f"   | gzip 전 {kb(statistics.median(b_gz)):>10}  후 {kb(statistics.median(a_gz)):>10}   (재방문)")
+    print(f"  첫 방문 (중앙값)   전 {kb(statistics.median(b_raw)):>11}  후 {kb(statistics.median(a_raw) + asset_raw):>11}"
+          f"   | gzip 전 {kb(statistics.median(b_gz)):>10}  후 {kb(statistics.median(a_gz) + asset_gz):>10}   (페이지 + CSS + JS)")
+
+def main_bench():
+    argparse.ArgumentParser().parse_args()
+    report("jobs_html", *measure("jobs_html", main))
+    report("jobs_private_html", *measure("jobs_private_html", main_private))
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,245 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app
+import main
+import main_private
+import synthetic
+from static_assets import inline_json
+from tfidf_index import TfidfIndex, available as tfidf_available
+
+# ==========================================
+# 벤치마크 묶음: 주요 경로를 합성 데이터 규모별로 측정 → JSON 결과 파일
+# ==========================================
+# - app.py:       load_database / search_db / classify_intent
+#                 TF-IDF 색인 생성 / retrieve_evidence (numpy/scipy 가 설치된 경우만)
+# - main.py, main_private.py:
+#                 extract_keywords_from_text / JOB_TEMPLATE.format 렌더링 / export_db_to_js /
+#                 목록 페이지(create_list_page) / 사이트맵(create_sitemap)
+# - 규모(--scales, 기본 100 / 10,000 / 100,000) = 자소서 건수 또는 페이지 수
+#   · 건별 작업(키워드 추출, 렌더링, 의도 분류, 검색)은 규모와 관계없이 최대 --max-items 건만 재고
+#     결과에 실제 측정 건수(n)와 건당 시간(per_op_us)을 함께 기록
+# - 모든 파일 쓰기는 임시 폴더 안에서만 (저장소의 db*.json / jobs_html 등은 건드리지 않음)
+# - 결과: benchmarks/results/suite-<시각>.json (--output 으로 변경)
+#   --compare 이전결과.json 을 주면 항목별 배율(이번 / 이전)을 함께 출력
+#
+# 사용법: python benchmarks/bench_suite.py [--scales 100 10000 100000] [--repeat 3]
+#                                          [--only search_db export_db_to_js ...] [--compare 이전.json]
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+DEFAULT_SCALES = [100, 10_000, 100_000]
+SEARCH_QUERIES = ["저는", "소통", "리더십", "문제해결", "갈등 조율", "협", "없는단어"]
+RETRIEVE_QUERIES = 500  # 질문 전체 검색은 건당 비용이 커서 질문 수를 따로 제한
+
+@contextlib.contextmanager
+def quiet():
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+@contextlib.contextmanager
+def workdir(path):
+    # load_database / export_db_to_js / 목록·사이트맵은 현재 폴더 기준으로 읽고 씀
+    old = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(old)
+
+def timed(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+# ------------------------------------------
+# 측정 항목: (준비된 데이터) → 실행할 함수와 작업 수
+# ------------------------------------------
+def write_db(essays):
+    half = len(essays) // 2
+    for name, part in (("db1.json", essays[:half]), ("db2.json", essays[half:])):
+        with open(name, "w", encoding="utf-8") as f: json.dump(part, f, ensure_ascii=False)
+
+def render_kwargs(module, detail, keywords):
+    chips = "".join(f'<span class="keyword-chip" onclick="searchDB(\'{kw}\')">#{kw}</span>' for kw in keywords)
+    return dict(
+        org_name=detail["org_name"], title=detail["title"], end_date=detail["end_date"], content=detail["content"],
+        consult_link=module.MY_CONSULTING_LINK, home_link=module.MY_HOME_LINK, original_url=detail["url"],
+        keyword_chips=chips, job_id=detail["job_id"], news_area="", css_file="static/job.css", js_file="static/job.js",
+        page_data=inline_json({"org_name": detail["org_name"], "consult_link": module.MY_CONSULTING_LINK,
+                               "render_server_url": module.RENDER_SERVER_URL}),
+    )
+
+def case_load_database(ctx):
+    return lambda: app.load_database(), ctx["scale"]
+
+def case_search_db(ctx):
+    if len(app.ALL_DB_DATA) != ctx["scale"]: app.load_database()
+    queries = [SEARCH_QUERIES[i % len(SEARCH_QUERIES)] for i in range(ctx["items"])]
+    return lambda: [app.search_db(q) for q in queries], len(queries)
+
+def case_tfidf_build(ctx):
+    if len(app.ALL_DB_DATA) != ctx["scale"]: app.load_database()
+    return lambda: TfidfIndex.build(app.ALL_DB_DATA), ctx["scale"]
+
+def case_retrieve_evidence(ctx):
+    if len(app.ALL_DB_DATA) != ctx["scale"]: app.load_database()
+    inputs = synthetic.make_chat_inputs(min(ctx["items"], RETRIEVE_QUERIES))
+    return lambda: [app.retrieve_evidence(text) for text in inputs], len(inputs)
+
+def case_classify_intent(ctx):
+    inputs = synthetic.make_chat_inputs(ctx["items"])
+    return lambda: [app.classify_intent(text) for text in inputs], len(inputs)
+
+def case_extract_keywords(module):
+    def case(ctx):
+        texts = [d["content_text"] for d in ctx["details"]]
+        return lambda: [module.extract_keywords_from_text(t) for t in texts], len(texts)
+    return case
+
+def case_render(module):
+    def case(ctx):
+        jobs = [render_kwargs(module, d, module.extract_keywords_from_text(d["content_text"])) for d in ctx["details"]]
+        return lambda: [module.JOB_TEMPLATE.format(**kw) for kw in jobs], len(jobs)
+    return case
+
+def case_export(module):
+    def case(ctx):
+        module.SAVE_DIR = os.path.join(ctx["tmp"], f"out_{module.__name__}")
+        return lambda: module.export_db_to_js(), ctx["scale"]
+    return case
+
+def case_list_page(module):
+    def case(ctx):
+        return lambda: module.create_list_page(ctx["pages"]), ctx["scale"]
+    return case
+
+def case_sitemap(module):
+    def case(ctx):
+        return lambda: module.create_sitemap(ctx["pages"]), ctx["scale"]
+    return case
+
+CASES = {
+    "app.load_database": case_load_database,
+    "app.search_db": case_search_db,
+    "app.classify_intent": case_classify_intent,
+    "main.extract_keywords_from_text": case_extract_keywords(main),
+    "main_private.extract_keywords_from_text": case_extract_keywords(main_private),
+    "main.JOB_TEMPLATE.format": case_render(main),
+    "main_private.JOB_TEMPLATE.format": case_render(main_private),
+    "main.export_db_to_js": case_export(main),
+    "main_private.export_db_to_js": case_export(main_private),
+    "main.create_list_page": case_list_page(main),
+    "main_private.create_list_page": case_list_page(main_private),
+    "main.create_sitemap": case_sitemap(main),
+    "main_private.create_sitemap": case_sitemap(main_private),
+}
+if tfidf_available():
+    CASES["app.tfidf_build"] = case_tfidf_build
+    CASES["app.retrieve_evidence"] = case_retrieve_evidence
+
+# ------------------------------------------
+# 실행 / 결과 파일
+# ------------------------------------------
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def run_scale(scale, names, repeat, max_items):
+    items = min(scale, max_items)
+    results = []
+    tmp = tempfile.mkdtemp(prefix="bench_suite_")
+    saved_dirs = (main.SAVE_DIR, main_private.SAVE_DIR, app.DATA_DIR, app.TFIDF_CACHE_FILE)
+    # 합성 DB 의 TF-IDF 색인 저장본도 임시 폴더에 (실제 data/db_tfidf.npz 를 덮어쓰지 않도록)
+    app.DATA_DIR, app.TFIDF_CACHE_FILE = os.path.join(tmp, "data"), None
+    try:
+        with workdir(tmp):
+            write_db(synthetic.make_essays(scale))
+            ctx = {
+                "scale": scale, "items": items, "tmp": tmp,
+                "details": synthetic.make_job_details(items),
+                "pages": synthetic.make_manifest_pages(scale),
+            }
+            for name in names:
+                with quiet():
+                    fn, n = CASES[name](ctx)
+                    fn()  # 준비 실행 (색인/캐시/파일 생성 등 첫 실행 비용 제외)
+                    times = timed(fn, repeat)
+                best = min(times)
+                result = {
+                    "name": name, "scale": scale, "n": n, "repeat": repeat,
+                    "best_s": round(best, 6), "mean_s": round(statistics.mean(times), 6),
+                    "per_op_us": round(best / n * 1e6, 3) if n else None,
+                }
+                results.append(result)
+                print(f"  {name:<42}{scale:>9,}{n:>9,}{best * 1000:>12.2f}{result['per_op_us']:>12.2f}")
+    finally:
+        main.SAVE_DIR, main_private.SAVE_DIR, app.DATA_DIR, app.TFIDF_CACHE_FILE = saved_dirs
+        shutil.rmtree(tmp, ignore_errors=True)
+    return results
+
+def compare(results, previous_path):
+    with open(previous_path, "r", encoding="utf-8") as f:
+        previous = {(r["name"], r["scale"]): r for r in json.load(f)["results"]}
+    print(f"\n📊 이전 결과와 비교: {previous_path} (배율 = 이번 / 이전, 1 보다 작으면 빨라짐)")
+    for r in results:
+        old = previous.get((r["name"], r["scale"]))
+        if old and old["best_s"]:
+            print(f"  {r['name']:<42}{r['scale']:>9,}{r['best_s'] / old['best_s']:>9.2f}x")
+
+def main_bench():
+    parser = argparse.ArgumentParser(description="주요 경로 벤치마크 묶음 (합성 데이터)")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-items", type=int, default=10_000, help="건별 작업을 잴 최대 건수")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="이름에 이 문자열이 들어간 항목만 실행")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/suite-<시각>.json)")
+    parser.add_argument("--compare", metavar="JSON", help="비교할 이전 결과 파일")
+    args = parser.parse_args()
+
+    names = [n for n in CASES if not args.only or any(key in n for key in args.only)]
+    random.seed(0)  # search_db 의 무작위 추출 고정
+    print(f"  {'항목':<42}{'규모':>9}{'작업 수':>9}{'최선(ms)':>12}{'건당(us)':>12}")
+    results = []
+    for scale in args.scales:
+        results += run_scale(scale, names, args.repeat, args.max_items)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"suite-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "meta": {
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "git_commit": git_commit(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "scales": args.scales, "repeat": args.repeat, "max_items": args.max_items,
+            },
+            "results": results,
+        }, f, ensure_ascii=False, indent=1)
+    print(f"\n💾 결과 저장: {output}")
+    if args.compare: compare(results, args.compare)
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,70 @@
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from web_search import WebSearch, SearchUnavailable
+
+# ==========================================
+# 웹 검색 계층 점검 (로컬 가짜 검색 백엔드 사용, 네트워크 불필요)
+# ==========================================
+# 사용법: python benchmarks/bench_web_search.py
+
+class FakeSearchBackend:
+    # latency 초 후 응답, fail=True 이면 (timeout 처럼) latency 후 예외
+    def __init__(self, latency=0.5):
+        self.latency = latency
+        self.fail = False
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, query, max_results):
+        with self.lock: self.calls += 1
+        time.sleep(self.latency)
+        if self.fail: raise TimeoutError("가짜 검색 서버 타임아웃")
+        return [{"title": f"{query} 결과 {i}", "body": "내용"} for i in range(max_results)]
+
+def timed(fn):
+    start = time.perf_counter()
+    try:
+        result = fn()
+    except SearchUnavailable as e:
+        result = e
+    return result, (time.perf_counter() - start) * 1000
+
+def main():
+    backend = FakeSearchBackend(latency=0.5)
+    search = WebSearch(backend=backend, ttl=1, stale_ttl=3600, failure_threshold=2, reset_timeout=30)
+
+    # 1) 동시 동일 검색 50건 → 백엔드 호출 1회
+    with ThreadPoolExecutor(max_workers=50) as pool:
+        start = time.perf_counter()
+        list(pool.map(lambda _: search.search("연봉"), range(50)))
+        wall = (time.perf_counter() - start) * 1000
+    print(f"1) 동시 50건: 백엔드 호출 {backend.calls}회, {wall:.0f}ms")
+
+    # 2) 캐시 적중
+    _, ms = timed(lambda: search.search(" 연봉 "))
+    print(f"2) 캐시 적중: {ms:.3f}ms (백엔드 호출 {backend.calls}회)")
+
+    # 3) TTL 만료 + 백엔드 장애 → 실패할 때마다 지연 후 stale, 2회 실패하면 회로 열림
+    time.sleep(1.1)
+    backend.fail = True
+    for i in range(2):
+        result, ms = timed(lambda: search.search("연봉"))
+        print(f"3-{i + 1}) 장애 중 검색: {ms:.0f}ms, stale 결과 {len(result)}건, 회로 {search.breaker.state}")
+
+    # 4) 회로 열림 → 백엔드를 부르지 않고 즉시 stale 응답 / 캐시 없는 검색어는 즉시 실패
+    calls_before = backend.calls
+    result, ms = timed(lambda: search.search("연봉"))
+    print(f"4) 회로 열림: {ms:.3f}ms, stale 결과 {len(result)}건, 추가 백엔드 호출 {backend.calls - calls_before}회")
+    result, ms = timed(lambda: search.search("처음 보는 검색어"))
+    print(f"   캐시 없음: {ms:.3f}ms → {type(result).__name__}: {result}")
+
+    print(f"\n📊 {search.stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+import argparse
+import glob
+import hashlib
+import http.server
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+
+import requests
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# ==========================================
+# 크롤링 녹화 / 오프라인 재생 하네스 (전체 일일 파이프라인 처리량 측정)
+# ==========================================
+# - 로컬 스텁 HTTP 서버를 띄우고 CRAWL_STUB_URL 환경변수로 collector.py → main.py → main_private.py 의
+#   모든 요청(job.alio.go.kr / job.incruit.com / news.google.com)을 그 서버로 보냄 (http_client.route)
+#   · record: 스텁이 실제 사이트에 대신 요청하고 200 응답을 fixture 보관소에 저장 (네트워크 필요)
+#   · replay: 보관소에 있는 응답만 돌려줌 (없는 주소는 404) → 네트워크 없이 같은 입력으로 반복 실행
+# - 재생 시 응답마다 지연(--latency-ms, --jitter-ms)과 오류 주입(--error-rate: 503, --reset-rate: 연결 끊기)
+# - 파이프라인은 임시 작업 폴더(저장소의 *.py 복사본)에서 실행 → 저장소의 jobs_html 등은 건드리지 않음
+#   --workdir 를 주면 그 폴더를 계속 써서 두 번째 실행(증분 모드) 처리량도 잴 수 있음
+# - 단계별 실행 시간 / 요청 수 / 바이트 / 호스트별 건수 / 주입한 오류 / 보관소에 없던 주소 수 출력
+#   (--output 으로 JSON 저장)
+# - 단계별 상세/뉴스 요청 수가 상한(목표 페이지 수 + 대기열 크기)을 넘으면 실패 처리
+#   → 목표를 채운 뒤에도 쓰지 않을 요청을 미리 보내는 회귀를 잡음
+#
+# 사용법:
+#   python benchmarks/crawl_replay.py record [--fixtures benchmarks/fixtures/crawl]
+#   python benchmarks/crawl_replay.py replay [--latency-ms 80 --jitter-ms 40 --error-rate 0.02] [--output r.json]
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "crawl")
+STAGES = [
+    ("collector", ["collector.py", "--seed", "0"]),
+    ("main", ["main.py"]),
+    ("main_private", ["main_private.py"]),
+]
+
+# ------------------------------------------
+# fixture 보관소: index.json (주소 → 상태/형식/본문 파일) + bodies/<sha1>
+# ------------------------------------------
+class FixtureArchive:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = {}
+        index_path = os.path.join(path, "index.json")
+        if os.path.exists(index_path):
+            with open(index_path, "r", encoding="utf-8") as f: self.entries = json.load(f)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, url):
+        entry = self.entries.get(url)
+        if entry is None: return None
+        with open(os.path.join(self.path, "bodies", entry["body"]), "rb") as f:
+            return entry["status"], entry["content_type"], f.read()
+
+    def put(self, url, status, content_type, body):
+        digest = hashlib.sha1(body).hexdigest()
+        os.makedirs(os.path.join(self.path, "bodies"), exist_ok=True)
+        body_path = os.path.join(self.path, "bodies", digest)
+        if not os.path.exists(body_path):
+            with open(body_path, "wb") as f: f.write(body)
+        with self.lock:
+            self.entries[url] = {"status": status, "content_type": content_type, "body": digest, "bytes": len(body)}
+
+    def save(self):
+        os.makedirs(self.path, exist_ok=True)
+        with self.lock:
+            lines = ",\n".join(f"{json.dumps(url, ensure_ascii=False)}: {json.dumps(entry)}" for url, entry in sorted(self.entries.items()))
+        with open(os.path.join(self.path, "index.json"), "w", encoding="utf-8") as f:
+            f.write(f"{{\n{lines}\n}}\n")
+
+def request_kind(url):
+    # 요청 종류: 목록 / 상세 / 뉴스 (상한 확인용)
+    if "news.google.com" in url: return "news"
+    if "recruit.do?pageNo=" in url or "/jobdb_list/" in url: return "listing"
+    return "detail"
+
+def request_budgets():
+    # 단계별 상세·뉴스 요청 상한 (저장소의 설정값 기준)
+    # main: 목표 신규 파일 수 + 파이프라인 대기열 크기 / main_private: collector 가 고른 공고 수
+    sys.path.insert(0, ROOT)
+    import collector
+    import main as crawl_main
+    return {
+        "main": crawl_main.TARGET_NEW_FILES + crawl_main.PIPELINE_WORKERS * 2,
+        "main_private": collector.FINAL_TARGET_COUNT,
+    }
+
+def check_budgets(results, budgets):
+    over = [f"{r['stage']} {kind} {r['kinds'].get(kind, 0)}건 > 상한 {budgets[r['stage']]}건"
+            for r in results if r["stage"] in budgets for kind in ("detail", "news")
+            if r["kinds"].get(kind, 0) > budgets[r["stage"]]]
+    for line in over: print(f"  ❌ 요청 상한 초과: {line}")
+    assert not over, "목표 이후에도 상세/뉴스 요청을 보냈습니다"
+
+# ------------------------------------------
+# 스텁 서버
+# ------------------------------------------
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive (실제 사이트와 같은 연결 재사용)
+    disable_nagle_algorithm = True
+
+    def original_url(self):
+        # /https/job.alio.go.kr/recruit.do?pageNo=1 → https://job.alio.go.kr/recruit.do?pageNo=1
+        scheme, _, rest = self.path.lstrip("/").partition("/")
+        return f"{scheme}://{rest}"
+
+    def send(self, status, content_type, body, extra_headers=()):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in extra_headers: self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        url = self.original_url()
+        host = urllib.parse.urlsplit(url).netloc
+
+        fault = server.inject_fault()
+        if fault == "reset":
+            server.count(host, 0, "resets")
+            self.close_connection = True
+            self.connection.shutdown(2)  # 응답 없이 연결 끊기 → 클라이언트 ConnectionError
+            return
+        if fault == "error":
+            server.count(host, 0, "errors")
+            self.send(503, "text/plain", b"injected", [("Retry-After", "0")])
+            return
+
+        if server.mode == "record":
+            status, content_type, body = server.fetch_upstream(url, self.headers.get("User-Agent"))
+        else:
+            hit = server.archive.get(url)
+            if hit is None:
+                server.count(host, 0, "misses")
+                self.send(404, "text/plain", b"not in fixture archive")
+                return
+            status, content_type, body = hit
+        server.count(host, len(body), url=url)
+        self.send(status, content_type, body)
+
+    def log_message(self, *args):
+        pass
+
+class StubServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, mode, archive, latency=0.0, jitter=0.0, error_rate=0.0, reset_rate=0.0, seed=0):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.mode = mode
+        self.archive = archive
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.reset_rate = reset_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.upstream = requests.Session()
+        self.reset_stats()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}"
+
+    def reset_stats(self):
+        with self.lock:
+            self.stats = {"requests": 0, "bytes": 0, "errors": 0, "resets": 0, "misses": 0, "hosts": {}, "kinds": {}}
+
+    def count(self, host, n_bytes, kind=None, url=None):
+        # url: 정상 응답한 요청 → 종류별(목록/상세/뉴스) 건수도 셈 (주입한 오류/재시도는 제외)
+        with self.lock:
+            self.stats["requests"] += 1
+            self.stats["bytes"] += n_bytes
+            self.stats["hosts"][host] = self.stats["hosts"].get(host, 0) + 1
+            if kind: self.stats[kind] += 1
+            if url:
+                url_kind = request_kind(url)
+                self.stats["kinds"][url_kind] = self.stats["kinds"].get(url_kind, 0) + 1
+
+    def inject_fault(self):
+        # 지연은 모든 요청에, 오류/연결 끊기는 확률적으로 (시드 고정)
+        with self.lock:
+            delay = self.latency + self.rng.uniform(0, self.jitter)
+            roll = self.rng.random()
+        if delay: time.sleep(delay)
+        if roll < self.reset_rate: return "reset"
+        if roll < self.reset_rate + self.error_rate: return "error"
+        return None
+
+    def fetch_upstream(self, url, user_agent):
+        # 조건부 헤더는 보내지 않음 (항상 전체 본문을 받아 보관)
+        try:
+            res = self.upstream.get(url, headers={"User-Agent": user_agent or "Mozilla/5.0"}, timeout=15)
+        except requests.RequestException as e:
+            return 502, "text/plain", f"upstream error: {e}".encode("utf-8")
+        content_type = res.headers.get("Content-Type", "application/octet-stream")
+        if res.status_code == 200: self.archive.put(url, 200, content_type, res.content)
+        return res.status_code, content_type, res.content
+
+# ------------------------------------------
+# 파이프라인 실행
+# ------------------------------------------
+def prepare_workdir(path):
+    os.makedirs(path, exist_ok=True)
+    for src in glob.glob(os.path.join(ROOT, "*.py")):
+        shutil.copy2(src, path)
+
+def run_stages(server, workdir, verbose):
+    env = dict(os.environ, CRAWL_STUB_URL=server.url, PYTHONIOENCODING="utf-8")
+    results = []
+    for name, argv in STAGES:
+        server.reset_stats()
+        log_path = os.path.join(workdir, f"{name}.log")
+        start = time.perf_counter()
+        with open(log_path, "w", encoding="utf-8") as log:
+            proc = subprocess.run([sys.executable] + argv, cwd=workdir, env=env,
+                                  stdout=None if verbose else log, stderr=subprocess.STDOUT if not verbose else None)
+        elapsed = time.perf_counter() - start
+        with server.lock: stats = json.loads(json.dumps(server.stats))
+        results.append(dict(stage=name, seconds=round(elapsed, 3), exit_code=proc.returncode, **stats))
+        print(f"  {name:<14}{elapsed:>9.2f}s{stats['requests']:>8}{stats['bytes'] / 1024:>11.0f}KB"
+              f"{stats['errors']:>6}{stats['resets']:>6}{stats['misses']:>6}  종료코드 {proc.returncode}")
+    return results
+
+def print_summary(results):
+    total = {k: sum(r[k] for r in results) for k in ("seconds", "requests", "bytes", "errors", "resets", "misses")}
+    print(f"  {'합계':<14}{total['seconds']:>9.2f}s{total['requests']:>8}{total['bytes'] / 1024:>11.0f}KB"
+          f"{total['errors']:>6}{total['resets']:>6}{total['misses']:>6}")
+    hosts = {}
+    for r in results:
+        for host, n in r["hosts"].items(): hosts[host] = hosts.get(host, 0) + n
+    for host, n in sorted(hosts.items(), key=lambda x: -x[1]):
+        print(f"  🌐 {host}: {n}건")
+    if total["seconds"]:
+        print(f"  ⏱️ 처리량: {total['requests'] / total['seconds']:.1f} 요청/초")
+    return total
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤링 녹화 / 오프라인 재생 벤치마크")
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="fixture 보관소 폴더")
+    parser.add_argument("--workdir", help="파이프라인 작업 폴더 (기본: 매번 새 임시 폴더)")
+    parser.add_argument("--latency-ms", type=float, default=0, help="재생 응답마다 더할 지연")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="0 ~ 이 값 사이의 무작위 추가 지연")
+    parser.add_argument("--error-rate", type=float, default=0, help="503 응답 비율 (0~1)")
+    parser.add_argument("--reset-rate", type=float, default=0, help="응답 없이 연결을 끊는 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="결과 JSON 경로")
+    parser.add_argument("--verbose", action="store_true", help="각 단계 출력을 그대로 표시 (기본: 작업 폴더의 <단계>.log)")
+    args = parser.parse_args()
+
+    archive = FixtureArchive(args.fixtures)
+    if args.mode == "replay" and not len(archive):
+        sys.exit(f"fixture 보관소가 비어 있습니다: {args.fixtures} (먼저 record 실행)")
+    faults = (args.latency_ms / 1000, args.jitter_ms / 1000, args.error_rate, args.reset_rate) if args.mode == "replay" else (0, 0, 0, 0)
+    server = StubServer(args.mode, archive, *faults, seed=args.seed)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="crawl_replay_")
+    prepare_workdir(workdir)
+    print(f"🎬 {args.mode} · 보관소 {args.fixtures} ({len(archive)}개) · 작업 폴더 {workdir}")
+    print(f"  {'단계':<14}{'시간':>10}{'요청':>8}{'바이트':>13}{'503':>6}{'끊김':>6}{'없음':>6}")
+    budgets = request_budgets()
+    try:
+        results = run_stages(server, workdir, args.verbose)
+        total = print_summary(results)
+    finally:
+        server.shutdown()
+        if args.mode == "record":
+            archive.save()
+            print(f"💾 보관소 저장: {args.fixtures} ({len(archive)}개 주소)")
+        if not args.workdir: shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"mode": args.mode, "fixtures": len(archive), "latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms,
+                       "error_rate": args.error_rate, "reset_rate": args.reset_rate, "stages": results, "total": total},
+                      f, ensure_ascii=False, indent=1)
+        print(f"💾 결과 저장: {args.output}")
+    check_budgets(results, budgets)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import argparse
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ==========================================
+# 로컬 스텁 LLM (OpenAI 호환 /v1/chat/completions)
+# ==========================================
+# app.py / asgi_app.py 를 HF_BASE_URL=http://127.0.0.1:<port> 로 띄우면
+# 실제 Hugging Face 대신 이 서버가 고정 지연 후 답변을 돌려줍니다.
+
+class StubLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    delay = 2.0
+    answer = "스텁 답변입니다. 김진호 소장의 행동 설계를 받아보세요."
+
+    def log_message(self, *args): pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        time.sleep(self.delay)
+
+        if payload.get("stream"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            for token in self.answer.split(" "):
+                chunk = {"choices": [{"index": 0, "delta": {"role": "assistant", "content": token + " "}}]}
+                self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.close_connection = True
+            return
+
+        body = json.dumps({
+            "id": "stub", "object": "chat.completion", "created": int(time.time()),
+            "model": payload.get("model", "stub"),
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": self.answer}}],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+        }, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+def serve(port, delay):
+    StubLLMHandler.delay = delay
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubLLMHandler)
+    server.daemon_threads = True
+    return server
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--delay", type=float, default=2.0)
+    args = parser.parse_args()
+    print(f"🧪 스텁 LLM 대기 중: http://127.0.0.1:{args.port} (지연 {args.delay}초)")
+    serve(args.port, args.delay).serve_forever()
@@ -0,0 +1,152 @@
+import random
+
+# ==========================================
+# 벤치마크용 합성 데이터 생성기
+# ==========================================
+# 실제 db1.json / db2.json 은 저장소에 없으므로, 자소서와 비슷한
+# 어휘 분포를 가진 가짜 문서를 시드 고정으로 만들어 씁니다.
+# (앞쪽 단어일수록 자주 나오는 Zipf 분포 + 드문 합성 단어 다수)
+
+WORDS = [
+    "저는", "경험", "통해", "역량", "직무", "지원", "회사", "입사", "기여", "노력",
+    "소통", "협력", "도전", "책임", "분석", "성실", "윤리", "고객", "안전", "혁신",
+    "창의", "전문성", "리더십", "글로벌", "열정", "성장", "팀워크", "신뢰", "문제해결",
+    "실행", "배려", "끈기", "프로젝트", "동아리", "인턴", "데이터", "개선", "목표",
+    "결과", "과정", "해결", "방안", "제안", "참여", "주도", "학습", "현장", "업무",
+    "효율", "비용", "절감", "매출", "향상", "달성", "봉사", "갈등", "조율", "설득",
+]
+SYLLABLES = "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초코토포호"
+
+def _vocabulary(rng, n_rare=3000):
+    rare = set()
+    while len(rare) < n_rare:
+        rare.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    vocab = WORDS + sorted(rare)
+    weights = [1.0 / (rank + 1) for rank in range(len(vocab))]
+    return vocab, weights
+
+def make_essays(n, seed=42, n_words=40):
+    rng = random.Random(seed)
+    vocab, weights = _vocabulary(rng)
+    essays = []
+    for _ in range(n):
+        essays.append(" ".join(rng.choices(vocab, weights=weights, k=n_words)) + ".")
+    return essays
+
+# ==========================================
+# 목록 / RSS 표본 페이지 (실제 사이트 구조를 흉내 낸 합성 HTML)
+# ==========================================
+# 네트워크 없이 파서 벤치마크를 돌릴 때 사용. 실제 표본은
+# python benchmarks/bench_html_parser.py --record 로 benchmarks/samples/ 에 저장
+
+ORGS = ["한국전력공사", "국민건강보험공단", "한국수자원공사", "(주)한화", "에이치디현대중공업(주)", "국립공원공단", "한전KDN", "(재)우체국물류지원단"]
+
+def _title(rng):
+    return f"2026년 {rng.choice(['상반기', '하반기', '수시'])} {rng.choice(['신입', '경력', '체험형 인턴'])} {rng.choice(WORDS)} 직원 채용 공고"
+
+def _site_chrome(rng, n_links):
+    # 실제 목록 페이지의 대부분을 차지하는 메뉴 / 검색 필터 / 하단 정보 / 스크립트
+    menu = "".join(f'<li class="depth1"><a href="/menu/{i}">메뉴 {i}</a><ul>' +
+                   "".join(f'<li><a href="/menu/{i}/{j}" title="{rng.choice(WORDS)}">{rng.choice(WORDS)} {j}</a></li>' for j in range(8)) +
+                   '</ul></li>' for i in range(n_links // 8))
+    filters = "".join(f'<label><input type="checkbox" name="f{i}" value="{i}"><span>{rng.choice(WORDS)}</span></label>' for i in range(n_links // 2))
+    footer = "".join(f'<p class="info">{" ".join(rng.choices(WORDS, k=12))}</p>' for _ in range(20))
+    script = "<script>var conf = {" + ",".join(f'"k{i}": {i}' for i in range(200)) + "};</script>"
+    return f'<div id="header"><ul class="gnb">{menu}</ul></div><div class="filter">{filters}</div>', f'<div id="footer">{footer}</div>{script}'
+
+def make_alio_listing(page=1, n_rows=10, seed=42):
+    rng = random.Random(seed + page)
+    nav, footer = _site_chrome(rng, 240)
+    rows = []
+    for i in range(n_rows):
+        idx = 294000 + page * 100 + i
+        rows.append(
+            f'<tr><td>{idx}</td><td class="left"><a href="/recruitview.do?pageNo={page}&amp;idx={idx}&amp;s_orderBy=1">{_title(rng)}</a></td>'
+            f'<td>{rng.choice(ORGS)}</td><td>정규직</td><td>2026.01.{rng.randint(10, 31)}</td><td><span class="ing">접수중</span></td></tr>'
+        )
+    pages = "".join(f'<a href="/recruit.do?pageNo={p}">{p}</a>' for p in range(1, 11))
+    return (f'<!DOCTYPE html><html lang="ko"><head><meta charset="UTF-8"><title>채용정보 - 잡알리오</title></head>'
+            f'<body>{nav}<div class="tbl"><table><thead><tr><th>번호</th><th>제목</th><th>기관</th>'
+            f'<th>고용형태</th><th>마감일</th><th>상태</th></tr></thead><tbody>{"".join(rows)}</tbody></table></div>'
+            f'<div class="paging">{pages}</div>{footer}</body></html>')
+
+def make_incruit_listing(n_premium=12, n_general=40, seed=42):
+    rng = random.Random(seed)
+    nav, footer = _site_chrome(rng, 480)
+    premium = "".join(
+        f'<div class="cPrdlists_cols"><a href="/jobdb_info/jobpost.asp?job=26{i:08d}"><span class="cCpName">{rng.choice(ORGS)}</span>'
+        f'<span class="cTitle"><strong>{_title(rng)}</strong></span><span class="cDate">~01.{rng.randint(10, 31)}(금)</span></a></div>'
+        for i in range(n_premium)
+    )
+    general = "".join(
+        f'<ul class="c_row"><li class="c_col"><div class="cell_first"><div class="cl_top"><a class="cpname" href="#">{rng.choice(ORGS)}</a></div></div>'
+        f'<div class="cell_mid"><div class="cl_top"><a href="https://job.incruit.com/jobdb_info/jobpost.asp?job=25{i:08d}">{_title(rng)}</a></div>'
+        f'<div class="cl_md"><span>경력무관</span><span>대졸</span><span>서울</span></div></div>'
+        f'<div class="cell_last"><div class="cl_btm"><span>~01.{rng.randint(10, 31)} (금)</span><span>등록 1일전</span></div></div></li></ul>'
+        for i in range(n_general)
+    )
+    return (f'<!DOCTYPE html><html lang="ko"><head><meta charset="euc-kr"><title>인크루트 채용정보</title></head>'
+            f'<body>{nav}<div class="cPrdlists_rows">{premium}</div><div class="cBbslist_contenst">{general}</div>{footer}</body></html>')
+
+def make_news_rss(query="한국전력공사", n_items=30, seed=42):
+    rng = random.Random(seed)
+    items = "".join(
+        f'<item><title>{query} {rng.choice(WORDS)} {rng.choice(WORDS)} 발표 - 언론사{i}</title>'
+        f'<link>https://news.google.com/rss/articles/CBMi{rng.getrandbits(64):x}?oc=5</link>'
+        f'<guid isPermaLink="false">CBMi{rng.getrandbits(64):x}</guid>'
+        f'<pubDate>{rng.choice(["Mon", "Tue", "Wed"])}, {rng.randint(10, 28):02d} Oct 2025 0{rng.randint(0, 9)}:00:00 GMT</pubDate>'
+        f'<description>&lt;a href="https://news.google.com/rss/articles/x" target="_blank"&gt;{query} 기사&lt;/a&gt;&amp;nbsp;&amp;nbsp;&lt;font color="#6f6f6f"&gt;언론사{i}&lt;/font&gt;</description>'
+        f'<source url="https://news{i}.example.com">언론사{i}</source></item>'
+        for i in range(n_items)
+    )
+    return (f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?><rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/">'
+            f'<channel><generator>NFE/5.0</generator><title>"{query}" - Google 뉴스</title><link>https://news.google.com/search?q={query}</link>'
+            f'<language>ko</language><webMaster>news-webmaster@google.com</webMaster><lastBuildDate>Sat, 18 Oct 2025 00:00:00 GMT</lastBuildDate>'
+            f'<description>Google 뉴스</description>{items}</channel></rss>').encode("utf-8")
+
+# ==========================================
+# 공고 상세 / 생성 페이지 목록 / 채팅 질문 (벤치마크 묶음 bench_suite.py 용)
+# ==========================================
+def make_job_details(n, seed=42, n_words=300):
+    # main.parse_job_detail 결과와 같은 모양 (본문은 자소서 어휘로 만든 문단 HTML)
+    rng = random.Random(seed)
+    vocab, weights = _vocabulary(rng, n_rare=500)
+    details = []
+    for i in range(n):
+        paragraphs = [" ".join(rng.choices(vocab, weights=weights, k=n_words // 5)) for _ in range(5)]
+        details.append({
+            "job_id": str(300000 + i),
+            "url": f"https://job.alio.go.kr/recruitview.do?idx={300000 + i}",
+            "org_name": rng.choice(ORGS),
+            "title": _title(rng),
+            "end_date": f"2026.{rng.randint(1, 12):02d}.{rng.randint(1, 28):02d}",
+            "content": '<div id="tab-1">' + "".join(f"<p>{p}</p>" for p in paragraphs) + "</div>",
+            "content_text": "\n".join(paragraphs),
+        })
+    return details
+
+def make_manifest_pages(n, seed=42):
+    # PageManifest.newest_first() 항목과 같은 모양
+    rng = random.Random(seed)
+    pages = []
+    for i in range(n):
+        org = rng.choice(ORGS)
+        stamp = f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T09:00:00"
+        pages.append({
+            "file": f"{300000 + i}_{''.join(c for c in org if c.isalnum())}.html",
+            "id": str(300000 + i), "org": org, "title": _title(rng), "deadline": "2026.12.31",
+            "created": stamp, "updated": stamp, "hash": f"{rng.getrandbits(160):040x}",
+        })
+    return pages
+
+CHAT_SAMPLES = [
+    "안녕하세요", "자소서 지원동기 어떻게 써야 하나요?", "한국전력공사 연봉 정보 알려줘",
+    "소통 역량을 보여줄 경험이 부족해요", "면접에서 갈등 해결 사례를 물어보면?", "테스트",
+    "오늘 삼성전자 주가 전망은?", "리더십 경험을 행동 중심으로 정리하고 싶습니다", "고마워요",
+]
+
+def make_chat_inputs(n, seed=42):
+    rng = random.Random(seed)
+    vocab, weights = _vocabulary(rng, n_rare=200)
+    return [rng.choice(CHAT_SAMPLES) if rng.random() < 0.5 else " ".join(rng.choices(vocab, weights=weights, k=rng.randint(2, 30)))
+            for _ in range(n)]
@@ -1,9 +1,15 @@
 import os
-import requests
-from bs4 import BeautifulSoup
+import argparse
+import re
+from html import unescape
 import json
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
+from keyword_matcher import KeywordMatcher
+from rate_limit import HostRateLimiter
+from http_cache import HttpCache
+from html_parser import make_soup, SoupStrainer
 
 # ==========================================
 # 1. 설정 (인크루트 최신 HTML 구조 반영)
@@ -23,103 +29,151 @@ HEADERS = {
 }
 
 EXCLUDE_KEYWORDS = ["공사", "공단", "재단", "협회", "진흥원", "시청", "구청", "센터", "공무원", "보건소"]
+EXCLUDE_MATCHER = KeywordMatcher(EXCLUDE_KEYWORDS)
 FINAL_TARGET_COUNT = 30
-
-def collect_private_jobs_by_size():
-    print(f"🔥 [Collector] 중복 제거 및 완전 수집 모드 시작 (목표: {FINAL_TARGET_COUNT}개)...")
+HTTP_CACHE = HttpCache()  # 실행 간 재사용되는 조건부 GET 캐시 (.http_cache)
+
+# [병렬 수집] 동시 요청 수와 사이트별 요청 속도 (인크루트에는 초당 2건까지만)
+FETCH_WORKERS = 4
+HOST_RATE_PER_SEC = 2.0
+HOST_BURST = 2
+
+def fetch_listing_page(target_url, limiter=None):
+    if limiter: limiter.acquire(target_url)
+    response = HTTP_CACHE.get(target_url, headers=HEADERS, timeout=10)
+    response.encoding = response.apparent_encoding 
+    return response.text
+
+# 목록 페이지에서 실제로 쓰는 두 영역(상단 프리미엄 / 하단 일반 목록)만 트리로 만듦
+LISTING_STRAINER = SoupStrainer('div', class_=['cPrdlists_rows', 'cBbslist_contenst'])
+TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title>', re.S | re.I)
+
+def page_title(html):
+    # 디버깅 출력용 페이지 제목 (트리를 만들지 않고 정규식으로)
+    m = TITLE_RE.search(html)
+    return unescape(m.group(1)).strip() if m else None
+
+def parse_listing_page(html, candidate_jobs, seen_links):
+    soup = make_soup(html, parse_only=LISTING_STRAINER)
+    
+    # ★★★ [수정 핵심] 상단(Premium) + 하단(General) 모두 수집 ★★★
+    # 기존 코드의 'if not list_area' 로직을 삭제하고 둘 다 가져와서 합칩니다.
+    list_premium = soup.select('div.cPrdlists_rows div.cPrdlists_cols') # 상단
+    list_general = soup.select('div.cBbslist_contenst ul.c_row')        # 하단
+    
+    # 두 리스트 합치기 (누락 방지)
+    all_items = list_premium + list_general
+    
+    if not all_items:
+        print("❌ 공고 못 찾음 (구조가 다르거나 차단됨)")
+        # 디버깅용: 페이지 제목 출력
+        print(f"      ㄴ 페이지 제목: {page_title(html) or '없음'}")
+        return False
+    else:
+        print(f"✅ {len(all_items)}개 발견 (상단:{len(list_premium)} + 하단:{len(list_general)})")
+
+    for item in all_items:
+        try:
+            # 1. 회사명 (태그가 다를 수 있어 두 가지 다 확인)
+            comp_tag = item.select_one('.cpname') or item.select_one('.cCpName')
+            if not comp_tag: continue
+            company = comp_tag.get_text(strip=True)
+
+            if EXCLUDE_MATCHER.any_in(company): continue
+
+            # 2. 제목 & 링크 
+            # 상단/하단 구조 차이 대응
+            title_tag = item.select_one('.cell_mid .cl_top a') or item.select_one('.cTitle strong') or item.select_one('.cTitle') or item.select_one('.cl_top a')
+            
+            if not title_tag: continue
+
+            title = title_tag.get_text(strip=True)
+            
+            # 링크 추출 (a 태그가 있는 상위 요소 찾기)
+            link_tag = item.find('a', href=True)
+            # 제목 태그 자체가 a태그인 경우
+            if title_tag.name == 'a': link_tag = title_tag
+            
+            if not link_tag: continue
+            link = link_tag['href']
+            if link.startswith("/"): link = "https://job.incruit.com" + link
+
+            # ★ [추가] 중복 방지 로직
+            if link in seen_links:
+                continue # 이미 수집한 링크면 패스
+            seen_links.add(link)
+
+            # 3. 마감일
+            deadline = "채용시"
+            # 하단형 구조
+            d_tag = item.select_one('.cell_last .cl_btm span:first-child')
+            # 상단형 구조 (.cDate)
+            if not d_tag: d_tag = item.select_one('.cDate')
+            
+            if d_tag: deadline = d_tag.get_text(strip=True)
+
+            # 4. 저장할 데이터 구성
+            job_data = {
+                "company": company,
+                "title": title,
+                "link": link,
+                "deadline": deadline,
+                "id": 0 # 나중에 일괄 부여
+            }
+            candidate_jobs.append(job_data)
+
+        except Exception:
+            continue
+    return True
+
+def collect_private_jobs_by_size(concurrent=True, workers=FETCH_WORKERS, seed=None):
+    mode = "병렬" if concurrent else "순차"
+    print(f"🔥 [Collector] 중복 제거 및 완전 수집 모드 시작 (목표: {FINAL_TARGET_COUNT}개, {mode})...")
     
     candidate_jobs = []
     seen_links = set() # ★ [추가] 중복 공고 방지용 체크리스트
+
+    # 페이지 탐색 (사이트별 1~3페이지)
+    page_urls = [[f"{base_url}&page={page}" for page in range(1, 4)] for base_url in TARGET_URLS]
+
+    # [병렬] 목록 페이지는 해석할 순서대로 workers 개까지만 미리 받아 두고, 하나를 해석할 때마다 다음 것을 요청
+    # → 순차 모드와 결과(JSON)가 완전히 같고, 목표량이 차서 멈추면 그 뒤 페이지는 요청하지 않음
+    pool, futures = None, {}
+    ahead = iter([target_url for urls in page_urls for target_url in urls])
+    def prefetch_next():
+        target_url = next(ahead, None)
+        if target_url is not None: futures[target_url] = pool.submit(fetch_listing_page, target_url, limiter)
+    if concurrent:
+        limiter = HostRateLimiter(rate=HOST_RATE_PER_SEC, burst=HOST_BURST)
+        pool = ThreadPoolExecutor(max_workers=workers)
+        for _ in range(workers): prefetch_next()
     
-    for base_url in TARGET_URLS:
-        # 페이지 탐색 (1~3페이지)
-        for page in range(1, 4):
+    for urls in page_urls:
+        for target_url in urls:
             try:
                 # 목표량의 4배수 이상 모이면 중단 (필터링 고려 넉넉하게)
                 if len(candidate_jobs) >= FINAL_TARGET_COUNT * 4: break
 
-                target_url = f"{base_url}&page={page}"
                 print(f"   📡 접속: {target_url} ... ", end="")
                 
-                response = requests.get(target_url, headers=HEADERS, timeout=10)
-                response.encoding = response.apparent_encoding 
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # ★★★ [수정 핵심] 상단(Premium) + 하단(General) 모두 수집 ★★★
-                # 기존 코드의 'if not list_area' 로직을 삭제하고 둘 다 가져와서 합칩니다.
-                list_premium = soup.select('div.cPrdlists_rows div.cPrdlists_cols') # 상단
-                list_general = soup.select('div.cBbslist_contenst ul.c_row')        # 하단
-                
-                # 두 리스트 합치기 (누락 방지)
-                all_items = list_premium + list_general
-                
-                if not all_items:
-                    print("❌ 공고 못 찾음 (구조가 다르거나 차단됨)")
-                    # 디버깅용: 페이지 제목 출력
-                    print(f"      ㄴ 페이지 제목: {soup.title.text.strip() if soup.title else '없음'}")
-                    continue 
+                if concurrent:
+                    prefetch_next()
+                    html = futures[target_url].result()
                 else:
-                    print(f"✅ {len(all_items)}개 발견 (상단:{len(list_premium)} + 하단:{len(list_general)})")
-
-                for item in all_items:
-                    try:
-                        # 1. 회사명 (태그가 다를 수 있어 두 가지 다 확인)
-                        comp_tag = item.select_one('.cpname') or item.select_one('.cCpName')
-                        if not comp_tag: continue
-                        company = comp_tag.get_text(strip=True)
-
-                        if any(k in company for k in EXCLUDE_KEYWORDS): continue
-
-                        # 2. 제목 & 링크 
-                        # 상단/하단 구조 차이 대응
-                        title_tag = item.select_one('.cell_mid .cl_top a') or item.select_one('.cTitle strong') or item.select_one('.cTitle') or item.select_one('.cl_top a')
-                        
-                        if not title_tag: continue
-
-                        title = title_tag.get_text(strip=True)
-                        
-                        # 링크 추출 (a 태그가 있는 상위 요소 찾기)
-                        link_tag = item.find('a', href=True)
-                        # 제목 태그 자체가 a태그인 경우
-                        if title_tag.name == 'a': link_tag = title_tag
-                        
-                        if not link_tag: continue
-                        link = link_tag['href']
-                        if link.startswith("/"): link = "https://job.incruit.com" + link
-
-                        # ★ [추가] 중복 방지 로직
-                        if link in seen_links:
-                            continue # 이미 수집한 링크면 패스
-                        seen_links.add(link)
-
-                        # 3. 마감일
-                        deadline = "채용시"
-                        # 하단형 구조
-                        d_tag = item.select_one('.cell_last .cl_btm span:first-child')
-                        # 상단형 구조 (.cDate)
-                        if not d_tag: d_tag = item.select_one('.cDate')
-                        
-                        if d_tag: deadline = d_tag.get_text(strip=True)
-
-                        # 4. 저장할 데이터 구성
-                        job_data = {
-                            "company": company,
-                            "title": title,
-                            "link": link,
-                            "deadline": deadline,
-                            "id": 0 # 나중에 일괄 부여
-                        }
-                        candidate_jobs.append(job_data)
-
-                    except Exception:
-                        continue
+                    html = fetch_listing_page(target_url)
+
+                if not parse_listing_page(html, candidate_jobs, seen_links): continue
                 
-                time.sleep(1) # 차단 방지 대기
+                if not concurrent: time.sleep(1) # 차단 방지 대기 (병렬 모드는 속도 제한기가 대신함)
 
             except Exception as e:
                 print(f"   ❌ 에러: {e}")
                 continue
 
+    if pool:
+        for future in futures.values(): future.cancel()
+        pool.shutdown(wait=False)
+
     print(f"\n📊 [최종 결과] 중복 제거 후 확보된 공고: {len(candidate_jobs)}건")
     
     # 데이터가 없으면 비상 경고
@@ -127,8 +181,8 @@ def collect_private_jobs_by_size():
         print("🚨 [비상] 수집된 데이터가 0건입니다. HTML 구조가 예상과 다릅니다.")
         return []
 
-    # 셔플 및 30개 자르기
-    random.shuffle(candidate_jobs)
+    # 셔플 및 30개 자르기 (seed 를 주면 매번 같은 순서)
+    random.Random(seed).shuffle(candidate_jobs)
     final_jobs = candidate_jobs[:FINAL_TARGET_COUNT]
 
     # ID 부여
@@ -138,7 +192,13 @@ def collect_private_jobs_by_size():
     return final_jobs
 
 if __name__ == "__main__":
-    jobs = collect_private_jobs_by_size()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sequential", action="store_true", help="기존 순차 수집 (페이지마다 1초 대기)")
+    parser.add_argument("--workers", type=int, default=FETCH_WORKERS, help="병렬 수집 동시 요청 수")
+    parser.add_argument("--seed", type=int, default=None, help="셔플 시드 (같은 시드 → 같은 결과)")
+    args = parser.parse_args()
+
+    jobs = collect_private_jobs_by_size(concurrent=not args.sequential, workers=args.workers, seed=args.seed)
     
     # 폴더 생성 (현재 위치 기준)
     save_dir = "JOBS"
@@ -155,4 +215,8 @@ if __name__ == "__main__":
         print(f"🎉 recruit_data.json 저장 완료! ({len(jobs)}건)")
         print(f"📂 저장 경로: {os.path.abspath(save_path)}")
     else:
-        print("💀 빈 파일 저장됨.")
\ No newline at end of file
+        print("💀 빈 파일 저장됨.")
+
+    HTTP_CACHE.report("collector")
+    HTTP_CACHE.client.report("collector")
+    HTTP_CACHE.prune()
\ No newline at end of file
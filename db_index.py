@@ -0,0 +1,79 @@
+import random
+from array import array
+from collections import defaultdict
+
+# ==========================================
+# 합격 DB 부분 문자열 색인 (문자 2-gram 역색인)
+# ==========================================
+# - load_database() 에서 한 번만 만들고, search_db() 는 색인만 조회합니다.
+# - 결과는 기존 [item for item in ALL_DB_DATA if keyword in item] 과 동일합니다.
+#   (가장 드문 2-gram 의 문서 목록으로 후보를 좁힌 뒤 'in' 으로 최종 확인)
+# - search_db() 는 결과 중 '하나'만 무작위로 쓰므로 sample() 로 전체 목록을
+#   만들지 않고 후보에서 바로 뽑습니다. (후보 중 균등 추출 + 불일치 시 재추출)
+
+SAMPLE_TRIES = 32
+
+class SubstringIndex:
+    def __init__(self, items):
+        self.items = list(items)
+        # 문서 번호 목록은 array('I') 로 보관 (list 대비 메모리 절반 이하)
+        self.unigrams = defaultdict(lambda: array('I'))  # 1글자 검색어용
+        self.bigrams = defaultdict(lambda: array('I'))   # 2글자 이상 검색어용
+
+        for doc_id, item in enumerate(self.items):
+            text = item if isinstance(item, str) else str(item)
+            for ch in set(text):
+                self.unigrams[ch].append(doc_id)
+            for gram in set(text[i:i + 2] for i in range(len(text) - 1)):
+                self.bigrams[gram].append(doc_id)
+
+    def __len__(self):
+        return len(self.items)
+
+    def _postings(self, keyword):
+        # 검색어의 각 2-gram 문서 목록 (짧은 순). 하나라도 비면 결과 없음 → []
+        if len(keyword) == 1:
+            posting = self.unigrams.get(keyword)
+            return [posting] if posting else []
+
+        postings = []
+        for gram in set(keyword[i:i + 2] for i in range(len(keyword) - 1)):
+            posting = self.bigrams.get(gram)
+            if not posting: return []
+            postings.append(posting)
+        postings.sort(key=len)
+        return postings
+
+    def candidates(self, keyword):
+        # 검색어를 포함할 '가능성'이 있는 문서 번호 (오름차순)
+        # 큰 목록끼리 교집합을 만드는 것보다, 가장 짧은 목록만 쓰고
+        # 최종 'in' 확인에 맡기는 편이 파이썬에서는 더 빠릅니다.
+        postings = self._postings(keyword)
+        return postings[0] if postings else []
+
+    def search(self, keyword):
+        if not keyword: return list(self.items)
+        matched = []
+        for doc_id in self.candidates(keyword):
+            item = self.items[doc_id]
+            # 2-gram 이 모두 들어 있어도 순서가 다를 수 있으므로 최종 확인
+            if keyword in item: matched.append(item)
+        return matched
+
+    def sample(self, keyword, rng=random):
+        # random.choice(self.search(keyword)) 와 같은 분포, 결과가 없으면 None
+        if not keyword:
+            return rng.choice(self.items) if self.items else None
+
+        postings = self._postings(keyword)
+        if not postings: return None
+
+        # 가장 짧은 목록에서 균등 추출 → 실제 포함된 문서만 채택 (기각 표본추출)
+        pool = postings[0]
+        for _ in range(min(len(pool), SAMPLE_TRIES)):
+            item = self.items[pool[rng.randrange(len(pool))]]
+            if keyword in item: return item
+
+        # 후보 대부분이 불일치하는 드문 경우에만 정확한 전체 검색
+        matched = self.search(keyword)
+        return rng.choice(matched) if matched else None
@@ -0,0 +1,79 @@
+import json
+import os
+
+from page_manifest import content_hash, write_if_changed
+
+# ==========================================
+# 합격 DB 샤드 내보내기 (생성 페이지용, 필요한 조각만 내려받음)
+# ==========================================
+# - 예전: db_data1.js / db_data2.js 에 전체 DB 를 넣고 모든 페이지가 <script src> 로 둘 다 받음
+#   → DB 가 커질수록 페이지 첫 로딩도 같이 커짐
+# - 지금: <SAVE_DIR>/db/ 아래에 작은 JSON 조각(샤드)들과 색인(index.json)을 씀
+#   · 키워드 샤드: 키워드가 들어간 항목 중 앞에서부터 최대 SHARD_LIMIT 건
+#                  (사이드바가 키워드 검색 시 보여주던 결과와 같음 → 칩 클릭 시 이 파일 하나만 받음)
+#   · 기본 샤드:   앞에서부터 SHARD_LIMIT 건 (검색어 없이 처음 보여주는 목록 / 오늘의 샘플)
+#   · 전체 청크:   전체 DB 를 CHUNK_SIZE 건씩 나눈 조각 (사전에 없는 자유 검색어일 때만 순서대로 받음)
+# - 샤드 파일명은 내용 해시 → 내용이 바뀌면 이름도 바뀌므로 브라우저/CDN 캐시를 오래 둬도 안전
+# - index.json 만 고정 이름 (작음, 키워드 → 샤드 파일명). 예전에 만든 페이지도 항상 최신 색인을 읽음
+# - 색인에 없는 옛 샤드는 정리. 예전 페이지용 db_data1.js / db_data2.js 는 호출하는 쪽에서 계속 씀
+
+SHARD_DIR = "db"
+INDEX_FILE = "index.json"
+SHARD_LIMIT = 50    # 사이드바 표시 건수와 같음
+CHUNK_SIZE = 200
+
+def _write_shard(out_dir, items):
+    text = json.dumps(items, ensure_ascii=False, separators=(',', ':'))
+    name = f"{content_hash(text)[:12]}.json"
+    path = os.path.join(out_dir, name)
+    if not os.path.exists(path):  # 같은 이름 = 같은 내용
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+    return name, len(text.encode('utf-8'))
+
+def _matches(item, keyword):
+    # 페이지 JS 의 item.title.includes(filter) || item.content.includes(filter) 와 같은 조건
+    return keyword in item["title"] or keyword in item["content"]
+
+def export_shards(formatted_data, save_dir, keywords):
+    out_dir = os.path.join(save_dir, SHARD_DIR)
+    os.makedirs(out_dir, exist_ok=True)
+    sizes = {}
+
+    sample, sizes["sample"] = _write_shard(out_dir, formatted_data[:SHARD_LIMIT])
+
+    keyword_shards = {}
+    for keyword in keywords:
+        hits = []
+        for item in formatted_data:
+            if _matches(item, keyword):
+                hits.append(item)
+                if len(hits) >= SHARD_LIMIT: break
+        keyword_shards[keyword], sizes[keyword] = _write_shard(out_dir, hits)
+
+    chunks = []
+    for start in range(0, len(formatted_data), CHUNK_SIZE):
+        name, _ = _write_shard(out_dir, formatted_data[start:start + CHUNK_SIZE])
+        chunks.append(name)
+
+    index = {
+        "total": len(formatted_data),
+        "sample": sample,
+        "keywords": keyword_shards,
+        "chunks": chunks,
+    }
+    index_text = json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+    write_if_changed(os.path.join(out_dir, INDEX_FILE), index_text)
+
+    # 색인이 가리키지 않는 옛 샤드 정리
+    live = {sample, INDEX_FILE, *keyword_shards.values(), *chunks}
+    removed = 0
+    for name in os.listdir(out_dir):
+        if name.endswith('.json') and name not in live:
+            os.remove(os.path.join(out_dir, name))
+            removed += 1
+
+    first_kb = (sizes.pop("sample") + len(index_text.encode('utf-8'))) // 1024
+    print(f"✅ [시스템] DB 샤드: 키워드 {len(keyword_shards)}개 · 청크 {len(chunks)}개 · "
+          f"첫 로딩 {first_kb}KB · 키워드 샤드 최대 {max(sizes.values(), default=0) // 1024}KB · 정리 {removed}개")
+    return index
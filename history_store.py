@@ -0,0 +1,85 @@
+import os
+
+# ==========================================
+# 수집 이력 저장소 (추가 전용 로그 + 메모리 집합)
+# ==========================================
+# - 실행 시 로그를 한 번만 읽어 set 으로 보관 → 'in' 조회는 O(1)
+#   (기존 load_history() 는 공고 URL 마다 파일 전체를 다시 읽고 list 에서 찾았음)
+# - 새 이력은 모아 두었다가 batch_size 건마다 한 번에 기록 (write 1회 + fsync)
+# - 한 줄 = "출처\t공고ID". 출처별로 나눠 쓸 수 있음 (지금은 main.py 의 "alio" 만 기록)
+#   main_private.py 는 이미 만든 공고도 다시 확인해 갱신하므로 이력 대신 manifest 의 source_hash 로 판단
+# - 기록 도중 끊겨 마지막 줄이 잘렸으면, 다음에 열 때 잘린 줄만 버리고 이어 씀
+# - 기존 saved_history.txt / private_history.txt 는 legacy_files 로 넘기면 없는 ID 만 가져옴
+# - 한 스레드에서만 사용 (main.py 파이프라인에서도 파일 작성 스레드만 기록)
+
+HISTORY_LOG = "crawl_history.log"
+
+class HistoryStore:
+    def __init__(self, path, source, legacy_files=(), batch_size=20):
+        self.path = path
+        self.source = source
+        self.batch_size = batch_size
+        self.ids = set()
+        self.pending = []
+        self._load()
+        for legacy in legacy_files:
+            self.import_file(legacy)
+
+    def _load(self):
+        if not os.path.exists(self.path): return
+        with open(self.path, 'rb') as f: data = f.read()
+
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            # 마지막 기록이 중간에 끊긴 경우 → 완성된 줄까지만 남김
+            with open(self.path, 'r+b') as f:
+                f.truncate(end)
+                os.fsync(f.fileno())
+
+        prefix = self.source + "\t"
+        for line in data[:end].decode('utf-8').splitlines():
+            if line.startswith(prefix):
+                self.ids.add(line[len(prefix):])
+
+    def __contains__(self, job_id):
+        return job_id in self.ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def add(self, job_id):
+        if job_id in self.ids: return
+        self.ids.add(job_id)
+        self.pending.append(job_id)
+        if len(self.pending) >= self.batch_size: self.flush()
+
+    def import_file(self, path):
+        # 줄마다 ID 하나인 기존 이력 파일 가져오기 (이미 있는 ID 는 건너뜀)
+        if not os.path.exists(path): return 0
+        before = len(self.ids)
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                job_id = line.strip()
+                if job_id and job_id not in self.ids:
+                    self.ids.add(job_id)
+                    self.pending.append(job_id)
+        self.flush()
+        return len(self.ids) - before
+
+    def flush(self):
+        if not self.pending: return
+        data = "".join(f"{self.source}\t{job_id}\n" for job_id in self.pending)
+        with open(self.path, 'a', encoding='utf-8', newline='\n') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self.pending = []
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
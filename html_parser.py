@@ -0,0 +1,64 @@
+import os
+from datetime import datetime
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# ==========================================
+# HTML 파서 선택 (BeautifulSoup 백엔드)
+# ==========================================
+# - lxml(C 구현)이 설치되어 있으면 목록 페이지 / 뉴스 RSS 처럼 '텍스트와 링크만 뽑는' 문서에 사용
+# - 상세 본문처럼 파싱한 HTML 을 그대로(str) 페이지에 넣는 경우(keep_markup=True)는 항상 html.parser
+#   (lxml 은 본문 안의 \r 을 \n 으로 바꾸는 등 직렬화 결과가 달라져 생성 파일이 바뀜)
+# - 추출 코드는 모두 bs4 API(select / find_all) 를 쓰므로 selectolax 처럼 API 가 다른 파서는 쓰지 않음
+# - 환경변수 HTML_PARSER=html.parser 로 두면 예전처럼 전부 html.parser 사용
+#   (HTML_PARSER=lxml 은 설치되어 있을 때만 적용)
+# - 결과가 같은지는 benchmarks/bench_html_parser.py 로 표본 페이지마다 비교
+# - parse_only=SoupStrainer(...) 를 주면 조건에 맞는 요소(와 그 하위)만 트리로 만듦
+#   (목록 페이지에서 메뉴/광고 등 쓰지 않는 부분의 객체 생성을 건너뜀)
+
+SAFE_PARSER = "html.parser"
+
+def available_parsers():
+    parsers = []
+    try:
+        import lxml  # noqa: F401
+        parsers.append("lxml")
+    except ImportError:
+        pass
+    parsers.append(SAFE_PARSER)
+    return parsers
+
+def _pick_parser():
+    wanted = os.environ.get("HTML_PARSER", "").strip()
+    available = available_parsers()
+    if wanted in available: return wanted
+    return available[0]
+
+FAST_PARSER = _pick_parser()
+
+def make_soup(markup, keep_markup=False, from_encoding=None, parser=None, parse_only=None):
+    # keep_markup=True → 파싱 결과의 HTML 을 그대로 다시 쓰는 문서 (상세 본문)
+    if parser is None:
+        parser = SAFE_PARSER if keep_markup else FAST_PARSER
+    options = {}
+    if parse_only is not None: options["parse_only"] = parse_only
+    if from_encoding and not isinstance(markup, str): options["from_encoding"] = from_encoding
+    return BeautifulSoup(markup, parser, **options)
+
+# ------------------------------------------
+# 공통 추출: 구글 뉴스 RSS (main.py / main_private.py 가 같은 방식으로 파싱)
+# ------------------------------------------
+def parse_google_news(content, limit=30):
+    # RSS 본문(bytes) → [{'title', 'link', 'date'}] (날짜를 읽지 못하면 "최신")
+    soup = make_soup(content, from_encoding='utf-8')
+    news_data = []
+    for item in soup.find_all('item', limit=limit):
+        title = item.title.text
+        link = item.link.text if item.link else "#"
+        pub_date = item.pubdate.text if item.pubdate else ""
+        try:
+            clean_date = datetime.strptime(pub_date[:16], "%a, %d %b %Y").strftime("%Y-%m-%d")
+        except ValueError:
+            clean_date = "최신"
+        news_data.append({'title': title, 'link': link, 'date': clean_date})
+    return news_data
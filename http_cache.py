@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from http_client import shared_client
+
+# ==========================================
+# 디스크 HTTP 캐시 (조건부 GET)
+# ==========================================
+# - collector.py / main.py / main_private.py 가 같은 캐시 폴더(.http_cache)를 함께 씀
+# - 받아 둔 본문과 ETag / Last-Modified 를 저장해 두고,
+#   · 신선 기간(fresh 초) 안이면 요청 없이 캐시 본문을 그대로 사용
+#   · 지났으면 If-None-Match / If-Modified-Since 로 다시 물어보고 304 면 캐시 본문 사용
+# - 실제 요청은 http_client 의 공용 클라이언트(연결 재사용 + 재시도)로 보냄
+# - 반환값은 requests.Response 라서 .text / .content / .apparent_encoding 등 기존 코드 그대로 사용
+# - 신선 기간은 환경변수 HTTP_CACHE_FRESH (초, 기본 3600), 폴더는 HTTP_CACHE_DIR
+# - 실행이 끝나면 report() 로 캐시 적중률 출력, prune() 으로 오래 안 쓴 항목 정리
+# - 폴더는 처음 저장할 때 만듦 (모듈을 import 만 하는 벤치마크/도구가 현재 폴더에 .http_cache 를 만들지 않도록)
+
+CACHE_DIR = os.environ.get("HTTP_CACHE_DIR", ".http_cache")
+FRESH_SECONDS = int(os.environ.get("HTTP_CACHE_FRESH", 3600))
+KEEP_DAYS = 14
+
+class HttpCache:
+    def __init__(self, cache_dir=CACHE_DIR, fresh=FRESH_SECONDS, client=None):
+        self.cache_dir = cache_dir
+        self.fresh = fresh
+        self.client = client or shared_client()
+        self.lock = threading.Lock()
+        self.counts = {"fresh": 0, "revalidated": 0, "fetched": 0, "uncached": 0}
+        self.dir_ready = False
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + ".json", base + ".body"
+
+    def _load(self, url):
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f: meta = json.load(f)
+            with open(body_path, "rb") as f: body = f.read()
+        except (OSError, ValueError):
+            return None, None
+        if meta.get("url") != url: return None, None
+        return meta, body
+
+    def _write_atomic(self, path, data):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f: f.write(data)
+        os.replace(tmp_path, path)
+
+    def _store(self, url, response):
+        meta_path, body_path = self._paths(url)
+        meta = {
+            "url": url,
+            "fetched_at": time.time(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "headers": {k: v for k, v in response.headers.items() if k.lower() in ("content-type", "etag", "last-modified")},
+        }
+        if not self.dir_ready:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self.dir_ready = True
+        # 본문을 먼저 쓰고 메타를 나중에 씀 → 메타가 있으면 본문도 완전함
+        self._write_atomic(body_path, response.content)
+        self._write_atomic(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+    def _touch(self, url, meta):
+        meta["fetched_at"] = time.time()
+        meta_path, body_path = self._paths(url)
+        self._write_atomic(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+        os.utime(body_path)  # prune() 대상에서 빠지도록
+
+    def _count(self, kind):
+        with self.lock: self.counts[kind] += 1
+
+    @staticmethod
+    def _response(url, meta, body):
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = body
+        response.headers = CaseInsensitiveDict(meta.get("headers", {}))
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def get(self, url, headers=None, timeout=10, fresh=None):
+        fresh = self.fresh if fresh is None else fresh
+        meta, body = self._load(url)
+
+        if meta is not None and time.time() - meta["fetched_at"] < fresh:
+            self._count("fresh")
+            return self._response(url, meta, body)
+
+        request_headers = dict(headers or {})
+        if meta is not None:
+            if meta.get("etag"): request_headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"): request_headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = self.client.get(url, headers=request_headers, timeout=timeout)
+
+        if response.status_code == 304 and meta is not None:
+            self._count("revalidated")
+            self._touch(url, meta)
+            return self._response(url, meta, body)
+
+        if response.status_code == 200:
+            self._count("fetched")
+            self._store(url, response)
+        else:
+            self._count("uncached")
+        return response
+
+    def stats(self):
+        with self.lock: counts = dict(self.counts)
+        total = sum(counts.values())
+        hits = counts["fresh"] + counts["revalidated"]
+        counts["requests"] = total
+        counts["hit_rate"] = round(hits / total, 4) if total else 0.0
+        return counts
+
+    def report(self, label=""):
+        s = self.stats()
+        print(f"📦 [HTTP 캐시{' ' + label if label else ''}] 요청 {s['requests']}건 · 적중률 {s['hit_rate'] * 100:.1f}% "
+              f"(신선 {s['fresh']}, 304 {s['revalidated']}, 새로 받음 {s['fetched']}, 저장 안 함 {s['uncached']})")
+
+    def prune(self, keep_days=KEEP_DAYS):
+        # keep_days 동안 한 번도 쓰이지(갱신되지) 않은 항목 삭제
+        if not os.path.isdir(self.cache_dir): return 0
+        cutoff = time.time() - keep_days * 86400
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                continue
+        return removed
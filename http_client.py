@@ -0,0 +1,112 @@
+import os
+import random
+import threading
+import time
+import urllib.parse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# ==========================================
+# 공용 HTTP 클라이언트 (연결 재사용 + 재시도 + 요청 시간 기록)
+# ==========================================
+# - requests.Session 하나를 모든 요청이 함께 씀 → 호스트별 연결 풀(keep-alive)에서
+#   이미 열린 연결을 다시 사용하므로 요청마다 TCP/TLS 핸드셰이크를 하지 않음
+# - 연결 오류 / 타임아웃 / 429·5xx 응답은 지터(jitter)가 섞인 지수 백오프로 재시도
+#   (대기 = 0 ~ min(max_backoff, backoff * 2^시도) 사이 무작위, Retry-After 가 있으면 그 값)
+# - 요청마다 호스트별 건수 / 누적·최대 시간 / 재시도 / 실패를 기록, report() 로 출력
+# - collector.py / main.py / main_private.py 는 shared_client() 하나를 HttpCache 아래에서 공유
+# - 환경변수 CRAWL_STUB_URL 이 있으면 모든 요청을 그 주소의 로컬 스텁 서버로 보냄 (오프라인 녹화/재생,
+#   benchmarks/crawl_replay.py). 통계의 호스트 이름은 원래 주소 기준
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+STUB_URL = os.environ.get("CRAWL_STUB_URL", "").rstrip("/")
+
+def route(url):
+    # https://job.alio.go.kr/recruit.do?pageNo=1 → <CRAWL_STUB_URL>/https/job.alio.go.kr/recruit.do?pageNo=1
+    if not STUB_URL: return url
+    parts = urllib.parse.urlsplit(url)
+    return f"{STUB_URL}/{parts.scheme}/{parts.netloc}{parts.path or '/'}" + (f"?{parts.query}" if parts.query else "")
+
+class HttpClient:
+    def __init__(self, pool_maxsize=16, retries=3, backoff=0.5, max_backoff=8.0,
+                 retry_statuses=RETRY_STATUSES, headers=None):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = set(retry_statuses)
+
+        self.session = requests.Session()
+        # 호스트마다 최대 pool_maxsize 개의 연결을 열어 두고 재사용 (병렬 수집 스레드 수 이상)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if headers: self.session.headers.update(headers)
+
+        self.lock = threading.Lock()
+        self.hosts = {}  # host → {"requests", "total_ms", "max_ms", "retries", "errors"}
+
+    def _sleep_before_retry(self, attempt, response=None):
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            delay = min(self.max_backoff, float(retry_after))
+        else:
+            delay = random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+        time.sleep(delay)
+
+    def _record(self, host, elapsed_ms, attempts, error):
+        with self.lock:
+            stat = self.hosts.setdefault(host, {"requests": 0, "total_ms": 0.0, "max_ms": 0.0, "retries": 0, "errors": 0})
+            stat["requests"] += 1
+            stat["total_ms"] += elapsed_ms
+            stat["max_ms"] = max(stat["max_ms"], elapsed_ms)
+            stat["retries"] += attempts - 1
+            if error: stat["errors"] += 1
+
+    def get(self, url, headers=None, timeout=10, **kwargs):
+        host = urllib.parse.urlparse(url).netloc
+        target = route(url)
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            try:
+                response = self.session.get(target, headers=headers, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.retries:
+                    self._record(host, (time.perf_counter() - start) * 1000, attempt + 1, True)
+                    raise
+                self._sleep_before_retry(attempt)
+                attempt += 1
+                continue
+
+            if response.status_code in self.retry_statuses and attempt < self.retries:
+                response.close()
+                self._sleep_before_retry(attempt, response)
+                attempt += 1
+                continue
+
+            self._record(host, (time.perf_counter() - start) * 1000, attempt + 1, response.status_code >= 400)
+            return response
+
+    def stats(self):
+        with self.lock:
+            return {host: dict(stat, avg_ms=round(stat["total_ms"] / stat["requests"], 1))
+                    for host, stat in self.hosts.items()}
+
+    def report(self, label=""):
+        for host, s in sorted(self.stats().items()):
+            print(f"🌐 [HTTP{' ' + label if label else ''}] {host}: {s['requests']}건 · 평균 {s['avg_ms']}ms · "
+                  f"최대 {s['max_ms']:.0f}ms · 재시도 {s['retries']} · 실패 {s['errors']}")
+
+    def close(self):
+        self.session.close()
+
+_shared = None
+_shared_lock = threading.Lock()
+
+def shared_client():
+    # 프로세스 안에서 하나만 만들어 모든 모듈이 같은 연결 풀을 씀
+    global _shared
+    with _shared_lock:
+        if _shared is None: _shared = HttpClient()
+        return _shared
@@ -0,0 +1,56 @@
+import re
+from collections import defaultdict
+
+# ==========================================
+# 다중 키워드 매칭기 (키워드 목록을 한 번만 컴파일해 공유)
+# ==========================================
+# - app.py 의도 분류, main.py / main_private.py 키워드 추출,
+#   collector.py 제외 기관 필터가 함께 사용합니다.
+# - any_in(): 키워드 전체를 정규식 하나(a|b|c...)로 묶어 C 구현으로 한 번에 검사
+# - iter_matches() / find_all(): 본문을 한 번만 훑어 모든 (시작 위치, 키워드) 를 찾음 (겹치는 키워드 포함)
+#   키워드 첫 글자 문자 클래스로 후보 위치만 정규식으로 건너뛰며 찾고,
+#   그 위치의 앞 두 글자(한 글자 키워드는 한 글자)로 묶은 키워드만 startswith 로 확인
+# - found(): 사전이 작으면 'k in text' 반복(키워드당 C 검색 1번)이 더 빠르므로 그대로 쓰고,
+#   SINGLE_PASS_MIN 개 이상이면 한 번 훑기로 전환 (benchmarks/bench_keyword_matcher.py 참고)
+
+SINGLE_PASS_MIN = 300  # 실제 공고 본문 기준 (반복 / 한 번 훑기): 100개 95/110µs, 300개 251/240µs, 1,000개 900/430µs
+
+class KeywordMatcher:
+    def __init__(self, keywords):
+        self.keywords = list(dict.fromkeys(k for k in keywords if k))  # 중복 제거, 순서 유지
+        # 긴 키워드를 먼저 두어 같은 위치에서는 긴 쪽이 잡히도록 (any_in 결과에는 영향 없음)
+        alternation = "|".join(re.escape(k) for k in sorted(self.keywords, key=len, reverse=True))
+        self.pattern = re.compile(alternation) if self.keywords else None
+
+        # 한 번 훑기용: 앞 두 글자 → 키워드 목록 (긴 것부터), 후보 시작 글자 문자 클래스
+        self.buckets = defaultdict(tuple)
+        for k in sorted(self.keywords, key=len, reverse=True):
+            self.buckets[k[:2]] += (k,)
+        self.buckets = dict(self.buckets)
+        first_chars = "".join(re.escape(ch) for ch in sorted({k[0] for k in self.keywords}))
+        self.start_re = re.compile(f"[{first_chars}]") if first_chars else None
+
+    def any_in(self, text):
+        # any(k in text for k in keywords) 와 동일
+        return self.pattern is not None and self.pattern.search(text) is not None
+
+    def iter_matches(self, text):
+        # (시작 위치, 키워드) 를 본문 순서대로 생성 (같은 위치에서는 긴 키워드부터)
+        if self.start_re is None: return
+        get, startswith = self.buckets.get, text.startswith
+        for m in self.start_re.finditer(text):
+            pos = m.start()
+            for key in (text[pos:pos + 2], m.group()):
+                for keyword in get(key, ()):
+                    if startswith(keyword, pos): yield pos, keyword
+                if len(key) == 1: break  # 본문 끝 (두 글자 키와 한 글자 키가 같음)
+
+    def find_all(self, text):
+        return list(self.iter_matches(text))
+
+    def found(self, text):
+        # [k for k in keywords if k in text] 와 동일 (키워드 목록 순서 유지)
+        if len(self.keywords) < SINGLE_PASS_MIN:
+            return [k for k in self.keywords if k in text]
+        hit = {keyword for _, keyword in self.iter_matches(text)}
+        return [k for k in self.keywords if k in hit]
@@ -1,12 +1,22 @@
-import requests
-from bs4 import BeautifulSoup
 import os
 import time
 import urllib.parse
-from datetime import datetime
 import random
 import json
 import re
+import argparse
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from keyword_matcher import KeywordMatcher
+from rate_limit import HostRateLimiter
+from history_store import HistoryStore, HISTORY_LOG
+from db_shards import export_shards
+from static_assets import publish_asset, inline_json
+from page_manifest import PageManifest, write_if_changed
+from http_cache import HttpCache
+from html_parser import make_soup, SoupStrainer, parse_google_news
+import ai_insights
 
 # ==========================================
 # 1. 설정 영역 (원본 유지)
@@ -14,8 +24,9 @@ import re
 MY_CONSULTING_LINK = "https://kimjinholab.pages.dev/consult.html"
 MY_HOME_LINK = "https://kimjinholab.pages.dev"
 SAVE_DIR = "jobs_html"
-HISTORY_FILE = "saved_history.txt"
+HISTORY_FILE = "saved_history.txt"   # 예전 이력 파일 (crawl_history.log 로 가져온 뒤 읽기만 함)
 TARGET_NEW_FILES = 30 
+MANIFEST_FILE = "jobs_manifest.json"   # 생성 페이지 목록 (jobs.html / sitemap.xml 의 원본)
 
 # ★★★ [중요] 24시간 가동되는 소장님의 Render 서버 주소 ★★★
 RENDER_SERVER_URL = "https://jinho-lab-bot.onrender.com/chat"
@@ -24,6 +35,8 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 }
 
+HTTP_CACHE = HttpCache()  # 실행 간 재사용되는 조건부 GET 캐시 (.http_cache)
+
 # ==========================================
 # 2. DB 분할 저장 로직 (원본 유지)
 # ==========================================
@@ -63,41 +76,26 @@ def export_db_to_js():
     
     print(f"✅ [시스템] DB 분할 완료: 총 {len(formatted_data)}건")
 
+    # 새 페이지는 db/ 아래 샤드만 필요한 만큼 받음 (db_data1/2.js 는 예전 페이지용으로 유지)
+    export_shards(formatted_data, SAVE_DIR, TARGET_KEYWORDS.keywords)
+
+TARGET_KEYWORDS = KeywordMatcher(["소통", "협력", "도전", "책임", "분석", "성실", "윤리", "고객", "안전", "혁신", "창의", "전문성", "리더십", "글로벌"])
+
 def extract_keywords_from_text(text):
-    target_keywords = ["소통", "협력", "도전", "책임", "분석", "성실", "윤리", "고객", "안전", "혁신", "창의", "전문성", "리더십", "글로벌"]
-    found = [word for word in target_keywords if word in text[:3000]]
+    found = TARGET_KEYWORDS.found(text[:3000])
     return found[:6] if found else ["소통", "책임", "도전"]
 
 # ==========================================
-# ★ 구글 뉴스 크롤링 함수 (수정: html.parser 사용)
+# ★ 구글 뉴스 크롤링 함수 (lxml 이 있으면 사용, 없으면 html.parser)
 # ==========================================
-def get_google_news(query):
+def get_google_news(query, limiter=None):
     encoded_query = urllib.parse.quote(query)
     url = f"https://news.google.com/rss/search?q={encoded_query}&hl=ko&gl=KR&ceid=KR:ko"
     
     try:
-        res = requests.get(url, timeout=5) 
-        # [수정] lxml 파서 대신 기본 html.parser 사용 (호환성 증대)
-        soup = BeautifulSoup(res.content, 'html.parser', from_encoding='utf-8')
-        items = soup.find_all('item', limit=30)
-        
-        news_data = []
-        for item in items:
-            title = item.title.text
-            link = item.link.text if item.link else "#"
-            pub_date = item.pubdate.text if item.pubdate else ""
-            try:
-                dt = datetime.strptime(pub_date[:16], "%a, %d %b %Y")
-                clean_date = dt.strftime("%Y-%m-%d")
-            except:
-                clean_date = "최신"
-
-            news_data.append({
-                'title': title,
-                'link': link,
-                'date': clean_date
-            })
-        return news_data
+        if limiter: limiter.acquire(url)
+        res = HTTP_CACHE.get(url, timeout=5) 
+        return parse_google_news(res.content)
     except Exception as e:
         print(f"    ⚠ 뉴스 수집 실패: {e}")
         return []
@@ -114,106 +112,8 @@ JOB_TEMPLATE = """
     <title>[{org_name}] 합격 자기소개서 리포트 (ID:{job_id})</title>
     <link href="https://cdn.jsdelivr.net/gh/orioncactus/pretendard/dist/web/static/pretendard.css" rel="stylesheet">
     
-    <script src="db_data1.js"></script>
-    <script src="db_data2.js"></script>
 
-    <style>
-        :root {{ --navy: #0f172a; --gold: #d4af37; --bg: #f8fafc; --text: #334155; --sidebar-w: 480px; }}
-        * {{ box-sizing: border-box; }}
-        body {{ font-family: 'Pretendard', sans-serif; background: var(--bg); color: var(--text); margin: 0; display: flex; height: 100vh; overflow: hidden; }}
-        
-        .sidebar {{ width: var(--sidebar-w); background: white; border-right: 1px solid #cbd5e1; display: flex; flex-direction: column; height: 100%; padding: 25px; z-index: 100; flex-shrink: 0; }}
-        .main-content {{ flex: 1; padding: 40px; overflow-y: auto; position: relative; background: #f8fafc; }}
-
-        .home-link-btn {{ display: block; text-align: center; background: var(--navy); color: white; padding: 12px; border-radius: 8px; text-decoration: none; font-weight: 700; margin-bottom: 20px; }}
-        
-        /* [소장님 지시] 사이드바 디자인 혁신: 18px 대왕 글자 & 중복 제거 */
-        .db-card {{ 
-            background: white; border: 1px solid #e2e8f0; border-radius: 12px; 
-            padding: 20px; margin-bottom: 15px; transition: 0.2s; position: relative; cursor: pointer;
-        }}
-        .db-card:hover {{ border-color: var(--gold); transform: translateY(-3px); box-shadow: 0 4px 12px rgba(0,0,0,0.05); }}
-        
-        /* [소장님 지시] 일치율 배지 */
-        .match-badge {{ 
-            display: inline-block; background: #fee2e2; color: #ef4444; 
-            padding: 5px 12px; border-radius: 20px; font-weight: 800; 
-            font-size: 14px; margin-bottom: 12px; border: 1px solid #fecaca;
-        }}
-
-        /* [소장님 지시] 사이드바 텍스트 18px */
-        .db-text {{ 
-            font-size: 18px; line-height: 1.6; color: #334155; 
-            word-break: break-all;
-        }}
-        
-        /* [소장님 지시] 중앙 확대 리포트 스타일 (22px) */
-        .full-report-view {{
-            background: white; padding: 60px; border-radius: 20px; box-shadow: 0 10px 30px rgba(0,0,0,0.05);
-            font-size: 22px; line-height: 2.0; color: #1e293b;
-        }}
-        .full-report-title {{
-            font-size: 28px; font-weight: 800; color: var(--navy); 
-            border-bottom: 3px solid #e2e8f0; padding-bottom: 20px; margin-bottom: 40px;
-        }}
-        .back-btn {{
-            display: inline-block; margin-bottom: 20px; padding: 10px 20px; 
-            background: #e2e8f0; color: #475569; border-radius: 30px; 
-            font-weight: bold; cursor: pointer; font-size: 16px; border: none;
-        }}
-        .back-btn:hover {{ background: #cbd5e1; }}
-
-        .ai-ask-btn {{ display: none; }} /* 사이드바에서는 텍스트 클릭 유도를 위해 버튼 숨김 (카드 전체 클릭) */
-
-        .ai-preview-box {{ background: #fffbeb; border: 2px dashed #f59e0b; border-radius: 12px; padding: 25px; margin-bottom: 30px; position: relative; }}
-        .ai-tag {{ background: #f59e0b; color: white; padding: 4px 10px; border-radius: 5px; font-size: 0.75rem; font-weight: bold; position: absolute; top: -12px; left: 20px; }}
-        .action-quote {{ font-size: 1.05rem; font-weight: 800; color: #1e40af; border-left: 5px solid #2563eb; padding-left: 15px; margin-top: 20px; line-height: 1.5; }}
-        .cta-link {{ display: inline-block; margin-top: 15px; color: #2563eb; font-weight: bold; text-decoration: underline; cursor: pointer; }}
-
-        .news-container {{ margin: 30px 0; background: white; border-radius: 15px; padding: 25px; box-shadow: 0 4px 15px rgba(0,0,0,0.03); border: 1px solid #e2e8f0; }}
-        .news-header {{ font-size: 1.3rem; font-weight: 800; color: var(--navy); margin-bottom: 15px; display: flex; align-items: center; justify-content: space-between; border-bottom: 2px solid #f1f5f9; padding-bottom:10px; }}
-        .news-scroll-box {{ max-height: 400px; overflow-y: auto; padding-right: 10px; }}
-        .news-scroll-box::-webkit-scrollbar {{ width: 6px; }}
-        .news-scroll-box::-webkit-scrollbar-thumb {{ background: #cbd5e1; border-radius: 3px; }}
-        .news-item {{ display: flex; justify-content: space-between; align-items: flex-start; padding: 12px 0; border-bottom: 1px dashed #e2e8f0; }}
-        .news-item:last-child {{ border-bottom: none; }}
-        .news-info {{ flex: 1; }}
-        .news-title {{ font-size: 0.95rem; font-weight: bold; color: #333; text-decoration: none; display: block; margin-bottom: 4px; line-height: 1.4; }}
-        .news-title:hover {{ text-decoration: underline; color: #2563eb; }}
-        .news-date {{ font-size: 0.75rem; color: #94a3b8; background: #f8fafc; padding: 2px 6px; border-radius: 4px; }}
-        .news-ai-btn {{ background: white; color: #d97706; border: 1px solid #d97706; padding: 6px 12px; border-radius: 20px; font-size: 0.75rem; font-weight: bold; cursor: pointer; margin-left: 10px; white-space: nowrap; transition: 0.2s; }}
-        .news-ai-btn:hover {{ background: #fffbeb; transform: translateY(-2px); }}
-
-        .highlight {{ background-color: #fef08a; font-weight: 900; border-bottom: 3px solid #facc15; padding: 0 2px; }}
-        
-        .job-card {{ background: white; border-radius: 15px; padding: 50px; box-shadow: 0 4px 20px rgba(0,0,0,0.05); max-width: 900px; margin: 0 auto; }}
-        .job-title {{ font-size: 2rem; color: var(--navy); margin: 10px 0 20px 0; font-weight: 800; }}
-        .keyword-chip {{ background: #f1f5f9; border: 1px solid #cbd5e1; padding: 8px 16px; border-radius: 50px; margin: 5px; display: inline-block; font-weight: 600; cursor: pointer; }}
-        .custom-search-box {{ display: inline-flex; align-items: center; margin-left: 10px; gap: 5px; }}
-        .custom-search-box input {{ padding: 8px 12px; border: 1px solid #cbd5e1; border-radius: 20px; outline: none; font-size: 14px; width: 180px; }}
-        .custom-search-box button {{ padding: 8px 15px; background: var(--navy); color: white; border: none; border-radius: 20px; cursor: pointer; font-weight: bold; }}
-        .content-body {{ font-size: 0.95rem; line-height: 1.8; color: #334155; margin-top: 30px; }}
-
-        #chatbot-bubble {{ position: fixed; bottom: 95px; right: 30px; background: white; padding: 10px 15px; border-radius: 15px; box-shadow: 0 4px 15px rgba(0,0,0,0.1); border: 1px solid #2563eb; font-size: 13px; font-weight: bold; color: #1e40af; z-index: 9998; animation: float 3s ease-in-out infinite; cursor: pointer; }}
-        #chatbot-bubble::after {{ content: ''; position: absolute; bottom: -8px; right: 25px; border-width: 8px 8px 0; border-style: solid; border-color: #2563eb transparent transparent transparent; }}
-        @keyframes float {{ 0% {{transform: translateY(0);}} 50% {{transform: translateY(-10px);}} 100% {{transform: translateY(0);}} }}
-        #chatbot-floater {{ position: fixed; bottom: 30px; right: 30px; width: 60px; height: 60px; background: linear-gradient(135deg, #2563eb, #1e40af); border-radius: 50%; box-shadow: 0 4px 15px rgba(37, 99, 235, 0.4); cursor: pointer; z-index: 9999; display: flex; align-items: center; justify-content: center; transition: transform 0.2s; }}
-        #chatbot-floater:hover {{ transform: scale(1.1); }}
-        #chatbot-window {{ display: none; position: fixed; bottom: 100px; right: 30px; width: 360px; height: 520px; background: white; border-radius: 16px; box-shadow: 0 10px 40px rgba(0,0,0,0.2); z-index: 10000; flex-direction: column; border: 1px solid #e2e8f0; overflow: hidden; }}
-        .chat-header {{ background: #2563eb; color: white; padding: 15px; font-weight: bold; display: flex; justify-content: space-between; align-items: center; cursor: move; }}
-        #chat-messages {{ flex: 1; padding: 15px; overflow-y: auto; background: #f8fafc; display: flex; flex-direction: column; gap: 10px; }}
-        .msg {{ max-width: 85%; padding: 10px 14px; border-radius: 12px; font-size: 14px; line-height: 1.5; word-break: break-word; }}
-        .msg-user {{ align-self: flex-end; background: #2563eb; color: white; border-bottom-right-radius: 2px; }}
-        .msg-ai {{ align-self: flex-start; background: white; border: 1px solid #e2e8f0; color: #1e293b; border-bottom-left-radius: 2px; }}
-        .chat-input-area {{ padding: 10px; border-top: 1px solid #e2e8f0; background: white; display: flex; gap: 5px; }}
-        .chat-input-area input {{ flex: 1; padding: 12px; border: 1px solid #e2e8f0; border-radius: 20px; outline: none; }}
-        .chat-input-area button {{ background: #2563eb; color: white; border: none; padding: 0 15px; border-radius: 20px; font-weight: bold; cursor: pointer; }}
-        
-        @media (max-width: 1024px) {{
-            .sidebar {{ display: none; }}
-            body {{ flex-direction: column; overflow: auto; }}
-        }}
-    </style>
+    <link rel="stylesheet" href="{css_file}">
 </head>
 <body>
     <div class="sidebar" id="mainSidebar">
@@ -237,6 +137,10 @@ JOB_TEMPLATE = """
                 <div id="aiSampleContent" style="color: #4b5563; font-style: italic; line-height: 1.6;">
                     데이터 로딩 중... (가장 유사한 합격 사례를 분석하고 있습니다)
                 </div>
+                <div id="aiInsight" class="ai-insight">
+                    <div class="ai-insight-title">🧠 AI 공고 분석</div>
+                    <div id="aiInsightText"></div>
+                </div>
                 <div class="action-quote">
                     "최종 합격을 결정짓는 것은 이런 뻔한 문장이 아닌,<br>
                     오직 당신만이 가진 <strong>'행동 중심의 에피소드'</strong>입니다."
@@ -304,260 +208,479 @@ JOB_TEMPLATE = """
         </div>
     </div>
 
-    <script>
-        const dbData = [
-            ...(window.DB_PART_1 || []), 
-            ...(window.DB_PART_2 || [])
-        ];
-        console.log("📊 전체 합격 DB 로드 완료: " + dbData.length + "건");
-        const dbContainer = document.getElementById('dbContainer');
-        const dbSearch = document.getElementById('dbSearch');
-        const mainContentArea = document.getElementById('mainContentArea');
-        let originalMainContent = ""; // 원래 공고 내용 저장용
-
-        window.onload = function() {{
-            originalMainContent = mainContentArea.innerHTML; // 초기 공고 내용 백업
-            
-            if(dbData.length > 0) {{
-                const randomItem = dbData[Math.floor(Math.random() * dbData.length)];
-                document.getElementById('aiSampleContent').innerText = randomItem.content.substring(0, 350) + "...";
-            }}
-        }};
-
-        function renderDB(filter = "") {{
-            let filtered = dbData;
-            if (filter) {{
-                filtered = dbData.filter(item => 
-                    item.title.includes(filter) || item.content.includes(filter)
-                );
-            }}
-            filtered = filtered.slice(0, 50); // 사이드바 성능 위해 50개 제한
-            
-            if(filtered.length > 0) {{
-                dbContainer.innerHTML = filtered.map((item, index) => {{
-                    // [소장님 지시] 사이드바: 500자 요약 노출 & 중복 제목 삭제 (본문만 표시)
-                    // item.content는 전체 내용이므로 500자까지만 자름
-                    let summaryContent = item.content.substring(0, 500) + "...";
-                    let fullContent = item.content.replace(/'/g, "\\'"); // 클릭 시 전달할 전체 내용
-                    
-                    if (filter) {{
-                        const regex = new RegExp(filter, "gi");
-                        const highlightStr = `<span class="highlight">${{filter}}</span>`;
-                        summaryContent = summaryContent.replace(regex, highlightStr);
-                    }}
-
-                    // [소장님 지시] 클릭 시 showFullReport 함수 호출 (1200자 대왕 글자)
-                    // [소장님 지시] 중복 제목 제거: 제목 div 아예 삭제하고 배지와 본문만 표시
-                    return `
-                    <div class="db-card" onclick="showFullReport('${{fullContent}}')">
-                        <div class="match-badge">🎯 </div>
-                        <div class="db-text">${{summaryContent}}</div>
-                        <div style="text-align:right; margin-top:10px; color:#2563eb; font-size:0.8rem; font-weight:bold;">👉 클릭하여 전체보기 (확대)</div>
-                    </div>`;
-                }}).join('');
-            }} else {{
-                dbContainer.innerHTML = "<div style='padding:10px;'>검색 결과가 없습니다.</div>";
-            }}
-        }}
-        renderDB();
-
-        // [소장님 지시] 클릭 시 중앙 화면을 22px 대왕 리포트로 교체하는 함수
-        function showFullReport(fullText) {{
-            // 중앙 영역 전체를 리포트 뷰로 교체
-            mainContentArea.innerHTML = `
-                <div class="full-report-view">
-                    <button class="back-btn" onclick="restoreOriginalContent()">↩ 공고문으로 돌아가기</button>
-                    <div class="full-report-title">📄 합격 자기소개서 심층 분석 (전문)</div>
-                    <div style="white-space: pre-wrap;">${{fullText}}</div>
-                    <div style="margin-top:50px; border-top:2px dashed #e2e8f0; padding-top:30px; text-align:center;">
-                        <p style="font-size:18px; color:#64748b;">이 데이터는 합격 데이터입니다.</p>
-                        <a href="{consult_link}" target="_blank" style="background:var(--gold); color:white; padding:15px 30px; border-radius:30px; text-decoration:none; font-weight:bold; font-size:18px;">⚡ AI시대 자소서의 기준이 문잔력에서 실제 행동으로 바뀌었습니다.</a>
-                    </div>
-                </div>
-            `;
-            // 상단으로 스크롤 이동
-            mainContentArea.scrollTop = 0;
-        }}
-
-        function restoreOriginalContent() {{
-            mainContentArea.innerHTML = originalMainContent;
-        }}
-
-        function searchDB(keyword) {{ dbSearch.value = keyword; renderDB(keyword); }}
-        function manualSearch() {{ const val = document.getElementById('manualKeyword').value; if(val) {{ searchDB(val); alert("왼쪽 사이드바에서 결과를 확인하세요!"); }} }}
-        dbSearch.addEventListener('input', (e) => {{ renderDB(e.target.value); }});
-
-        function toggleChat() {{
-            const win = document.getElementById('chatbot-window');
-            const bubble = document.getElementById('chatbot-bubble');
-            if (win.style.display === 'none' || win.style.display === '') {{
-                win.style.display = 'flex'; bubble.style.display = 'none'; document.getElementById('chatInput').focus();
-            }} else {{
-                win.style.display = 'none'; bubble.style.display = 'block';
-            }}
-        }}
-
-        /* ========== [여기로 붙여넣으세요] ========== */
-        function askAiAboutNews(title, date) {{
-            const win = document.getElementById('chatbot-window');
-            const bubble = document.getElementById('chatbot-bubble');
-            if(win) win.style.display = 'flex'; 
-            if(bubble) bubble.style.display = 'none';
-
-            // 1. 사용자에게 보여줄 안내 멘트 (채팅창에 기록됨)
-            const displayMsg = "📢 선택하신 뉴스 [" + title + "]를 기반으로 합격 지원동기를 분석하고 있습니다.";
-            addBubble(displayMsg, 'user');
-
-            // 2. AI에게만 전달할 비밀 지시사항 (채팅창 노출 안 됨)
-            // {org_name}은 파이썬 변수이므로 하나만 씁니다.
-            const secretMsg = `[뉴스 기반 지원동기 작성 요청] \n기업명: {org_name}\n뉴스 제목: ` + title + `\n뉴스 날짜: ` + date + `\n\n1. 위 뉴스 내용을 기업의 사업 방향과 연결하여 전문적인 비즈니스 문체로 '지원동기' 초안을 작성해줘.\n2. 답변 마지막에 'AI 채용 도입으로 인해 합격 자소서의 평가 기준이 행동(Action) 중심으로 바뀌고 있습니다. 더 정교한 합격을 원하시면 전문가의 행동 중심 자소서 첨삭을 받아보세요.'라는 문구를 추가해줘.`;
-
-            // 3. 로딩 표시
-            const loadingId = addBubble("⏳ 분석 전략 수립 중... (약 30초 소요)", 'ai');
-            const loadingElement = document.getElementById(loadingId); 
-
-            // 4. 서버와 직접 통신 (비밀 메시지 전송)
-            const jobTitle = document.querySelector('.job-title') ? document.querySelector('.job-title').innerText : '공고 분석';
-            const jobContent = document.querySelector('.content-body') ? document.querySelector('.content-body').innerText.substring(0, 1000) : ''; 
-
-            // fetch 안의 중괄호는 자바스크립트용이므로 두 번 겹쳐 씁니다 {{ }}
-            fetch('{render_server_url}', {{
-                method: 'POST',
-                headers: {{ 'Content-Type': 'application/json' }},
-                body: JSON.stringify({{ 
-                    message: secretMsg,
-                    context: `[현재 공고 정보]\\n기업명: {org_name}\\n공고제목: ${{jobTitle}}\\n공고내용요약: ${{jobContent}}...`
-                }})
-            }})
-            .then(res => res.json())
-            .then(data => {{
-                if (loadingElement) {{ loadingElement.innerHTML = data.response.replace(/\\n/g, '<br>'); }}
-            }})
-            .catch(err => {{
-                if (loadingElement) {{ loadingElement.innerText = "⚠ 서버 연결 지연. 잠시 후 다시 시도해 주세요."; }}
-            }});
-        }}
-        async function sendMsg() {{
-            const input = document.getElementById('chatInput');
-            const msg = input.value.trim();
-            if (!msg) return;
-            addBubble(msg, 'user');
-            input.value = '';
-            
-            const loadingId = addBubble("⏳ AI 서버 깨우는 중... (약 30초 소요)", 'ai');
-            const loadingElement = document.getElementById(loadingId); 
-
-            const jobTitle = document.querySelector('.job-title') ? document.querySelector('.job-title').innerText : '합격자소서 분석';
-            const jobContent = document.querySelector('.content-body') ? document.querySelector('.content-body').innerText.substring(0, 1000) : ''; 
-
-            try {{
-                const res = await fetch('{render_server_url}', {{
-                    method: 'POST',
-                    headers: {{ 'Content-Type': 'application/json' }},
-                    body: JSON.stringify({{ 
-                        message: msg,
-                        context: `[현재 공고 정보]\\n기업명: {org_name}\\n공고제목: ${{jobTitle}}\\n공고내용요약: ${{jobContent}}...`
-                    }})
-                }});
-                const data = await res.json();
-                if (loadingElement) {{ loadingElement.innerHTML = data.response.replace(/\\n/g, '<br>'); }}
-            }} catch (err) {{
-                if (loadingElement) {{ loadingElement.innerText = "⚠ 서버 연결 실패 (네트워크를 확인하세요)"; }}
-            }}
-        }}
-
-        function addBubble(text, type) {{
-            const box = document.getElementById('chat-messages');
-            const div = document.createElement('div');
-            div.className = `msg msg-${{type}}`;
-            div.id = 'msg-' + Date.now();
-            div.innerHTML = text.replace(/\\n/g, '<br>');
-            box.appendChild(div);
-            box.scrollTop = box.scrollHeight;
-            return div.id; 
-        }}
-
-        dragElement(document.getElementById("chatbot-window"));
-        function dragElement(elmnt) {{
-            var pos1 = 0, pos2 = 0, pos3 = 0, pos4 = 0;
-            if (document.getElementById("chatHeader")) {{ document.getElementById("chatHeader").onmousedown = dragMouseDown; }}
-            function dragMouseDown(e) {{ e = e || window.event; e.preventDefault(); pos3 = e.clientX; pos4 = e.clientY; document.onmouseup = closeDragElement; document.onmousemove = elementDrag; }}
-            function elementDrag(e) {{ e = e || window.event; e.preventDefault(); pos1 = pos3 - e.clientX; pos2 = pos4 - e.clientY; pos3 = e.clientX; pos4 = e.clientY; elmnt.style.top = (elmnt.offsetTop - pos2) + "px"; elmnt.style.left = (elmnt.offsetLeft - pos1) + "px"; }}
-            function closeDragElement() {{ document.onmouseup = null; document.onmousemove = null; }}
-        }}
-    </script>
+    <script id="page-data" type="application/json">{page_data}</script>
+    <script src="{js_file}"></script>
 </body>
 </html>
 """
 
+# ==========================================
+# 3-1. 공고 페이지 공용 CSS / JS (static/ 에 해시 파일명으로 한 번만 저장, 페이지는 링크만)
+# ==========================================
+JOB_CSS = """
+:root { --navy: #0f172a; --gold: #d4af37; --bg: #f8fafc; --text: #334155; --sidebar-w: 480px; }
+* { box-sizing: border-box; }
+body { font-family: 'Pretendard', sans-serif; background: var(--bg); color: var(--text); margin: 0; display: flex; height: 100vh; overflow: hidden; }
+
+.sidebar { width: var(--sidebar-w); background: white; border-right: 1px solid #cbd5e1; display: flex; flex-direction: column; height: 100%; padding: 25px; z-index: 100; flex-shrink: 0; }
+.main-content { flex: 1; padding: 40px; overflow-y: auto; position: relative; background: #f8fafc; }
+
+.home-link-btn { display: block; text-align: center; background: var(--navy); color: white; padding: 12px; border-radius: 8px; text-decoration: none; font-weight: 700; margin-bottom: 20px; }
+
+/* [소장님 지시] 사이드바 디자인 혁신: 18px 대왕 글자 & 중복 제거 */
+.db-card { 
+    background: white; border: 1px solid #e2e8f0; border-radius: 12px; 
+    padding: 20px; margin-bottom: 15px; transition: 0.2s; position: relative; cursor: pointer;
+}
+.db-card:hover { border-color: var(--gold); transform: translateY(-3px); box-shadow: 0 4px 12px rgba(0,0,0,0.05); }
+
+/* [소장님 지시] 일치율 배지 */
+.match-badge { 
+    display: inline-block; background: #fee2e2; color: #ef4444; 
+    padding: 5px 12px; border-radius: 20px; font-weight: 800; 
+    font-size: 14px; margin-bottom: 12px; border: 1px solid #fecaca;
+}
+
+/* [소장님 지시] 사이드바 텍스트 18px */
+.db-text { 
+    font-size: 18px; line-height: 1.6; color: #334155; 
+    word-break: break-all;
+}
+
+/* [소장님 지시] 중앙 확대 리포트 스타일 (22px) */
+.full-report-view {
+    background: white; padding: 60px; border-radius: 20px; box-shadow: 0 10px 30px rgba(0,0,0,0.05);
+    font-size: 22px; line-height: 2.0; color: #1e293b;
+}
+.full-report-title {
+    font-size: 28px; font-weight: 800; color: var(--navy); 
+    border-bottom: 3px solid #e2e8f0; padding-bottom: 20px; margin-bottom: 40px;
+}
+.back-btn {
+    display: inline-block; margin-bottom: 20px; padding: 10px 20px; 
+    background: #e2e8f0; color: #475569; border-radius: 30px; 
+    font-weight: bold; cursor: pointer; font-size: 16px; border: none;
+}
+.back-btn:hover { background: #cbd5e1; }
+
+.ai-ask-btn { display: none; } /* 사이드바에서는 텍스트 클릭 유도를 위해 버튼 숨김 (카드 전체 클릭) */
+
+.ai-preview-box { background: #fffbeb; border: 2px dashed #f59e0b; border-radius: 12px; padding: 25px; margin-bottom: 30px; position: relative; }
+.ai-tag { background: #f59e0b; color: white; padding: 4px 10px; border-radius: 5px; font-size: 0.75rem; font-weight: bold; position: absolute; top: -12px; left: 20px; }
+.action-quote { font-size: 1.05rem; font-weight: 800; color: #1e40af; border-left: 5px solid #2563eb; padding-left: 15px; margin-top: 20px; line-height: 1.5; }
+.cta-link { display: inline-block; margin-top: 15px; color: #2563eb; font-weight: bold; text-decoration: underline; cursor: pointer; }
+.ai-insight { display: none; margin-top: 20px; background: white; border: 1px solid #fde68a; border-radius: 10px; padding: 20px; line-height: 1.7; color: #1e293b; }
+.ai-insight-title { font-weight: 800; color: var(--navy); margin-bottom: 10px; }
+
+.news-container { margin: 30px 0; background: white; border-radius: 15px; padding: 25px; box-shadow: 0 4px 15px rgba(0,0,0,0.03); border: 1px solid #e2e8f0; }
+.news-header { font-size: 1.3rem; font-weight: 800; color: var(--navy); margin-bottom: 15px; display: flex; align-items: center; justify-content: space-between; border-bottom: 2px solid #f1f5f9; padding-bottom:10px; }
+.news-scroll-box { max-height: 400px; overflow-y: auto; padding-right: 10px; }
+.news-scroll-box::-webkit-scrollbar { width: 6px; }
+.news-scroll-box::-webkit-scrollbar-thumb { background: #cbd5e1; border-radius: 3px; }
+.news-item { display: flex; justify-content: space-between; align-items: flex-start; padding: 12px 0; border-bottom: 1px dashed #e2e8f0; }
+.news-item:last-child { border-bottom: none; }
+.news-info { flex: 1; }
+.news-title { font-size: 0.95rem; font-weight: bold; color: #333; text-decoration: none; display: block; margin-bottom: 4px; line-height: 1.4; }
+.news-title:hover { text-decoration: underline; color: #2563eb; }
+.news-date { font-size: 0.75rem; color: #94a3b8; background: #f8fafc; padding: 2px 6px; border-radius: 4px; }
+.news-ai-btn { background: white; color: #d97706; border: 1px solid #d97706; padding: 6px 12px; border-radius: 20px; font-size: 0.75rem; font-weight: bold; cursor: pointer; margin-left: 10px; white-space: nowrap; transition: 0.2s; }
+.news-ai-btn:hover { background: #fffbeb; transform: translateY(-2px); }
+
+.highlight { background-color: #fef08a; font-weight: 900; border-bottom: 3px solid #facc15; padding: 0 2px; }
+
+.job-card { background: white; border-radius: 15px; padding: 50px; box-shadow: 0 4px 20px rgba(0,0,0,0.05); max-width: 900px; margin: 0 auto; }
+.job-title { font-size: 2rem; color: var(--navy); margin: 10px 0 20px 0; font-weight: 800; }
+.keyword-chip { background: #f1f5f9; border: 1px solid #cbd5e1; padding: 8px 16px; border-radius: 50px; margin: 5px; display: inline-block; font-weight: 600; cursor: pointer; }
+.custom-search-box { display: inline-flex; align-items: center; margin-left: 10px; gap: 5px; }
+.custom-search-box input { padding: 8px 12px; border: 1px solid #cbd5e1; border-radius: 20px; outline: none; font-size: 14px; width: 180px; }
+.custom-search-box button { padding: 8px 15px; background: var(--navy); color: white; border: none; border-radius: 20px; cursor: pointer; font-weight: bold; }
+.content-body { font-size: 0.95rem; line-height: 1.8; color: #334155; margin-top: 30px; }
+
+#chatbot-bubble { position: fixed; bottom: 95px; right: 30px; background: white; padding: 10px 15px; border-radius: 15px; box-shadow: 0 4px 15px rgba(0,0,0,0.1); border: 1px solid #2563eb; font-size: 13px; font-weight: bold; color: #1e40af; z-index: 9998; animation: float 3s ease-in-out infinite; cursor: pointer; }
+#chatbot-bubble::after { content: ''; position: absolute; bottom: -8px; right: 25px; border-width: 8px 8px 0; border-style: solid; border-color: #2563eb transparent transparent transparent; }
+@keyframes float { 0% {transform: translateY(0);} 50% {transform: translateY(-10px);} 100% {transform: translateY(0);} }
+#chatbot-floater { position: fixed; bottom: 30px; right: 30px; width: 60px; height: 60px; background: linear-gradient(135deg, #2563eb, #1e40af); border-radius: 50%; box-shadow: 0 4px 15px rgba(37, 99, 235, 0.4); cursor: pointer; z-index: 9999; display: flex; align-items: center; justify-content: center; transition: transform 0.2s; }
+#chatbot-floater:hover { transform: scale(1.1); }
+#chatbot-window { display: none; position: fixed; bottom: 100px; right: 30px; width: 360px; height: 520px; background: white; border-radius: 16px; box-shadow: 0 10px 40px rgba(0,0,0,0.2); z-index: 10000; flex-direction: column; border: 1px solid #e2e8f0; overflow: hidden; }
+.chat-header { background: #2563eb; color: white; padding: 15px; font-weight: bold; display: flex; justify-content: space-between; align-items: center; cursor: move; }
+#chat-messages { flex: 1; padding: 15px; overflow-y: auto; background: #f8fafc; display: flex; flex-direction: column; gap: 10px; }
+.msg { max-width: 85%; padding: 10px 14px; border-radius: 12px; font-size: 14px; line-height: 1.5; word-break: break-word; }
+.msg-user { align-self: flex-end; background: #2563eb; color: white; border-bottom-right-radius: 2px; }
+.msg-ai { align-self: flex-start; background: white; border: 1px solid #e2e8f0; color: #1e293b; border-bottom-left-radius: 2px; }
+.chat-input-area { padding: 10px; border-top: 1px solid #e2e8f0; background: white; display: flex; gap: 5px; }
+.chat-input-area input { flex: 1; padding: 12px; border: 1px solid #e2e8f0; border-radius: 20px; outline: none; }
+.chat-input-area button { background: #2563eb; color: white; border: none; padding: 0 15px; border-radius: 20px; font-weight: bold; cursor: pointer; }
+
+@media (max-width: 1024px) {
+    .sidebar { display: none; }
+    body { flex-direction: column; overflow: auto; }
+}
+"""
+
+JOB_JS = """
+const PAGE = JSON.parse(document.getElementById('page-data').textContent); // 페이지별 값 (기관명, 서버 주소 등)
+// 합격 DB 는 db/index.json (키워드 → 샤드 파일) 을 먼저 읽고, 필요한 샤드만 내려받음
+// - 처음: 기본 샤드 1개 / 키워드 칩: 해당 키워드 샤드 1개 / 자유 검색: 전체 청크를 50건 찾을 때까지 순서대로
+const DB_BASE = "db/";
+const shardCache = {};
+let dbIndexPromise = null;
+let renderSeq = 0;
+
+function loadDbIndex() {
+    if (!dbIndexPromise) {
+        dbIndexPromise = fetch(DB_BASE + "index.json", { cache: "no-cache" }).then(res => res.json());
+    }
+    return dbIndexPromise;
+}
+
+function loadShard(name) {
+    if (!shardCache[name]) {
+        shardCache[name] = fetch(DB_BASE + name).then(res => res.json());
+    }
+    return shardCache[name];
+}
+
+async function loadDbItems(filter) {
+    const index = await loadDbIndex();
+    if (!filter) return loadShard(index.sample);
+    if (index.keywords[filter]) return loadShard(index.keywords[filter]);
+    let found = [];
+    for (const chunk of index.chunks) {
+        const items = await loadShard(chunk);
+        found = found.concat(items.filter(item => item.title.includes(filter) || item.content.includes(filter)));
+        if (found.length >= 50) break;
+    }
+    return found;
+}
+const dbContainer = document.getElementById('dbContainer');
+const dbSearch = document.getElementById('dbSearch');
+const mainContentArea = document.getElementById('mainContentArea');
+let originalMainContent = ""; // 원래 공고 내용 저장용
+
+window.onload = function() {
+    showInsight(); // 공고 내용 백업 전에 채워 두어야 '돌아가기' 후에도 보임
+    originalMainContent = mainContentArea.innerHTML; // 초기 공고 내용 백업
+
+    loadDbItems("").then(sampleData => {
+        if(sampleData.length > 0) {
+            const randomItem = sampleData[Math.floor(Math.random() * sampleData.length)];
+            document.getElementById('aiSampleContent').innerText = randomItem.content.substring(0, 350) + "...";
+        }
+    }).catch(() => {});
+};
+
+// 빌드 때 미리 만들어 둔 AI 분석 (ai_insights.py). 있으면 서버 호출 없이 바로 표시
+function showInsight() {
+    if (!PAGE.insight) return;
+    const escaped = PAGE.insight.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+    document.getElementById('aiInsightText').innerHTML = escaped.replace(/\\*\\*(.+?)\\*\\*/g, '<strong>$1</strong>').replace(/\\n/g, '<br>');
+    document.getElementById('aiInsight').style.display = 'block';
+}
+
+async function renderDB(filter = "") {
+    const seq = ++renderSeq;
+    let dbData;
+    try {
+        dbData = await loadDbItems(filter);
+    } catch (e) {
+        dbContainer.innerHTML = "<div style='padding:10px;'>DB를 불러오지 못했습니다.</div>";
+        return;
+    }
+    if (seq !== renderSeq) return; // 입력 중 더 최근 검색이 시작됨
+    let filtered = dbData;
+    if (filter) {
+        filtered = dbData.filter(item => 
+            item.title.includes(filter) || item.content.includes(filter)
+        );
+    }
+    filtered = filtered.slice(0, 50); // 사이드바 성능 위해 50개 제한
+
+    if(filtered.length > 0) {
+        dbContainer.innerHTML = filtered.map((item, index) => {
+            // [소장님 지시] 사이드바: 500자 요약 노출 & 중복 제목 삭제 (본문만 표시)
+            // item.content는 전체 내용이므로 500자까지만 자름
+            let summaryContent = item.content.substring(0, 500) + "...";
+            let fullContent = item.content.replace(/'/g, "\\'"); // 클릭 시 전달할 전체 내용
+
+            if (filter) {
+                const regex = new RegExp(filter, "gi");
+                const highlightStr = `<span class="highlight">${filter}</span>`;
+                summaryContent = summaryContent.replace(regex, highlightStr);
+            }
+
+            // [소장님 지시] 클릭 시 showFullReport 함수 호출 (1200자 대왕 글자)
+            // [소장님 지시] 중복 제목 제거: 제목 div 아예 삭제하고 배지와 본문만 표시
+            return `
+            <div class="db-card" onclick="showFullReport('${fullContent}')">
+                <div class="match-badge">🎯 </div>
+                <div class="db-text">${summaryContent}</div>
+                <div style="text-align:right; margin-top:10px; color:#2563eb; font-size:0.8rem; font-weight:bold;">👉 클릭하여 전체보기 (확대)</div>
+            </div>`;
+        }).join('');
+    } else {
+        dbContainer.innerHTML = "<div style='padding:10px;'>검색 결과가 없습니다.</div>";
+    }
+}
+renderDB();
+
+// [소장님 지시] 클릭 시 중앙 화면을 22px 대왕 리포트로 교체하는 함수
+function showFullReport(fullText) {
+    // 중앙 영역 전체를 리포트 뷰로 교체
+    mainContentArea.innerHTML = `
+        <div class="full-report-view">
+            <button class="back-btn" onclick="restoreOriginalContent()">↩ 공고문으로 돌아가기</button>
+            <div class="full-report-title">📄 합격 자기소개서 심층 분석 (전문)</div>
+            <div style="white-space: pre-wrap;">${fullText}</div>
+            <div style="margin-top:50px; border-top:2px dashed #e2e8f0; padding-top:30px; text-align:center;">
+                <p style="font-size:18px; color:#64748b;">이 데이터는 합격 데이터입니다.</p>
+                <a href="${PAGE.consult_link}" target="_blank" style="background:var(--gold); color:white; padding:15px 30px; border-radius:30px; text-decoration:none; font-weight:bold; font-size:18px;">⚡ AI시대 자소서의 기준이 문잔력에서 실제 행동으로 바뀌었습니다.</a>
+            </div>
+        </div>
+    `;
+    // 상단으로 스크롤 이동
+    mainContentArea.scrollTop = 0;
+}
+
+function restoreOriginalContent() {
+    mainContentArea.innerHTML = originalMainContent;
+}
+
+function searchDB(keyword) { dbSearch.value = keyword; renderDB(keyword); }
+function manualSearch() { const val = document.getElementById('manualKeyword').value; if(val) { searchDB(val); alert("왼쪽 사이드바에서 결과를 확인하세요!"); } }
+dbSearch.addEventListener('input', (e) => { renderDB(e.target.value); });
+
+function toggleChat() {
+    const win = document.getElementById('chatbot-window');
+    const bubble = document.getElementById('chatbot-bubble');
+    if (win.style.display === 'none' || win.style.display === '') {
+        win.style.display = 'flex'; bubble.style.display = 'none'; document.getElementById('chatInput').focus();
+    } else {
+        win.style.display = 'none'; bubble.style.display = 'block';
+    }
+}
+
+/* ========== [여기로 붙여넣으세요] ========== */
+function askAiAboutNews(title, date) {
+    const win = document.getElementById('chatbot-window');
+    const bubble = document.getElementById('chatbot-bubble');
+    if(win) win.style.display = 'flex'; 
+    if(bubble) bubble.style.display = 'none';
+
+    // 1. 사용자에게 보여줄 안내 멘트 (채팅창에 기록됨)
+    const displayMsg = "📢 선택하신 뉴스 [" + title + "]를 기반으로 합격 지원동기를 분석하고 있습니다.";
+    addBubble(displayMsg, 'user');
+
+    // 2. AI에게만 전달할 비밀 지시사항 (채팅창 노출 안 됨)
+    // 기업명은 페이지 데이터(PAGE.org_name)에서 읽습니다.
+    const secretMsg = `[뉴스 기반 지원동기 작성 요청] \n기업명: ${PAGE.org_name}\n뉴스 제목: ` + title + `\n뉴스 날짜: ` + date + `\n\n1. 위 뉴스 내용을 기업의 사업 방향과 연결하여 전문적인 비즈니스 문체로 '지원동기' 초안을 작성해줘.\n2. 답변 마지막에 'AI 채용 도입으로 인해 합격 자소서의 평가 기준이 행동(Action) 중심으로 바뀌고 있습니다. 더 정교한 합격을 원하시면 전문가의 행동 중심 자소서 첨삭을 받아보세요.'라는 문구를 추가해줘.`;
+
+    // 3. 로딩 표시
+    const loadingId = addBubble("⏳ 분석 전략 수립 중... (약 30초 소요)", 'ai');
+    const loadingElement = document.getElementById(loadingId); 
+
+    // 4. 서버와 직접 통신 (비밀 메시지 전송)
+    const jobTitle = document.querySelector('.job-title') ? document.querySelector('.job-title').innerText : '공고 분석';
+    const jobContent = document.querySelector('.content-body') ? document.querySelector('.content-body').innerText.substring(0, 1000) : ''; 
+
+    streamChat({
+        message: secretMsg,
+        context: `[현재 공고 정보]\\n기업명: ${PAGE.org_name}\\n공고제목: ${jobTitle}\\n공고내용요약: ${jobContent}...`
+    }, loadingElement)
+    .catch(err => {
+        if (loadingElement) { loadingElement.innerText = "⚠ 서버 연결 지연. 잠시 후 다시 시도해 주세요."; }
+    });
+}
+async function sendMsg() {
+    const input = document.getElementById('chatInput');
+    const msg = input.value.trim();
+    if (!msg) return;
+    addBubble(msg, 'user');
+    input.value = '';
+
+    const loadingId = addBubble("⏳ AI 서버 깨우는 중... (약 30초 소요)", 'ai');
+    const loadingElement = document.getElementById(loadingId); 
+
+    const jobTitle = document.querySelector('.job-title') ? document.querySelector('.job-title').innerText : '합격자소서 분석';
+    const jobContent = document.querySelector('.content-body') ? document.querySelector('.content-body').innerText.substring(0, 1000) : ''; 
+
+    try {
+        await streamChat({
+            message: msg,
+            context: `[현재 공고 정보]\\n기업명: ${PAGE.org_name}\\n공고제목: ${jobTitle}\\n공고내용요약: ${jobContent}...`
+        }, loadingElement);
+    } catch (err) {
+        if (loadingElement) { loadingElement.innerText = "⚠ 서버 연결 실패 (네트워크를 확인하세요)"; }
+    }
+}
+
+// [스트리밍] /chat/stream (SSE) 으로 토큰이 도착하는 대로 말풍선에 그립니다.
+// 스트리밍을 못 쓰는 환경이면 기존 /chat (JSON) 으로 한 번 더 요청합니다.
+async function streamChat(payload, targetElement) {
+    const box = document.getElementById('chat-messages');
+    let answer = '';
+    try {
+        const res = await fetch(PAGE.render_server_url + '/stream', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(payload)
+        });
+        if (!res.ok || !res.body) throw new Error('stream unavailable');
+
+        const reader = res.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+            const events = buffer.split('\\n\\n');
+            buffer = events.pop();
+            for (const evt of events) {
+                const line = evt.split('\\n').find(l => l.startsWith('data: '));
+                if (!line) continue;
+                const data = JSON.parse(line.slice(6));
+                if (!data.token) continue;
+                answer += data.token;
+                if (targetElement) { targetElement.innerHTML = answer.replace(/\\n/g, '<br>'); }
+                box.scrollTop = box.scrollHeight;
+            }
+        }
+    } catch (err) {
+        // 스트림 도중 끊겨도 이미 받은 토큰은 그대로 둠
+    }
+    if (answer) return;
+
+    const res = await fetch(PAGE.render_server_url, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify(payload)
+    });
+    const data = await res.json();
+    if (targetElement) { targetElement.innerHTML = data.response.replace(/\\n/g, '<br>'); }
+}
+
+function addBubble(text, type) {
+    const box = document.getElementById('chat-messages');
+    const div = document.createElement('div');
+    div.className = `msg msg-${type}`;
+    div.id = 'msg-' + Date.now();
+    div.innerHTML = text.replace(/\\n/g, '<br>');
+    box.appendChild(div);
+    box.scrollTop = box.scrollHeight;
+    return div.id; 
+}
+
+dragElement(document.getElementById("chatbot-window"));
+function dragElement(elmnt) {
+    var pos1 = 0, pos2 = 0, pos3 = 0, pos4 = 0;
+    if (document.getElementById("chatHeader")) { document.getElementById("chatHeader").onmousedown = dragMouseDown; }
+    function dragMouseDown(e) { e = e || window.event; e.preventDefault(); pos3 = e.clientX; pos4 = e.clientY; document.onmouseup = closeDragElement; document.onmousemove = elementDrag; }
+    function elementDrag(e) { e = e || window.event; e.preventDefault(); pos1 = pos3 - e.clientX; pos2 = pos4 - e.clientY; pos3 = e.clientX; pos4 = e.clientY; elmnt.style.top = (elmnt.offsetTop - pos2) + "px"; elmnt.style.left = (elmnt.offsetLeft - pos1) + "px"; }
+    function closeDragElement() { document.onmouseup = null; document.onmousemove = null; }
+}
+"""
+
 # ==========================================
 # 4. 크롤링 및 파일 생성 로직 (원본 유지 + 뉴스 통합)
 # ==========================================
+_history = None
+
 def load_history():
-    if not os.path.exists(HISTORY_FILE): return []
-    with open(HISTORY_FILE, 'r', encoding='utf-8') as f: return f.read().splitlines()
+    # 실행 중 한 번만 열어 두고 재사용 (조회 O(1), 첫 실행 때 saved_history.txt 가져옴)
+    global _history
+    if _history is None:
+        _history = HistoryStore(HISTORY_LOG, "alio", legacy_files=[HISTORY_FILE])
+    return _history
 
 def save_history(job_id):
-    with open(HISTORY_FILE, 'a', encoding='utf-8') as f: f.write(job_id + "\n")
+    load_history().add(job_id)
+
+_manifest = None
+_insight_jobs = None  # AI 분석을 켠 실행에서만 목록 — 이번에 만든 (상세, 뉴스) 를 모아 두었다가 분석을 넣어 다시 저장
+
+def load_manifest():
+    global _manifest
+    if _manifest is None:
+        _manifest = PageManifest(MANIFEST_FILE, SAVE_DIR)
+    return _manifest
+
+# 목록 페이지에서는 상세 공고 링크(<a href="...recruitview.do?...idx=...">)만 트리로 만듦
+JOB_LINK_STRAINER = SoupStrainer('a', href=lambda href: bool(href) and 'recruitview.do' in href and 'idx=' in href)
 
-def get_job_urls_from_page(page_num):
+def parse_job_urls(html):
+    urls = []
+    soup = make_soup(html, parse_only=JOB_LINK_STRAINER)
+    for link in soup.find_all('a', href=True):
+        if 'recruitview.do' in link['href'] and 'idx=' in link['href']:
+            full_url = link['href'] if link['href'].startswith("http") else "https://job.alio.go.kr" + link['href']
+            urls.append(full_url)
+    return urls
+
+def get_job_urls_from_page(page_num, limiter=None):
     urls = []
     try:
-        res = requests.get(f"https://job.alio.go.kr/recruit.do?pageNo={page_num}", headers=HEADERS, timeout=10)
-        soup = BeautifulSoup(res.text, 'html.parser')
-        for link in soup.find_all('a', href=True):
-            if 'recruitview.do' in link['href'] and 'idx=' in link['href']:
-                full_url = link['href'] if link['href'].startswith("http") else "https://job.alio.go.kr" + link['href']
-                urls.append(full_url)
+        list_url = f"https://job.alio.go.kr/recruit.do?pageNo={page_num}"
+        if limiter: limiter.acquire(list_url)
+        res = HTTP_CACHE.get(list_url, headers=HEADERS, timeout=10)
+        urls = parse_job_urls(res.text)
     except: pass
     return list(set(urls))
 
-def create_job_page(url):
+def parse_job_id(url):
     try:
         parsed = urllib.parse.urlparse(url)
-        job_id = urllib.parse.parse_qs(parsed.query)['idx'][0]
-    except: return False
+        return urllib.parse.parse_qs(parsed.query)['idx'][0]
+    except: return None
+
+def fetch_job_detail(url, job_id, limiter=None):
+    # 상세 페이지 요청 + 파싱. 기관명/제목이 없으면 None
+    if limiter: limiter.acquire(url)
+    res = HTTP_CACHE.get(url, headers=HEADERS, timeout=10)
+    return parse_job_detail(res.content, url, job_id)
+
+def parse_job_detail(content, url, job_id):
+    # 본문 HTML 을 그대로 페이지에 넣으므로 keep_markup (항상 html.parser)
+    soup = make_soup(content, keep_markup=True, from_encoding='utf-8')
     
-    if job_id in load_history(): return False
-
-    print(f"🔄 [신규수집] ID: {job_id} 데이터 요청 중...")
     try:
-        res = requests.get(url, headers=HEADERS, timeout=10)
-        soup = BeautifulSoup(res.content, 'html.parser', from_encoding='utf-8')
-        
-        try:
-            org_name = soup.select_one('.topInfo h2').text.strip()
-            title = soup.select_one('.titleH2').text.strip()
-        except: return False
-        
-        safe_name = "".join([c for c in org_name if c.isalnum()])
-        filename = f"{SAVE_DIR}/{job_id}_{safe_name}.html"
-        
-        if os.path.exists(filename): return False
+        org_name = soup.select_one('.topInfo h2').text.strip()
+        title = soup.select_one('.titleH2').text.strip()
+    except: return None
 
-        try:
-            end_date = "별도 확인"
-            for td in soup.select('td'):
-                if "2025" in td.text or "2026" in td.text:
-                    end_date = td.text.strip()
-                    break
-        except: end_date = "공고문 참조"
-
-        content_html = soup.select_one('#tab-1')
-        content = str(content_html) if content_html else "<p>상세 내용은 원문 참조</p>"
-        content_text = content_html.text if content_html else ""
-
-        keywords = extract_keywords_from_text(content_text)
-        keyword_chips_html = ""
-        for kw in keywords:
-            keyword_chips_html += f'<span class="keyword-chip" onclick="searchDB(\'{kw}\')">#{kw}</span>'
-        
-        news_items = get_google_news(org_name)
-        news_area_html = ""
-        if news_items:
-            for n in news_items:
-                clean_n_title = n['title'].replace("'", "").replace('"', "")
-                news_area_html += f"""
+    try:
+        end_date = "별도 확인"
+        for td in soup.select('td'):
+            if "2025" in td.text or "2026" in td.text:
+                end_date = td.text.strip()
+                break
+    except: end_date = "공고문 참조"
+
+    content_html = soup.select_one('#tab-1')
+    return {
+        "job_id": job_id,
+        "url": url,
+        "org_name": org_name,
+        "title": title,
+        "end_date": end_date,
+        "content": str(content_html) if content_html else "<p>상세 내용은 원문 참조</p>",
+        "content_text": content_html.text if content_html else "",
+    }
+
+def job_filename(detail):
+    safe_name = "".join([c for c in detail['org_name'] if c.isalnum()])
+    return f"{SAVE_DIR}/{detail['job_id']}_{safe_name}.html"
+
+def render_job_page(detail, news_items, insight=None):
+    keywords = extract_keywords_from_text(detail['content_text'])
+    keyword_chips_html = ""
+    for kw in keywords:
+        keyword_chips_html += f'<span class="keyword-chip" onclick="searchDB(\'{kw}\')">#{kw}</span>'
+    
+    news_area_html = ""
+    if news_items:
+        for n in news_items:
+            clean_n_title = n['title'].replace("'", "").replace('"', "")
+            news_area_html += f"""
                 <div class="news-item">
                     <div class="news-info">
                         <a href="{n['link']}" target="_blank" class="news-title">{n['title']}</a>
@@ -566,57 +689,182 @@ def create_job_page(url):
                     <button class="news-ai-btn" onclick="askAiAboutNews('{clean_n_title}', '{n['date']}')">⚡ AI 지원동기 작성</button>
                 </div>
                 """
-        else:
-            news_area_html = "<div style='padding:15px; text-align:center; color:#64748b;'>최근 뉴스가 없거나 수집하지 못했습니다.</div>"
-
-        html = JOB_TEMPLATE.format(
-            org_name=org_name, title=title, end_date=end_date, content=content,
-            consult_link=MY_CONSULTING_LINK, home_link=MY_HOME_LINK, 
-            original_url=url, keyword_chips=keyword_chips_html,
-            render_server_url=RENDER_SERVER_URL,
-            job_id=job_id,
-            news_area=news_area_html 
-        )
-        
-        with open(filename, 'w', encoding='utf-8') as f: f.write(html)
-        save_history(job_id)
-        print(f"    ✅ 생성 완료: {filename} (뉴스 {len(news_items)}개 포함)")
-        return True
+    else:
+        news_area_html = "<div style='padding:15px; text-align:center; color:#64748b;'>최근 뉴스가 없거나 수집하지 못했습니다.</div>"
+
+    page_data = {"org_name": detail['org_name'], "consult_link": MY_CONSULTING_LINK, "render_server_url": RENDER_SERVER_URL}
+    if insight: page_data["insight"] = insight
+    return JOB_TEMPLATE.format(
+        org_name=detail['org_name'], title=detail['title'], end_date=detail['end_date'], content=detail['content'],
+        consult_link=MY_CONSULTING_LINK, home_link=MY_HOME_LINK, 
+        original_url=detail['url'], keyword_chips=keyword_chips_html,
+        job_id=detail['job_id'],
+        news_area=news_area_html,
+        css_file=publish_asset(SAVE_DIR, "job.css", JOB_CSS),
+        js_file=publish_asset(SAVE_DIR, "job.js", JOB_JS),
+        page_data=inline_json(page_data),
+    )
+
+def save_job_page(detail, html):
+    filename = job_filename(detail)
+    with open(filename, 'w', encoding='utf-8') as f: f.write(html)
+    load_manifest().record(os.path.basename(filename), detail['job_id'], detail['org_name'], detail['title'], detail['end_date'], html)
+    return filename
+
+def write_job_page(detail, news_items):
+    filename = save_job_page(detail, render_job_page(detail, news_items))
+    save_history(detail['job_id'])
+    if _insight_jobs is not None: _insight_jobs.append((detail, news_items))
+    print(f"    ✅ 생성 완료: {filename} (뉴스 {len(news_items)}개 포함)")
+    return True
+
+def add_ai_insights(generator, jobs):
+    # 이번 실행에서 만든 페이지에 AI 분석을 넣어 다시 저장 (분석에 실패한 공고는 그대로 둠)
+    items = [ai_insights.insight_request(d['org_name'], d['title'], d['content_text']) for d, _ in jobs]
+    added = 0
+    for (detail, news_items), insight in zip(jobs, generator.generate(items)):
+        if not insight: continue
+        save_job_page(detail, render_job_page(detail, news_items, insight))
+        added += 1
+    print(f"    ✅ AI 분석 포함: {added}/{len(jobs)}개 페이지")
+
+def create_job_page(url):
+    job_id = parse_job_id(url)
+    if job_id is None: return False
+    
+    if job_id in load_history(): return False
+
+    print(f"🔄 [신규수집] ID: {job_id} 데이터 요청 중...")
+    try:
+        detail = fetch_job_detail(url, job_id)
+        if detail is None: return False
+        if os.path.exists(job_filename(detail)): return False
+
+        news_items = get_google_news(detail['org_name'])
+        return write_job_page(detail, news_items)
 
     except Exception as e:
         print(f"    ❌ 실패: {e}")
         return False
 
 # ==========================================
-# 5. 메인 실행 루프 (원본 유지)
+# 5. 파이프라인 수집 (목록 스캔 → 상세 요청 → 뉴스 요청 동시 진행)
 # ==========================================
-if __name__ == "__main__":
-    print(f"🤖 김진호 합격연구소 로봇 가동 (목표: 신규 {TARGET_NEW_FILES}개)")
-    
-    export_db_to_js()
-    
+# - 목록 스캔 스레드가 신규 공고를 찾는 즉시 상세 요청을 스레드 풀에 넣고,
+#   상세 파싱이 끝나면 곧바로 뉴스 RSS 요청을 뉴스 풀에 넣습니다.
+# - 대기열(pending)은 크기가 정해져 있어 파일 작성이 밀리면 스캔도 멈춥니다.
+# - 파일은 목록 순서대로만 작성하므로 순차 모드와 같은 공고가 같은 내용으로 생성됩니다.
+# - 목표(TARGET_NEW_FILES)에 도달하면 아직 시작하지 않은 요청은 모두 취소합니다.
+# - 동시에 진행 중인 상세 요청 + 이미 만든 파일 수가 목표를 넘지 않도록 자리(slots)를 나눠 줍니다.
+#   파일을 만들지 못한 공고(상세 없음/이미 있음/실패)의 자리만 돌려받아 다음 공고에 씀
+#   → 목표를 채운 뒤에 쓰지도 않을 상세/뉴스를 미리 받아 두는 일이 없음
+PIPELINE_WORKERS = 6
+HOST_RATE_PER_SEC = 4.0   # 사이트(호스트)별 초당 요청 수 (기존 1초 대기를 대신함)
+HOST_BURST = 4
+
+def run_sequential(target):
     new_files_count = 0
     page = 1
     
-    while new_files_count < TARGET_NEW_FILES and page <= 200:
-        print(f"\n📄 잡알리오 {page}페이지 스캔 중... (현재 신규: {new_files_count}/{TARGET_NEW_FILES})")
+    while new_files_count < target and page <= 200:
+        print(f"\n📄 잡알리오 {page}페이지 스캔 중... (현재 신규: {new_files_count}/{target})")
         urls = get_job_urls_from_page(page)
         if not urls: break
         
         for url in urls:
-            if new_files_count >= TARGET_NEW_FILES: break
+            if new_files_count >= target: break
             if create_job_page(url):
                 new_files_count += 1
                 time.sleep(1) 
         page += 1
         time.sleep(1)
-        
-    print("\n📋 jobs.html 목록 갱신 중...")
-    if os.path.exists(SAVE_DIR):
-        files = [f for f in os.listdir(SAVE_DIR) if f.endswith(".html") and not f.startswith("db_data")]
-        files.sort(key=lambda x: os.path.getmtime(os.path.join(SAVE_DIR, x)), reverse=True)
-        
-        list_html = """<!DOCTYPE html>
+    return new_files_count
+
+def run_pipeline(target, workers=PIPELINE_WORKERS):
+    history = load_history()
+    limiter = HostRateLimiter(rate=HOST_RATE_PER_SEC, burst=HOST_BURST)
+    detail_pool = ThreadPoolExecutor(max_workers=workers)
+    news_pool = ThreadPoolExecutor(max_workers=workers)
+    pending = queue.Queue(maxsize=workers * 2)  # (job_id, 상세 future) — 목록 순서 유지
+    stop = threading.Event()
+    slots = threading.Semaphore(target)
+    progress = {"new": 0}
+
+    def put(item):
+        # 대기열이 가득 차면 기다리되, 중단 신호가 오면 포기
+        while not stop.is_set():
+            try:
+                pending.put(item, timeout=0.2)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def fetch_job(url, job_id):
+        if stop.is_set(): return None, None
+        detail = fetch_job_detail(url, job_id, limiter)
+        if detail is None or stop.is_set(): return detail, None
+        return detail, news_pool.submit(get_google_news, detail['org_name'], limiter)
+
+    def scan():
+        submitted = set()
+        try:
+            for page in range(1, 201):
+                if stop.is_set(): return
+                print(f"\n📄 잡알리오 {page}페이지 스캔 중... (현재 신규: {progress['new']}/{target})")
+                urls = get_job_urls_from_page(page, limiter)
+                if not urls: return
+                for url in urls:
+                    job_id = parse_job_id(url)
+                    if job_id is None or job_id in history or job_id in submitted: continue
+                    submitted.add(job_id)
+                    while not slots.acquire(timeout=0.2):
+                        if stop.is_set(): return
+                    if stop.is_set(): return
+                    if not put((job_id, detail_pool.submit(fetch_job, url, job_id))): return
+        finally:
+            put(None)  # 스캔 종료 표시
+
+    scanner = threading.Thread(target=scan, daemon=True)
+    scanner.start()
+    try:
+        while progress["new"] < target:
+            item = pending.get()
+            if item is None: break
+            job_id, future = item
+            made = False
+            try:
+                if job_id in history: continue
+                print(f"🔄 [신규수집] ID: {job_id} 데이터 요청 중...")
+                detail, news_future = future.result()
+                if detail is None: continue
+                if os.path.exists(job_filename(detail)): continue
+                news_items = news_future.result() if news_future else get_google_news(detail['org_name'])
+                made = write_job_page(detail, news_items)
+                if made: progress["new"] += 1
+            except Exception as e:
+                print(f"    ❌ 실패: {e}")
+            finally:
+                if not made: slots.release()  # 파일을 만들지 못한 자리는 다음 공고에게
+    finally:
+        # 목표 달성(또는 스캔 종료) → 남은 작업 취소 후 정리
+        stop.set()
+        while True:
+            try:
+                item = pending.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None: item[1].cancel()
+        detail_pool.shutdown(wait=True, cancel_futures=True)
+        news_pool.shutdown(wait=True, cancel_futures=True)
+        scanner.join()
+    return progress["new"]
+
+# ==========================================
+# 6. 목록(jobs.html) / 사이트맵 생성 (manifest 최신순)
+# ==========================================
+def create_list_page(pages):
+    list_html = """<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
@@ -641,18 +889,19 @@ if __name__ == "__main__":
     <div class="search-container">
         <input type="text" id="jobSearch" placeholder="🔍 기업명 검색 (예: 한전, 공단, 병원...)">
         <div style="margin-top:10px; font-size:0.9rem; color:#64748b; font-weight:bold;">
-            현재 게시된 공고: <span style="color:#0f172a;">""" + str(len(files)) + """개</span>
+            현재 게시된 공고: <span style="color:#0f172a;">""" + str(len(pages)) + """개</span>
         </div>
     </div>
 
     <div id="jobList">
 """
-        
-        for f in files:
-            name = f.replace(".html", "").split("_", 1)[1] if "_" in f else f
-            list_html += f'<a href="{SAVE_DIR}/{f}" class="card" target="_blank"><h3>{name} 합격자소서 공개 & 행동중심 면접 전략</h3><p>🎯 전담 AI의 실시간 합격 전략 및 데이터 확인</p></a>'
-        
-        list_html += """
+    
+    list_html += "".join(
+        f'<a href="{SAVE_DIR}/{page["file"]}" class="card" target="_blank"><h3>{page["org"]} 합격자소서 공개 & 행동중심 면접 전략</h3><p>🎯 전담 AI의 실시간 합격 전략 및 데이터 확인</p></a>'
+        for page in pages
+    )
+    
+    list_html += """
     </div>
     <script>
         const searchInput = document.getElementById('jobSearch');
@@ -672,25 +921,68 @@ if __name__ == "__main__":
     </script>
 </body>
 </html>"""
-        
-        with open("jobs.html", "w", encoding="utf-8") as f: f.write(list_html)
+    
+    if not write_if_changed("jobs.html", list_html): print("    (변경 없음)")
 
-        print("\n🗺️ [SEO] 검색 로봇용 Sitemap 생성 중...")
-        sitemap_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
-        sitemap_content += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-        
-        sitemap_content += f'  <url><loc>{MY_HOME_LINK}</loc><priority>1.0</priority></url>\n'
-        sitemap_content += f'  <url><loc>{MY_HOME_LINK}/jobs.html</loc><priority>0.9</priority></url>\n'
+def create_sitemap(pages):
+    sitemap_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
+    sitemap_content += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    
+    sitemap_content += f'  <url><loc>{MY_HOME_LINK}</loc><priority>1.0</priority></url>\n'
+    sitemap_content += f'  <url><loc>{MY_HOME_LINK}/jobs.html</loc><priority>0.9</priority></url>\n'
+
+    # lastmod = 페이지 내용이 마지막으로 바뀐 날 (매일 전체가 '오늘'로 바뀌지 않도록)
+    sitemap_content += "".join(
+        f'  <url>\n    <loc>{MY_HOME_LINK}/{SAVE_DIR}/{page["file"]}</loc>\n    <lastmod>{page["updated"][:10]}</lastmod>\n    <priority>0.8</priority>\n  </url>\n'
+        for page in pages
+    )
+    
+    sitemap_content += '</urlset>'
+    
+    write_if_changed("sitemap.xml", sitemap_content)
+    print("✅ sitemap.xml 생성 완료! (네이버/구글 노출 준비 끝)")
 
-        today = datetime.now().strftime("%Y-%m-%d")
-        for f in files:
-            full_url = f"{MY_HOME_LINK}/{SAVE_DIR}/{f}"
-            sitemap_content += f'  <url>\n    <loc>{full_url}</loc>\n    <lastmod>{today}</lastmod>\n    <priority>0.8</priority>\n  </url>\n'
-        
-        sitemap_content += '</urlset>'
+# ==========================================
+# 7. 메인 실행 루프
+# ==========================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sequential", action="store_true", help="기존 순차 수집 (공고마다 1초 대기)")
+    parser.add_argument("--workers", type=int, default=PIPELINE_WORKERS, help="상세/뉴스 동시 요청 수")
+    parser.add_argument("--ai-insights", choices=["http", "stub", "off"], help="새 페이지에 AI 분석 미리 생성 (기본: 환경변수 AI_INSIGHTS, 없으면 끔)")
+    args = parser.parse_args()
+    insights = ai_insights.from_env(args.ai_insights, RENDER_SERVER_URL)
+    if insights: _insight_jobs = []
+
+    print(f"🤖 김진호 합격연구소 로봇 가동 (목표: 신규 {TARGET_NEW_FILES}개)")
+    
+    export_db_to_js()
+    
+    started = time.time()
+    try:
+        if args.sequential:
+            new_files_count = run_sequential(TARGET_NEW_FILES)
+        else:
+            new_files_count = run_pipeline(TARGET_NEW_FILES, workers=args.workers)
+        if insights and _insight_jobs:
+            print(f"\n🧠 새 페이지 {len(_insight_jobs)}개에 AI 분석 추가 중...")
+            add_ai_insights(insights, _insight_jobs)
+    finally:
+        load_history().close()  # 모아 둔 이력 기록
+        load_manifest().save()
+    print(f"\n⏱️ 신규 {new_files_count}개 수집 완료 ({time.time() - started:.1f}초)")
         
-        with open("sitemap.xml", "w", encoding="utf-8") as f:
-            f.write(sitemap_content)
-        print("✅ sitemap.xml 생성 완료! (네이버/구글 노출 준비 끝)")
+    print("\n📋 jobs.html 목록 갱신 중...")
+    if os.path.exists(SAVE_DIR):
+        # 폴더를 훑지 않고 manifest 만 읽음 (최신순)
+        pages = load_manifest().newest_first()
+        create_list_page(pages)
+
+        print("\n🗺️ [SEO] 검색 로봇용 Sitemap 생성 중...")
+        create_sitemap(pages)
 
+    HTTP_CACHE.report("main")
+    HTTP_CACHE.client.report("main")
+    HTTP_CACHE.prune()
+    if insights: insights.report("main")
     print(f"\n🎉 작업 끝! 오늘 새로 만든 파일: {new_files_count}개")
\ No newline at end of file
@@ -1,13 +1,18 @@
-import requests
-from bs4 import BeautifulSoup
 import os
+import argparse
 import time
 import urllib.parse
-from datetime import datetime
 import random
 import json
 import re
 from collections import Counter
+from keyword_matcher import KeywordMatcher
+from db_shards import export_shards
+from static_assets import publish_asset, inline_json
+from page_manifest import PageManifest, write_if_changed, content_hash
+from http_cache import HttpCache
+from html_parser import make_soup, parse_google_news
+import ai_insights
 
 # ==========================================
 # 1. 설정 영역 (사기업 전용)
@@ -17,8 +22,25 @@ MY_HOME_LINK = "https://kimjinholab.pages.dev"
 SAVE_DIR = "jobs_private_html"           # 저장 폴더
 LIST_FILENAME = "jobs_private.html"      # 목록 파일
 SITEMAP_FILENAME = "sitemap_private.xml" # 사이트맵 파일
-HISTORY_FILE = "private_history.txt"     # 히스토리 파일
+HISTORY_FILE = "private_history.txt"     # 히스토리 파일 (사용 안 함: 이미 만든 공고는 manifest 의 source_hash 로 판단)
 JSON_DB_PATH = "./JOBS/recruit_data.json"  # collector.py 결과물
+MANIFEST_FILE = "jobs_private_manifest.json"  # 생성 페이지 목록 (목록/사이트맵의 원본)
+# [증분 모드] 이미 만든 공고의 상세 본문은 이 기간 동안 캐시로 확인 (네트워크 요청 없음)
+RECHECK_SECONDS = 3 * 86400
+# 예전 순번 ID 페이지 (P1_회사.html). 지금 ID 는 인크루트 공고번호(13자리) 또는 12자리 해시
+LEGACY_PAGE_RE = re.compile(r"^P\d{1,6}_.*\.html$")
+# 예전 주소 → 새 주소 안내 페이지 (검색엔진은 즉시 meta refresh + canonical 을 영구 이동으로 처리)
+REDIRECT_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <title>{title}</title>
+    <link rel="canonical" href="{url}">
+    <meta http-equiv="refresh" content="0; url={target}">
+</head>
+<body><a href="{target}">이 공고는 새 주소로 옮겨졌습니다 →</a></body>
+</html>
+"""
 
 # ★★★ [중요] 24시간 가동되는 소장님의 Render 서버 주소 ★★★
 RENDER_SERVER_URL = "https://jinho-lab-bot.onrender.com/chat"
@@ -27,6 +49,8 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 }
 
+HTTP_CACHE = HttpCache()  # 실행 간 재사용되는 조건부 GET 캐시 (.http_cache)
+
 # ==========================================
 # 2. DB 분할 저장 로직 (원본 유지)
 # ==========================================
@@ -70,18 +94,19 @@ def export_db_to_js():
     
     print(f"✅ [시스템] DB 분할 완료: 총 {len(formatted_data)}건")
 
+    # 새 페이지는 db/ 아래 샤드만 필요한 만큼 받음 (db_data1/2.js 는 예전 페이지용으로 유지)
+    export_shards(formatted_data, SAVE_DIR, TARGET_KEYWORDS.keywords)
+
+# 기업 핵심 역량 사전 (한 번만 컴파일, 본문은 한 번만 훑음)
+TARGET_KEYWORDS = KeywordMatcher([
+    "소통", "협력", "도전", "책임", "열정", "창의", "혁신", "성장", "분석", 
+    "팀워크", "신뢰", "고객", "문제해결", "리더십", "글로벌", "전문성", 
+    "실행", "윤리", "안전", "배려", "성실", "끈기"
+])
+
 def extract_keywords_from_text(text):
     # 기업 핵심 역량 사전을 기반으로 매칭
-    target_keywords = [
-        "소통", "협력", "도전", "책임", "열정", "창의", "혁신", "성장", "분석", 
-        "팀워크", "신뢰", "고객", "문제해결", "리더십", "글로벌", "전문성", 
-        "실행", "윤리", "안전", "배려", "성실", "끈기"
-    ]
-    
-    found_keywords = []
-    for kw in target_keywords:
-        if kw in text:
-            found_keywords.append(kw)
+    found_keywords = TARGET_KEYWORDS.found(text)
     
     if not found_keywords:
         return ["도전", "열정", "협력", "성장"]
@@ -96,27 +121,8 @@ def get_google_news(query):
     url = f"https://news.google.com/rss/search?q={encoded_query}&hl=ko&gl=KR&ceid=KR:ko"
     
     try:
-        res = requests.get(url, timeout=5)
-        soup = BeautifulSoup(res.content, 'html.parser') 
-        items = soup.find_all('item', limit=30) # 30개로 확장
-        
-        news_data = []
-        for item in items:
-            title = item.title.text
-            link = item.link.text if item.link else "#"
-            pub_date = item.pubdate.text if item.pubdate else ""
-            try:
-                dt = datetime.strptime(pub_date[:16], "%a, %d %b %Y")
-                clean_date = dt.strftime("%Y-%m-%d")
-            except:
-                clean_date = "최신"
-
-            news_data.append({
-                'title': title,
-                'link': link,
-                'date': clean_date
-            })
-        return news_data
+        res = HTTP_CACHE.get(url, timeout=5)
+        return parse_google_news(res.content)  # main.py 와 같은 파서 (30개)
     except Exception as e:
         print(f"    ⚠ 뉴스 수집 실패: {e}")
         return []
@@ -133,106 +139,8 @@ JOB_TEMPLATE = """
     <title>[{org_name}] {title} 합격자소서 공개 & 행동중심 면접 전략 (ID:{job_id})</title>
     <link href="https://cdn.jsdelivr.net/gh/orioncactus/pretendard/dist/web/static/pretendard.css" rel="stylesheet">
     
-    <script src="db_data1.js"></script>
-    <script src="db_data2.js"></script>
-
-    <style>
-        :root {{ --navy: #0f172a; --gold: #d4af37; --bg: #f8fafc; --text: #334155; --sidebar-w: 480px; }}
-        * {{ box-sizing: border-box; }}
-        body {{ font-family: 'Pretendard', sans-serif; background: var(--bg); color: var(--text); margin: 0; display: flex; height: 100vh; overflow: hidden; }}
-        
-        .sidebar {{ width: var(--sidebar-w); background: white; border-right: 1px solid #cbd5e1; display: flex; flex-direction: column; height: 100%; padding: 25px; z-index: 100; flex-shrink: 0; }}
-        .main-content {{ flex: 1; padding: 40px; overflow-y: auto; position: relative; background: #f8fafc; }}
 
-        .home-link-btn {{ display: block; text-align: center; background: var(--navy); color: white; padding: 12px; border-radius: 8px; text-decoration: none; font-weight: 700; margin-bottom: 20px; }}
-        
-        /* [소장님 지시] 사이드바 디자인 혁신: 18px 대왕 글자 & 중복 제거 */
-        .db-card {{ 
-            background: white; border: 1px solid #e2e8f0; border-radius: 12px; 
-            padding: 20px; margin-bottom: 15px; transition: 0.2s; position: relative; cursor: pointer;
-        }}
-        .db-card:hover {{ border-color: var(--gold); transform: translateY(-3px); box-shadow: 0 4px 12px rgba(0,0,0,0.05); }}
-        
-        /* [소장님 지시] 일치율 배지 */
-        .match-badge {{ 
-            display: inline-block; background: #fee2e2; color: #ef4444; 
-            padding: 5px 12px; border-radius: 20px; font-weight: 800; 
-            font-size: 14px; margin-bottom: 12px; border: 1px solid #fecaca;
-        }}
-
-        /* [소장님 지시] 사이드바 텍스트 18px */
-        .db-text {{ 
-            font-size: 18px; line-height: 1.6; color: #334155; 
-            word-break: break-all;
-        }}
-        
-        /* [소장님 지시] 중앙 확대 리포트 스타일 (22px) */
-        .full-report-view {{
-            background: white; padding: 60px; border-radius: 20px; box-shadow: 0 10px 30px rgba(0,0,0,0.05);
-            font-size: 22px; line-height: 2.0; color: #1e293b;
-        }}
-        .full-report-title {{
-            font-size: 28px; font-weight: 800; color: var(--navy); 
-            border-bottom: 3px solid #e2e8f0; padding-bottom: 20px; margin-bottom: 40px;
-        }}
-        .back-btn {{
-            display: inline-block; margin-bottom: 20px; padding: 10px 20px; 
-            background: #e2e8f0; color: #475569; border-radius: 30px; 
-            font-weight: bold; cursor: pointer; font-size: 16px; border: none;
-        }}
-        .back-btn:hover {{ background: #cbd5e1; }}
-
-        .ai-ask-btn {{ display: none; }} 
-
-        .ai-preview-box {{ background: #fffbeb; border: 2px dashed #f59e0b; border-radius: 12px; padding: 25px; margin-bottom: 30px; position: relative; }}
-        .ai-tag {{ background: #f59e0b; color: white; padding: 4px 10px; border-radius: 5px; font-size: 0.75rem; font-weight: bold; position: absolute; top: -12px; left: 20px; }}
-        .action-quote {{ font-size: 1.05rem; font-weight: 800; color: #1e40af; border-left: 5px solid #2563eb; padding-left: 15px; margin-top: 20px; line-height: 1.5; }}
-        .cta-link {{ display: inline-block; margin-top: 15px; color: #2563eb; font-weight: bold; text-decoration: underline; cursor: pointer; }}
-
-        .news-container {{ margin: 30px 0; background: white; border-radius: 15px; padding: 25px; box-shadow: 0 4px 15px rgba(0,0,0,0.03); border: 1px solid #e2e8f0; }}
-        .news-header {{ font-size: 1.3rem; font-weight: 800; color: var(--navy); margin-bottom: 15px; display: flex; align-items: center; justify-content: space-between; border-bottom: 2px solid #f1f5f9; padding-bottom:10px; }}
-        .news-scroll-box {{ max-height: 400px; overflow-y: auto; padding-right: 10px; }}
-        .news-scroll-box::-webkit-scrollbar {{ width: 6px; }}
-        .news-scroll-box::-webkit-scrollbar-thumb {{ background: #cbd5e1; border-radius: 3px; }}
-        .news-item {{ display: flex; justify-content: space-between; align-items: flex-start; padding: 12px 0; border-bottom: 1px dashed #e2e8f0; }}
-        .news-item:last-child {{ border-bottom: none; }}
-        .news-info {{ flex: 1; }}
-        .news-title {{ font-size: 0.95rem; font-weight: bold; color: #333; text-decoration: none; display: block; margin-bottom: 4px; line-height: 1.4; }}
-        .news-title:hover {{ text-decoration: underline; color: #2563eb; }}
-        .news-date {{ font-size: 0.75rem; color: #94a3b8; background: #f8fafc; padding: 2px 6px; border-radius: 4px; }}
-        .news-ai-btn {{ background: white; color: #d97706; border: 1px solid #d97706; padding: 6px 12px; border-radius: 20px; font-size: 0.75rem; font-weight: bold; cursor: pointer; margin-left: 10px; white-space: nowrap; transition: 0.2s; }}
-        .news-ai-btn:hover {{ background: #fffbeb; transform: translateY(-2px); }}
-
-        .highlight {{ background-color: #fef08a; font-weight: 900; border-bottom: 3px solid #facc15; padding: 0 2px; }}
-        
-        .job-card {{ background: white; border-radius: 15px; padding: 50px; box-shadow: 0 4px 20px rgba(0,0,0,0.05); max-width: 900px; margin: 0 auto; }}
-        .job-title {{ font-size: 2rem; color: var(--navy); margin: 10px 0 20px 0; font-weight: 800; }}
-        .keyword-chip {{ background: #f1f5f9; border: 1px solid #cbd5e1; padding: 8px 16px; border-radius: 50px; margin: 5px; display: inline-block; font-weight: 600; cursor: pointer; }}
-        .custom-search-box {{ display: inline-flex; align-items: center; margin-left: 10px; gap: 5px; }}
-        .custom-search-box input {{ padding: 8px 12px; border: 1px solid #cbd5e1; border-radius: 20px; outline: none; font-size: 14px; width: 180px; }}
-        .custom-search-box button {{ padding: 8px 15px; background: var(--navy); color: white; border: none; border-radius: 20px; cursor: pointer; font-weight: bold; }}
-        .content-body {{ font-size: 0.95rem; line-height: 1.8; color: #334155; margin-top: 30px; }}
-
-        #chatbot-bubble {{ position: fixed; bottom: 95px; right: 30px; background: white; padding: 10px 15px; border-radius: 15px; box-shadow: 0 4px 15px rgba(0,0,0,0.1); border: 1px solid #2563eb; font-size: 13px; font-weight: bold; color: #1e40af; z-index: 9998; animation: float 3s ease-in-out infinite; cursor: pointer; }}
-        #chatbot-bubble::after {{ content: ''; position: absolute; bottom: -8px; right: 25px; border-width: 8px 8px 0; border-style: solid; border-color: #2563eb transparent transparent transparent; }}
-        @keyframes float {{ 0% {{transform: translateY(0);}} 50% {{transform: translateY(-10px);}} 100% {{transform: translateY(0);}} }}
-        #chatbot-floater {{ position: fixed; bottom: 30px; right: 30px; width: 60px; height: 60px; background: linear-gradient(135deg, #2563eb, #1e40af); border-radius: 50%; box-shadow: 0 4px 15px rgba(37, 99, 235, 0.4); cursor: pointer; z-index: 9999; display: flex; align-items: center; justify-content: center; transition: transform 0.2s; }}
-        #chatbot-floater:hover {{ transform: scale(1.1); }}
-        #chatbot-window {{ display: none; position: fixed; bottom: 100px; right: 30px; width: 360px; height: 520px; background: white; border-radius: 16px; box-shadow: 0 10px 40px rgba(0,0,0,0.2); z-index: 10000; flex-direction: column; border: 1px solid #e2e8f0; overflow: hidden; }}
-        .chat-header {{ background: #2563eb; color: white; padding: 15px; font-weight: bold; display: flex; justify-content: space-between; align-items: center; cursor: move; }}
-        #chat-messages {{ flex: 1; padding: 15px; overflow-y: auto; background: #f8fafc; display: flex; flex-direction: column; gap: 10px; }}
-        .msg {{ max-width: 85%; padding: 10px 14px; border-radius: 12px; font-size: 14px; line-height: 1.5; word-break: break-word; }}
-        .msg-user {{ align-self: flex-end; background: #2563eb; color: white; border-bottom-right-radius: 2px; }}
-        .msg-ai {{ align-self: flex-start; background: white; border: 1px solid #e2e8f0; color: #1e293b; border-bottom-left-radius: 2px; }}
-        .chat-input-area {{ padding: 10px; border-top: 1px solid #e2e8f0; background: white; display: flex; gap: 5px; }}
-        .chat-input-area input {{ flex: 1; padding: 12px; border: 1px solid #e2e8f0; border-radius: 20px; outline: none; }}
-        .chat-input-area button {{ background: #2563eb; color: white; border: none; padding: 0 15px; border-radius: 20px; font-weight: bold; cursor: pointer; }}
-        
-        @media (max-width: 1024px) {{
-            .sidebar {{ display: none; }}
-            body {{ flex-direction: column; overflow: auto; }}
-        }}
-    </style>
+    <link rel="stylesheet" href="{css_file}">
 </head>
 <body>
     <div class="sidebar" id="mainSidebar">
@@ -256,6 +164,10 @@ JOB_TEMPLATE = """
                 <div id="aiSampleContent" style="color: #4b5563; font-style: italic; line-height: 1.6;">
                     데이터 로딩 중... (가장 유사한 합격 사례를 분석하고 있습니다)
                 </div>
+                <div id="aiInsight" class="ai-insight">
+                    <div class="ai-insight-title">🧠 AI 공고 분석</div>
+                    <div id="aiInsightText"></div>
+                </div>
                 <div class="action-quote">
                     "최종 합격을 결정짓는 것은 이런 뻔한 문장이 아닌,<br>
                     오직 당신만이 가진 <strong>'행동 중심의 에피소드'</strong>입니다."
@@ -323,96 +235,256 @@ JOB_TEMPLATE = """
         </div>
     </div>
 
-    <script>
-        const dbData = [
-            ...(window.DB_PART_1 || []), 
-            ...(window.DB_PART_2 || [])
-        ];
-        console.log("📊 전체 합격 DB 로드 완료: " + dbData.length + "건");
+    <script id="page-data" type="application/json">{page_data}</script>
+    <script src="{js_file}"></script>      
+            
+     
+</body>
+</html>
+"""
+
+# ==========================================
+# 3-1. 공고 페이지 공용 CSS / JS (static/ 에 해시 파일명으로 한 번만 저장, 페이지는 링크만)
+# ==========================================
+JOB_CSS = """
+:root { --navy: #0f172a; --gold: #d4af37; --bg: #f8fafc; --text: #334155; --sidebar-w: 480px; }
+* { box-sizing: border-box; }
+body { font-family: 'Pretendard', sans-serif; background: var(--bg); color: var(--text); margin: 0; display: flex; height: 100vh; overflow: hidden; }
+
+.sidebar { width: var(--sidebar-w); background: white; border-right: 1px solid #cbd5e1; display: flex; flex-direction: column; height: 100%; padding: 25px; z-index: 100; flex-shrink: 0; }
+.main-content { flex: 1; padding: 40px; overflow-y: auto; position: relative; background: #f8fafc; }
+
+.home-link-btn { display: block; text-align: center; background: var(--navy); color: white; padding: 12px; border-radius: 8px; text-decoration: none; font-weight: 700; margin-bottom: 20px; }
+
+/* [소장님 지시] 사이드바 디자인 혁신: 18px 대왕 글자 & 중복 제거 */
+.db-card { 
+    background: white; border: 1px solid #e2e8f0; border-radius: 12px; 
+    padding: 20px; margin-bottom: 15px; transition: 0.2s; position: relative; cursor: pointer;
+}
+.db-card:hover { border-color: var(--gold); transform: translateY(-3px); box-shadow: 0 4px 12px rgba(0,0,0,0.05); }
+
+/* [소장님 지시] 일치율 배지 */
+.match-badge { 
+    display: inline-block; background: #fee2e2; color: #ef4444; 
+    padding: 5px 12px; border-radius: 20px; font-weight: 800; 
+    font-size: 14px; margin-bottom: 12px; border: 1px solid #fecaca;
+}
+
+/* [소장님 지시] 사이드바 텍스트 18px */
+.db-text { 
+    font-size: 18px; line-height: 1.6; color: #334155; 
+    word-break: break-all;
+}
+
+/* [소장님 지시] 중앙 확대 리포트 스타일 (22px) */
+.full-report-view {
+    background: white; padding: 60px; border-radius: 20px; box-shadow: 0 10px 30px rgba(0,0,0,0.05);
+    font-size: 22px; line-height: 2.0; color: #1e293b;
+}
+.full-report-title {
+    font-size: 28px; font-weight: 800; color: var(--navy); 
+    border-bottom: 3px solid #e2e8f0; padding-bottom: 20px; margin-bottom: 40px;
+}
+.back-btn {
+    display: inline-block; margin-bottom: 20px; padding: 10px 20px; 
+    background: #e2e8f0; color: #475569; border-radius: 30px; 
+    font-weight: bold; cursor: pointer; font-size: 16px; border: none;
+}
+.back-btn:hover { background: #cbd5e1; }
+
+.ai-ask-btn { display: none; } 
+
+.ai-preview-box { background: #fffbeb; border: 2px dashed #f59e0b; border-radius: 12px; padding: 25px; margin-bottom: 30px; position: relative; }
+.ai-tag { background: #f59e0b; color: white; padding: 4px 10px; border-radius: 5px; font-size: 0.75rem; font-weight: bold; position: absolute; top: -12px; left: 20px; }
+.action-quote { font-size: 1.05rem; font-weight: 800; color: #1e40af; border-left: 5px solid #2563eb; padding-left: 15px; margin-top: 20px; line-height: 1.5; }
+.cta-link { display: inline-block; margin-top: 15px; color: #2563eb; font-weight: bold; text-decoration: underline; cursor: pointer; }
+.ai-insight { display: none; margin-top: 20px; background: white; border: 1px solid #fde68a; border-radius: 10px; padding: 20px; line-height: 1.7; color: #1e293b; }
+.ai-insight-title { font-weight: 800; color: var(--navy); margin-bottom: 10px; }
+
+.news-container { margin: 30px 0; background: white; border-radius: 15px; padding: 25px; box-shadow: 0 4px 15px rgba(0,0,0,0.03); border: 1px solid #e2e8f0; }
+.news-header { font-size: 1.3rem; font-weight: 800; color: var(--navy); margin-bottom: 15px; display: flex; align-items: center; justify-content: space-between; border-bottom: 2px solid #f1f5f9; padding-bottom:10px; }
+.news-scroll-box { max-height: 400px; overflow-y: auto; padding-right: 10px; }
+.news-scroll-box::-webkit-scrollbar { width: 6px; }
+.news-scroll-box::-webkit-scrollbar-thumb { background: #cbd5e1; border-radius: 3px; }
+.news-item { display: flex; justify-content: space-between; align-items: flex-start; padding: 12px 0; border-bottom: 1px dashed #e2e8f0; }
+.news-item:last-child { border-bottom: none; }
+.news-info { flex: 1; }
+.news-title { font-size: 0.95rem; font-weight: bold; color: #333; text-decoration: none; display: block; margin-bottom: 4px; line-height: 1.4; }
+.news-title:hover { text-decoration: underline; color: #2563eb; }
+.news-date { font-size: 0.75rem; color: #94a3b8; background: #f8fafc; padding: 2px 6px; border-radius: 4px; }
+.news-ai-btn { background: white; color: #d97706; border: 1px solid #d97706; padding: 6px 12px; border-radius: 20px; font-size: 0.75rem; font-weight: bold; cursor: pointer; margin-left: 10px; white-space: nowrap; transition: 0.2s; }
+.news-ai-btn:hover { background: #fffbeb; transform: translateY(-2px); }
+
+.highlight { background-color: #fef08a; font-weight: 900; border-bottom: 3px solid #facc15; padding: 0 2px; }
+
+.job-card { background: white; border-radius: 15px; padding: 50px; box-shadow: 0 4px 20px rgba(0,0,0,0.05); max-width: 900px; margin: 0 auto; }
+.job-title { font-size: 2rem; color: var(--navy); margin: 10px 0 20px 0; font-weight: 800; }
+.keyword-chip { background: #f1f5f9; border: 1px solid #cbd5e1; padding: 8px 16px; border-radius: 50px; margin: 5px; display: inline-block; font-weight: 600; cursor: pointer; }
+.custom-search-box { display: inline-flex; align-items: center; margin-left: 10px; gap: 5px; }
+.custom-search-box input { padding: 8px 12px; border: 1px solid #cbd5e1; border-radius: 20px; outline: none; font-size: 14px; width: 180px; }
+.custom-search-box button { padding: 8px 15px; background: var(--navy); color: white; border: none; border-radius: 20px; cursor: pointer; font-weight: bold; }
+.content-body { font-size: 0.95rem; line-height: 1.8; color: #334155; margin-top: 30px; }
+
+#chatbot-bubble { position: fixed; bottom: 95px; right: 30px; background: white; padding: 10px 15px; border-radius: 15px; box-shadow: 0 4px 15px rgba(0,0,0,0.1); border: 1px solid #2563eb; font-size: 13px; font-weight: bold; color: #1e40af; z-index: 9998; animation: float 3s ease-in-out infinite; cursor: pointer; }
+#chatbot-bubble::after { content: ''; position: absolute; bottom: -8px; right: 25px; border-width: 8px 8px 0; border-style: solid; border-color: #2563eb transparent transparent transparent; }
+@keyframes float { 0% {transform: translateY(0);} 50% {transform: translateY(-10px);} 100% {transform: translateY(0);} }
+#chatbot-floater { position: fixed; bottom: 30px; right: 30px; width: 60px; height: 60px; background: linear-gradient(135deg, #2563eb, #1e40af); border-radius: 50%; box-shadow: 0 4px 15px rgba(37, 99, 235, 0.4); cursor: pointer; z-index: 9999; display: flex; align-items: center; justify-content: center; transition: transform 0.2s; }
+#chatbot-floater:hover { transform: scale(1.1); }
+#chatbot-window { display: none; position: fixed; bottom: 100px; right: 30px; width: 360px; height: 520px; background: white; border-radius: 16px; box-shadow: 0 10px 40px rgba(0,0,0,0.2); z-index: 10000; flex-direction: column; border: 1px solid #e2e8f0; overflow: hidden; }
+.chat-header { background: #2563eb; color: white; padding: 15px; font-weight: bold; display: flex; justify-content: space-between; align-items: center; cursor: move; }
+#chat-messages { flex: 1; padding: 15px; overflow-y: auto; background: #f8fafc; display: flex; flex-direction: column; gap: 10px; }
+.msg { max-width: 85%; padding: 10px 14px; border-radius: 12px; font-size: 14px; line-height: 1.5; word-break: break-word; }
+.msg-user { align-self: flex-end; background: #2563eb; color: white; border-bottom-right-radius: 2px; }
+.msg-ai { align-self: flex-start; background: white; border: 1px solid #e2e8f0; color: #1e293b; border-bottom-left-radius: 2px; }
+.chat-input-area { padding: 10px; border-top: 1px solid #e2e8f0; background: white; display: flex; gap: 5px; }
+.chat-input-area input { flex: 1; padding: 12px; border: 1px solid #e2e8f0; border-radius: 20px; outline: none; }
+.chat-input-area button { background: #2563eb; color: white; border: none; padding: 0 15px; border-radius: 20px; font-weight: bold; cursor: pointer; }
+
+@media (max-width: 1024px) {
+    .sidebar { display: none; }
+    body { flex-direction: column; overflow: auto; }
+}
+"""
+
+JOB_JS = """
+const PAGE = JSON.parse(document.getElementById('page-data').textContent); // 페이지별 값 (기관명, 서버 주소 등)
+        // 합격 DB 는 db/index.json (키워드 → 샤드 파일) 을 먼저 읽고, 필요한 샤드만 내려받음
+        // - 처음: 기본 샤드 1개 / 키워드 칩: 해당 키워드 샤드 1개 / 자유 검색: 전체 청크를 50건 찾을 때까지 순서대로
+        const DB_BASE = "db/";
+        const shardCache = {};
+        let dbIndexPromise = null;
+        let renderSeq = 0;
+
+        function loadDbIndex() {
+            if (!dbIndexPromise) {
+                dbIndexPromise = fetch(DB_BASE + "index.json", { cache: "no-cache" }).then(res => res.json());
+            }
+            return dbIndexPromise;
+        }
+
+        function loadShard(name) {
+            if (!shardCache[name]) {
+                shardCache[name] = fetch(DB_BASE + name).then(res => res.json());
+            }
+            return shardCache[name];
+        }
+
+        async function loadDbItems(filter) {
+            const index = await loadDbIndex();
+            if (!filter) return loadShard(index.sample);
+            if (index.keywords[filter]) return loadShard(index.keywords[filter]);
+            let found = [];
+            for (const chunk of index.chunks) {
+                const items = await loadShard(chunk);
+                found = found.concat(items.filter(item => item.title.includes(filter) || item.content.includes(filter)));
+                if (found.length >= 50) break;
+            }
+            return found;
+        }
         const dbContainer = document.getElementById('dbContainer');
         const dbSearch = document.getElementById('dbSearch');
         const mainContentArea = document.getElementById('mainContentArea');
         let originalMainContent = ""; 
 
-        window.onload = function() {{
+        window.onload = function() {
+            showInsight(); // 공고 내용 백업 전에 채워 두어야 '돌아가기' 후에도 보임
             originalMainContent = mainContentArea.innerHTML; // 초기 공고 내용 백업
-            
-            if(dbData.length > 0) {{
-                const randomItem = dbData[Math.floor(Math.random() * dbData.length)];
-                document.getElementById('aiSampleContent').innerText = randomItem.content.substring(0, 350) + "...";
-            }}
-        }};
 
-        function renderDB(filter = "") {{
+            loadDbItems("").then(sampleData => {
+                if(sampleData.length > 0) {
+                    const randomItem = sampleData[Math.floor(Math.random() * sampleData.length)];
+                    document.getElementById('aiSampleContent').innerText = randomItem.content.substring(0, 350) + "...";
+                }
+            }).catch(() => {});
+        };
+
+        // 빌드 때 미리 만들어 둔 AI 분석 (ai_insights.py). 있으면 서버 호출 없이 바로 표시
+        function showInsight() {
+            if (!PAGE.insight) return;
+            const escaped = PAGE.insight.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+            document.getElementById('aiInsightText').innerHTML = escaped.replace(/\\*\\*(.+?)\\*\\*/g, '<strong>$1</strong>').replace(/\\n/g, '<br>');
+            document.getElementById('aiInsight').style.display = 'block';
+        }
+
+        async function renderDB(filter = "") {
+            const seq = ++renderSeq;
+            let dbData;
+            try {
+                dbData = await loadDbItems(filter);
+            } catch (e) {
+                dbContainer.innerHTML = "<div style='padding:10px;'>DB를 불러오지 못했습니다.</div>";
+                return;
+            }
+            if (seq !== renderSeq) return; // 입력 중 더 최근 검색이 시작됨
             let filtered = dbData;
-            if (filter) {{
+            if (filter) {
                 filtered = dbData.filter(item => 
                     item.title.includes(filter) || item.content.includes(filter)
                 );
-            }}
+            }
             filtered = filtered.slice(0, 50); // 사이드바 성능 위해 50개 제한
-            
-            if(filtered.length > 0) {{
-                dbContainer.innerHTML = filtered.map((item, index) => {{
+
+            if(filtered.length > 0) {
+                dbContainer.innerHTML = filtered.map((item, index) => {
                     // [소장님 지시] 사이드바: 500자 요약 노출 & 중복 제목 제거
                     let summaryContent = item.content.substring(0, 500) + "...";
                     let fullContent = item.content.replace(/'/g, "\\'"); 
-                    
-                    if (filter) {{
+
+                    if (filter) {
                         const regex = new RegExp(filter, "gi");
-                        const highlightStr = `<span class="highlight">${{filter}}</span>`;
+                        const highlightStr = `<span class="highlight">${filter}</span>`;
                         summaryContent = summaryContent.replace(regex, highlightStr);
-                    }}
+                    }
 
                     // [소장님 지시] 제목 삭제 후 배지 + 500자 내용만 표시
                     return `
-                    <div class="db-card" onclick="showFullReport('${{fullContent}}')">
+                    <div class="db-card" onclick="showFullReport('${fullContent}')">
                         <div class="match-badge">🎯 </div>
-                        <div class="db-text">${{summaryContent}}</div>
+                        <div class="db-text">${summaryContent}</div>
                         <div style="text-align:right; margin-top:10px; color:#2563eb; font-size:0.8rem; font-weight:bold;">👉 클릭하여 전체보기 (확대)</div>
                     </div>`;
-                }}).join('');
-            }} else {{
+                }).join('');
+            } else {
                 dbContainer.innerHTML = "<div style='padding:10px;'>검색 결과가 없습니다.</div>";
-            }}
-        }}
+            }
+        }
         renderDB();
 
         // [소장님 지시] 클릭 시 중앙 화면을 22px 대왕 리포트로 교체 (1200자 전문)
-        function showFullReport(fullText) {{
+        function showFullReport(fullText) {
             mainContentArea.innerHTML = `
                 <div class="full-report-view">
                     <button class="back-btn" onclick="restoreOriginalContent()">↩ 공고문으로 돌아가기</button>
                     <div class="full-report-title">📄 합격 자기소개서 심층 분석 (전문)</div>
-                    <div style="white-space: pre-wrap;">${{fullText}}</div>
+                    <div style="white-space: pre-wrap;">${fullText}</div>
                     <div style="margin-top:50px; border-top:2px dashed #e2e8f0; padding-top:30px; text-align:center;">
                         <p style="font-size:18px; color:#64748b;">이 데이터는 합격  데이터입니다.</p>
-                        <a href="{consult_link}" target="_blank" style="background:var(--gold); color:white; padding:15px 30px; border-radius:30px; text-decoration:none; font-weight:bold; font-size:18px;">⚡AI시대, 자서소의 기준이 문장력에서 실제행동으로 바뀌었습니다.</a>
+                        <a href="${PAGE.consult_link}" target="_blank" style="background:var(--gold); color:white; padding:15px 30px; border-radius:30px; text-decoration:none; font-weight:bold; font-size:18px;">⚡AI시대, 자서소의 기준이 문장력에서 실제행동으로 바뀌었습니다.</a>
                     </div>
                 </div>
             `;
             mainContentArea.scrollTop = 0;
-        }}
+        }
 
-        function restoreOriginalContent() {{
+        function restoreOriginalContent() {
             mainContentArea.innerHTML = originalMainContent;
-        }}
+        }
 
-        function searchDB(keyword) {{ dbSearch.value = keyword; renderDB(keyword); }}
-        function manualSearch() {{ const val = document.getElementById('manualKeyword').value; if(val) {{ searchDB(val); alert("왼쪽 사이드바에서 결과를 확인하세요!"); }} }}
-        dbSearch.addEventListener('input', (e) => {{ renderDB(e.target.value); }});
+        function searchDB(keyword) { dbSearch.value = keyword; renderDB(keyword); }
+        function manualSearch() { const val = document.getElementById('manualKeyword').value; if(val) { searchDB(val); alert("왼쪽 사이드바에서 결과를 확인하세요!"); } }
+        dbSearch.addEventListener('input', (e) => { renderDB(e.target.value); });
 
-        function toggleChat() {{
+        function toggleChat() {
             const win = document.getElementById('chatbot-window');
             const bubble = document.getElementById('chatbot-bubble');
-            if (win.style.display === 'none' || win.style.display === '') {{
+            if (win.style.display === 'none' || win.style.display === '') {
                 win.style.display = 'flex'; bubble.style.display = 'none'; document.getElementById('chatInput').focus();
-            }} else {{
+            } else {
                 win.style.display = 'none'; bubble.style.display = 'block';
-            }}
-        }}
+            }
+        }
 
-function askAiAboutNews(title, date) {{
+function askAiAboutNews(title, date) {
             const win = document.getElementById('chatbot-window');
             const bubble = document.getElementById('chatbot-bubble');
             if(win) win.style.display = 'flex'; 
@@ -421,7 +493,7 @@ function askAiAboutNews(title, date) {{
             const displayMsg = "📢 선택하신 뉴스 [" + title + "]를 기반으로 합격 지원동기 초안을 분석합니다.";
             addBubble(displayMsg, 'user');
 
-            const secretMsg = `[뉴스 기반 지원동기 작성 요청] \n기업명: {org_name}\n뉴스 제목: ` + title + `\n뉴스 날짜: ` + date + `\n\n1. 위 뉴스 내용을 기업의 사업 방향과 연결하여 전문적인 비즈니스 문체로 '지원동기' 초안을 작성해줘.\n2. 답변 마지막에 'AI 채용 도입으로 인해 합격 자소서의 평가 기준이 행동(Action) 중심으로 바뀌고 있습니다. 더 정교한 합격을 원하시면 전문가의 행동 중심 자소서 첨삭을 받아보세요.'라는 문구를 추가해줘.`;
+            const secretMsg = `[뉴스 기반 지원동기 작성 요청] \n기업명: ${PAGE.org_name}\n뉴스 제목: ` + title + `\n뉴스 날짜: ` + date + `\n\n1. 위 뉴스 내용을 기업의 사업 방향과 연결하여 전문적인 비즈니스 문체로 '지원동기' 초안을 작성해줘.\n2. 답변 마지막에 'AI 채용 도입으로 인해 합격 자소서의 평가 기준이 행동(Action) 중심으로 바뀌고 있습니다. 더 정교한 합격을 원하시면 전문가의 행동 중심 자소서 첨삭을 받아보세요.'라는 문구를 추가해줘.`;
 
             const loadingId = addBubble("⏳ 전문가 AI가 분석 전략을 수립 중입니다...", 'ai');
             const loadingElement = document.getElementById(loadingId); 
@@ -429,82 +501,180 @@ function askAiAboutNews(title, date) {{
             const jobTitle = document.querySelector('.job-title') ? document.querySelector('.job-title').innerText : '사기업 공고 분석';
             const jobContent = document.querySelector('.content-body') ? document.querySelector('.content-body').innerText.substring(0, 1000) : ''; 
 
-            fetch('{render_server_url}', {{
-                method: 'POST',
-                headers: {{ 'Content-Type': 'application/json' }},
-                body: JSON.stringify({{ 
-                    message: secretMsg,
-                    context: `[현재 공고 정보]\\n기업명: {org_name}\\n공고제목: ${{jobTitle}}\\n공고내용요약: ${{jobContent}}...`
-                }})
-            }})
-            .then(res => res.json())
-            .then(data => {{
-                if (loadingElement) {{ loadingElement.innerHTML = data.response.replace(/\\n/g, '<br>'); }}
-            }})
-            .catch(err => {{
-                if (loadingElement) {{ loadingElement.innerText = "⚠ 서버 연결 문제로 분석에 실패했습니다."; }}
-            }});
-        }}
-
-        async function sendMsg() {{
+            streamChat({
+                message: secretMsg,
+                context: `[현재 공고 정보]\\n기업명: ${PAGE.org_name}\\n공고제목: ${jobTitle}\\n공고내용요약: ${jobContent}...`
+            }, loadingElement)
+            .catch(err => {
+                if (loadingElement) { loadingElement.innerText = "⚠ 서버 연결 문제로 분석에 실패했습니다."; }
+            });
+        }
+
+        async function sendMsg() {
             const input = document.getElementById('chatInput');
             const msg = input.value.trim();
             if (!msg) return;
             addBubble(msg, 'user');
             input.value = '';
-            
+
             const loadingId = addBubble("⏳ AI 서버 깨우는 중... (약 30초 소요)", 'ai');
             const loadingElement = document.getElementById(loadingId); 
 
             const jobTitle = document.querySelector('.job-title') ? document.querySelector('.job-title').innerText : '합격자소서 분석';
             const jobContent = document.querySelector('.content-body') ? document.querySelector('.content-body').innerText.substring(0, 1000) : ''; 
 
-            try {{
-                const res = await fetch('{render_server_url}', {{
+            try {
+                await streamChat({
+                    message: msg,
+                    context: `[현재 공고 정보]\\n기업명: ${PAGE.org_name}\\n공고제목: ${jobTitle}\\n공고내용요약: ${jobContent}...`
+                }, loadingElement);
+            } catch (err) {
+                if (loadingElement) { loadingElement.innerText = "⚠ 서버 연결 실패 (네트워크를 확인하세요)"; }
+            }
+        }
+
+        // [스트리밍] /chat/stream (SSE) 으로 토큰이 도착하는 대로 말풍선에 그립니다.
+        // 스트리밍을 못 쓰는 환경이면 기존 /chat (JSON) 으로 한 번 더 요청합니다.
+        async function streamChat(payload, targetElement) {
+            const box = document.getElementById('chat-messages');
+            let answer = '';
+            try {
+                const res = await fetch(PAGE.render_server_url + '/stream', {
                     method: 'POST',
-                    headers: {{ 'Content-Type': 'application/json' }},
-                    body: JSON.stringify({{ 
-                        message: msg,
-                        context: `[현재 공고 정보]\\n기업명: {org_name}\\n공고제목: ${{jobTitle}}\\n공고내용요약: ${{jobContent}}...`
-                    }})
-                }});
-                const data = await res.json();
-                if (loadingElement) {{ loadingElement.innerHTML = data.response.replace(/\\n/g, '<br>'); }}
-            }} catch (err) {{
-                if (loadingElement) {{ loadingElement.innerText = "⚠ 서버 연결 실패 (네트워크를 확인하세요)"; }}
-            }}
-        }}
-
-        function addBubble(text, type) {{
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify(payload)
+                });
+                if (!res.ok || !res.body) throw new Error('stream unavailable');
+
+                const reader = res.body.getReader();
+                const decoder = new TextDecoder();
+                let buffer = '';
+                while (true) {
+                    const { value, done } = await reader.read();
+                    if (done) break;
+                    buffer += decoder.decode(value, { stream: true });
+                    const events = buffer.split('\\n\\n');
+                    buffer = events.pop();
+                    for (const evt of events) {
+                        const line = evt.split('\\n').find(l => l.startsWith('data: '));
+                        if (!line) continue;
+                        const data = JSON.parse(line.slice(6));
+                        if (!data.token) continue;
+                        answer += data.token;
+                        if (targetElement) { targetElement.innerHTML = answer.replace(/\\n/g, '<br>'); }
+                        box.scrollTop = box.scrollHeight;
+                    }
+                }
+            } catch (err) {
+                // 스트림 도중 끊겨도 이미 받은 토큰은 그대로 둠
+            }
+            if (answer) return;
+
+            const res = await fetch(PAGE.render_server_url, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify(payload)
+            });
+            const data = await res.json();
+            if (targetElement) { targetElement.innerHTML = data.response.replace(/\\n/g, '<br>'); }
+        }
+
+        function addBubble(text, type) {
             const box = document.getElementById('chat-messages');
             const div = document.createElement('div');
-            div.className = `msg msg-${{type}}`;
+            div.className = `msg msg-${type}`;
             div.id = 'msg-' + Date.now();
             div.innerHTML = text.replace(/\\n/g, '<br>');
             box.appendChild(div);
             box.scrollTop = box.scrollHeight;
             return div.id; 
-        }}
+        }
 
         dragElement(document.getElementById("chatbot-window"));
-        function dragElement(elmnt) {{
+        function dragElement(elmnt) {
             var pos1 = 0, pos2 = 0, pos3 = 0, pos4 = 0;
-            if (document.getElementById("chatHeader")) {{ document.getElementById("chatHeader").onmousedown = dragMouseDown; }}
-            function dragMouseDown(e) {{ e = e || window.event; e.preventDefault(); pos3 = e.clientX; pos4 = e.clientY; document.onmouseup = closeDragElement; document.onmousemove = elementDrag; }}
-            function elementDrag(e) {{ e = e || window.event; e.preventDefault(); pos1 = pos3 - e.clientX; pos2 = pos4 - e.clientY; pos3 = e.clientX; pos4 = e.clientY; elmnt.style.top = (elmnt.offsetTop - pos2) + "px"; elmnt.style.left = (elmnt.offsetLeft - pos1) + "px"; }}
-            function closeDragElement() {{ document.onmouseup = null; document.onmousemove = null; }}
-        }}
-    </script>      
-            
-     
-</body>
-</html>
+            if (document.getElementById("chatHeader")) { document.getElementById("chatHeader").onmousedown = dragMouseDown; }
+            function dragMouseDown(e) { e = e || window.event; e.preventDefault(); pos3 = e.clientX; pos4 = e.clientY; document.onmouseup = closeDragElement; document.onmousemove = elementDrag; }
+            function elementDrag(e) { e = e || window.event; e.preventDefault(); pos1 = pos3 - e.clientX; pos2 = pos4 - e.clientY; pos3 = e.clientX; pos4 = e.clientY; elmnt.style.top = (elmnt.offsetTop - pos2) + "px"; elmnt.style.left = (elmnt.offsetLeft - pos1) + "px"; }
+            function closeDragElement() { document.onmouseup = null; document.onmousemove = null; }
+        }
 """
 
 # ==========================================
 # 4. 크롤링 및 파일 생성 로직 (사기업 전용 보존)
 # ==========================================
-def create_private_pages():
+def parse_private_detail(html, job):
+    # 인크루트 상세 본문 영역 추출 → (본문 HTML, 본문 텍스트). 본문 HTML 을 그대로 쓰므로 keep_markup
+    soup = make_soup(html, keep_markup=True)
+    content_html = soup.select_one('.job_view_box') or soup.select_one('.view_con') or soup.select_one('.d_ca_list')
+    
+    content = str(content_html) if content_html else "<p>상세 내용은 아래 '원문 공고 확인하기'를 통해 확인해 주세요.</p>"
+    content_text = content_html.text if content_html else f"{job['title']} {job['company']}"
+    return content, content_text
+
+def posting_id(link):
+    # 인크루트 공고 고유번호 (링크의 job= 값). 수집 순서와 무관하게 같은 공고는 항상 같은 ID
+    job = urllib.parse.parse_qs(urllib.parse.urlparse(link).query).get('job')
+    if job and job[0].isalnum(): return job[0]
+    return content_hash(link)[:12]
+
+def _page_key(org, title):
+    # 기업명 + 제목 (공백 차이 무시) → 예전 페이지와 새 페이지가 같은 공고인지 확인
+    return "".join(str(org).split()), "".join(str(title).split())
+
+def migrate_legacy_pages(manifest):
+    # [이전] 수집 순번으로 만든 예전 페이지(P1_회사.html)를 같은 공고의 새 ID 페이지로 보내는 안내 페이지로 교체
+    # - 예전 주소는 이미 사이트맵으로 검색엔진에 알려져 있으므로 지우지 않음 (404 방지)
+    # - 교체한 페이지는 manifest 에서 빼서 목록/사이트맵에 같은 공고가 두 번 나오지 않게 함
+    # - 새 페이지가 아직 없는 공고는 그대로 두고 다음 실행에서 다시 확인 (모두 옮기면 할 일 없음)
+    legacy = [page for page in manifest.newest_first() if LEGACY_PAGE_RE.match(page["file"])]
+    if not legacy: return
+    current = {_page_key(page["org"], page["title"]): page["file"]
+               for page in manifest.newest_first() if not LEGACY_PAGE_RE.match(page["file"])}
+    moved = 0
+    for page in legacy:
+        target = current.get(_page_key(page["org"], page["title"]))
+        if target is None: continue
+        stub = REDIRECT_TEMPLATE.format(title=page["title"], target=target, url=f"{MY_HOME_LINK}/{SAVE_DIR}/{target}")
+        write_if_changed(os.path.join(SAVE_DIR, page["file"]), stub)
+        manifest.remove(page["file"])
+        moved += 1
+    if moved: print(f"🔀 [이전] 예전 순번 ID 페이지 {moved}개를 새 주소로 연결 (남은 예전 페이지 {len(legacy) - moved}개)")
+
+def render_private_page(job, job_id, content, keyword_chips_html, news_area_html, insight=None):
+    page_data = {"org_name": job['company'], "consult_link": MY_CONSULTING_LINK, "render_server_url": RENDER_SERVER_URL}
+    if insight: page_data["insight"] = insight
+    return JOB_TEMPLATE.format(
+        org_name=job['company'],
+        title=job['title'],
+        end_date=job['deadline'],
+        content=content,
+        consult_link=MY_CONSULTING_LINK,
+        home_link=MY_HOME_LINK,
+        original_url=job['link'],
+        keyword_chips=keyword_chips_html,
+        job_id="P"+job_id,
+        news_area=news_area_html,
+        css_file=publish_asset(SAVE_DIR, "job.css", JOB_CSS),
+        js_file=publish_asset(SAVE_DIR, "job.js", JOB_JS),
+        page_data=inline_json(page_data),
+    )
+
+def add_ai_insights(generator, written, manifest):
+    # 이번 실행에서 만들거나 갱신한 페이지에 AI 분석을 넣어 다시 저장 (분석에 실패한 공고는 그대로 둠)
+    items = [ai_insights.insight_request(args[0]['company'], args[0]['title'], text) for _, _, text, args in written]
+    added = 0
+    for (filename, source_hash, _, args), insight in zip(written, generator.generate(items)):
+        if not insight: continue
+        job, job_id = args[0], args[1]
+        full_html = render_private_page(*args, insight=insight)
+        with open(os.path.join(SAVE_DIR, filename), 'w', encoding='utf-8') as f:
+            f.write(full_html)
+        manifest.record(filename, "P"+job_id, job['company'], job['title'], job['deadline'], full_html, source_hash=source_hash)
+        added += 1
+    print(f"  ✅ AI 분석 포함: {added}/{len(written)}개 페이지")
+
+def create_private_pages(full=False, insights=None):
     # 1. 합격자소서 DB를 JS로 변환 (jobs_private_html 폴더에 저장)
     export_db_to_js()
     
@@ -528,25 +698,33 @@ def create_private_pages():
     
     # 폴더가 없으면 생성
     os.makedirs(SAVE_DIR, exist_ok=True)
+    manifest = PageManifest(MANIFEST_FILE, SAVE_DIR)
+    counts = {"new": 0, "updated": 0, "skipped": 0, "failed": 0}
+    written = []  # AI 분석을 넣을 페이지 (파일명, 원본 해시, 본문 텍스트, 렌더링 인자)
 
     for job in jobs:
         try:
-            job_id = str(job['id'])
+            job_id = posting_id(job['link'])
             safe_company = "".join([c for c in job['company'] if c.isalnum()])
             filename = f"P{job_id}_{safe_company}.html"
             filepath = os.path.join(SAVE_DIR, filename)
+            entry = manifest.get(filename)
+            exists = entry is not None and os.path.exists(filepath)
+            known = exists and not full
             
-            # [중요] 상세 페이지 본문 긁어오기
-            print(f"🔄 [신규수집] {job['company']} 본문 로딩중...")
-            res = requests.get(job['link'], headers=HEADERS, timeout=10)
+            # [중요] 상세 페이지 본문 긁어오기 (이미 만든 공고는 RECHECK_SECONDS 동안 캐시 사용)
+            if not known: print(f"🔄 [신규수집] {job['company']} 본문 로딩중...")
+            res = HTTP_CACHE.get(job['link'], headers=HEADERS, timeout=10, fresh=RECHECK_SECONDS if known else None)
             res.encoding = res.apparent_encoding
-            soup = BeautifulSoup(res.text, 'html.parser')
-            
-            # 인크루트 상세 본문 영역 추출
-            content_html = soup.select_one('.job_view_box') or soup.select_one('.view_con') or soup.select_one('.d_ca_list')
-            
-            content = str(content_html) if content_html else "<p>상세 내용은 아래 '원문 공고 확인하기'를 통해 확인해 주세요.</p>"
-            content_text = content_html.text if content_html else f"{job['title']} {job['company']}"
+            content, content_text = parse_private_detail(res.text, job)
+
+            # 본문/제목/마감일이 그대로면 뉴스 재수집과 파일 재작성 생략
+            source_hash = content_hash(f"{job['title']}\n{job['deadline']}\n{content}")
+            if known and entry.get("source_hash") == source_hash:
+                counts["skipped"] += 1
+                print(f"  ⏭️ 변경 없음: {filename}")
+                continue
+            if known: print(f"♻️ [변경감지] {job['company']} 페이지 갱신...")
 
             # 키워드 추출
             keywords = extract_keywords_from_text(content_text)
@@ -571,41 +749,39 @@ def create_private_pages():
                 news_area_html = "<div style='padding:15px; text-align:center; color:#64748b;'>최근 뉴스가 없습니다.</div>"
 
             # HTML 생성
-            full_html = JOB_TEMPLATE.format(
-                org_name=job['company'],
-                title=job['title'],
-                end_date=job['deadline'],
-                content=content,
-                consult_link=MY_CONSULTING_LINK,
-                home_link=MY_HOME_LINK,
-                original_url=job['link'],
-                keyword_chips=keyword_chips_html,
-                render_server_url=RENDER_SERVER_URL,
-                job_id="P"+job_id,
-                news_area=news_area_html
-            )
+            render_args = (job, job_id, content, keyword_chips_html, news_area_html)
+            full_html = render_private_page(*render_args)
 
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(full_html)
+            manifest.record(filename, "P"+job_id, job['company'], job['title'], job['deadline'], full_html, source_hash=source_hash)
+            counts["updated" if exists else "new"] += 1
+            if insights: written.append((filename, source_hash, content_text, render_args))
             
             print(f"  ✅ 생성완료: {filename}")
 
         except Exception as e:
+            counts["failed"] += 1
             print(f"  ❌ 실패 ({job['company']}): {e}")
 
-    # [중요] 폴더에 있는 모든 파일을 긁어와서 목록을 생성 (누적 적용)
-    if os.path.exists(SAVE_DIR):
-        all_files = [f for f in os.listdir(SAVE_DIR) if f.endswith(".html") and not f.startswith("db_data")]
-        # 최신순 정렬
-        all_files.sort(key=lambda x: os.path.getmtime(os.path.join(SAVE_DIR, x)), reverse=True)
-        
-        # 3. 목록 페이지 (jobs_private.html) 생성
-        create_list_page(all_files)
-        
-        # 4. 사이트맵 생성
-        create_sitemap(all_files)
+    if insights and written:
+        print(f"\n🧠 페이지 {len(written)}개에 AI 분석 추가 중...")
+        add_ai_insights(insights, written, manifest)
+
+    migrate_legacy_pages(manifest)
+    manifest.save()
+    print(f"\n📊 신규 {counts['new']} · 갱신 {counts['updated']} · 변경 없음 {counts['skipped']} · 실패 {counts['failed']}")
+
+    # [중요] 지금까지 만든 모든 페이지로 목록을 생성 (누적 적용, 폴더 대신 manifest 사용)
+    pages = manifest.newest_first()
+    
+    # 3. 목록 페이지 (jobs_private.html) 생성
+    create_list_page(pages)
+    
+    # 4. 사이트맵 생성
+    create_sitemap(pages)
 
-def create_list_page(files):
+def create_list_page(pages):
     list_html = """<!DOCTYPE html>
 <html lang="ko">
 <head>
@@ -630,7 +806,7 @@ def create_list_page(files):
     <div class="search-container">
         <input type="text" id="jobSearch" placeholder="🔍 기업명 검색 (예: 삼성, 현대, 카카오...)">
         <div style="margin-top:10px; font-size:0.9rem; color:#64748b; font-weight:bold;">
-            현재 게시된 공고: <span style="color:#0f172a;">""" + str(len(files)) + """개</span>
+            현재 게시된 공고: <span style="color:#0f172a;">""" + str(len(pages)) + """개</span>
         </div>
         <a href="index.html" style="display:inline-block; margin-top:15px; color:#2563eb; font-weight:bold; text-decoration:none;">🏠 홈으로 돌아가기</a>
     </div>
@@ -638,9 +814,10 @@ def create_list_page(files):
     <div id="jobList">
 """
     
-    for f in files:
-        name = f.replace(".html", "").split("_", 1)[1] if "_" in f else f
-        list_html += f'<a href="{SAVE_DIR}/{f}" class="card" target="_blank"><h3>{name} 합격자소서 공개 & 행동중심 면접 전략</h3><p>🎯 전담 AI의 실시간 합격 전략 및 데이터 확인</p></a>'
+    list_html += "".join(
+        f'<a href="{SAVE_DIR}/{page["file"]}" class="card" target="_blank"><h3>{page["org"]} 합격자소서 공개 & 행동중심 면접 전략</h3><p>🎯 전담 AI의 실시간 합격 전략 및 데이터 확인</p></a>'
+        for page in pages
+    )
         
     list_html += """
     </div>
@@ -663,25 +840,35 @@ def create_list_page(files):
 </body>
 </html>"""
     
-    with open(LIST_FILENAME, "w", encoding="utf-8") as f: f.write(list_html)
+    write_if_changed(LIST_FILENAME, list_html)
     print(f"\n✅ 목록 페이지 생성 완료: {LIST_FILENAME}")
 
-def create_sitemap(files):
-    today = datetime.now().strftime("%Y-%m-%d")
+def create_sitemap(pages):
     sitemap_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
     sitemap_content += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
     
     sitemap_content += f'  <url><loc>{MY_HOME_LINK}/{LIST_FILENAME}</loc><priority>0.9</priority></url>\n'
     
-    for f in files:
-        full_url = f"{MY_HOME_LINK}/{SAVE_DIR}/{f}"
-        sitemap_content += f'  <url>\n    <loc>{full_url}</loc>\n    <lastmod>{today}</lastmod>\n    <priority>0.8</priority>\n  </url>\n'
+    # lastmod = 페이지 내용이 마지막으로 바뀐 날
+    sitemap_content += "".join(
+        f'  <url>\n    <loc>{MY_HOME_LINK}/{SAVE_DIR}/{page["file"]}</loc>\n    <lastmod>{page["updated"][:10]}</lastmod>\n    <priority>0.8</priority>\n  </url>\n'
+        for page in pages
+    )
     
     sitemap_content += '</urlset>'
     
-    with open(SITEMAP_FILENAME, "w", encoding="utf-8") as f:
-        f.write(sitemap_content)
+    write_if_changed(SITEMAP_FILENAME, sitemap_content)
     print("✅ 사기업용 sitemap_private.xml 생성 완료")
 
 if __name__ == "__main__":
-    create_private_pages()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--full", action="store_true", help="변경 여부와 관계없이 모든 공고를 다시 수집/생성")
+    parser.add_argument("--ai-insights", choices=["http", "stub", "off"], help="생성/갱신한 페이지에 AI 분석 미리 생성 (기본: 환경변수 AI_INSIGHTS, 없으면 끔)")
+    args = parser.parse_args()
+
+    insights = ai_insights.from_env(args.ai_insights, RENDER_SERVER_URL)
+    create_private_pages(full=args.full, insights=insights)
+    HTTP_CACHE.report("main_private")
+    HTTP_CACHE.client.report("main_private")
+    HTTP_CACHE.prune()
+    if insights: insights.report("main_private")
\ No newline at end of file
@@ -0,0 +1,137 @@
+import threading
+import time
+from contextlib import contextmanager
+
+# ==========================================
+# 서버 지표 (Prometheus 텍스트 형식, /metrics)
+# ==========================================
+# - 외부 라이브러리 없이 카운터 / 히스토그램만 구현 (ttl_cache.py 처럼 직접 관리)
+# - app.py(Flask) 와 asgi_app.py 가 같은 REGISTRY 를 쓰고 /metrics 로 render() 결과를 내보냄
+# - 값은 프로세스별 (gunicorn 워커가 여러 개면 워커마다 따로 집계됨)
+# - 히스토그램은 누적 버킷(le) + _sum + _count → 평균 / 분위수(histogram_quantile) 계산 가능
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)
+FAST_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+SIZE_BUCKETS = (0, 100, 500, 1000, 2000, 5000, 10000, 20000, 50000)
+
+def _label_key(labelnames, labels):
+    if set(labels) != set(labelnames):
+        raise ValueError(f"레이블이 맞지 않습니다: {sorted(labels)} (필요: {list(labelnames)})")
+    return tuple(str(labels[name]) for name in labelnames)
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(labelnames, key, extra=()):
+    pairs = list(zip(labelnames, key)) + list(extra)
+    if not pairs: return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+def _format_value(value):
+    if value == float("inf"): return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Counter:
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.lock = threading.Lock()
+        self.values = {}  # 레이블 값 튜플 → 누적 값
+
+    def inc(self, amount=1, **labels):
+        key = _label_key(self.labelnames, labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self.lock:
+            for key, value in sorted(self.values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+class Histogram:
+    def __init__(self, name, help_text, buckets=LATENCY_BUCKETS, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self.labelnames = tuple(labelnames)
+        self.lock = threading.Lock()
+        self.series = {}  # 레이블 값 튜플 → [버킷별 건수, 합계, 건수]
+
+    def observe(self, value, **labels):
+        key = _label_key(self.labelnames, labels)
+        with self.lock:
+            series = self.series.get(key)
+            if series is None:
+                series = self.series[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        # with HISTOGRAM.time(intent="CHAT"): ... → 블록 실행 시간(초) 기록 (예외가 나도 기록)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self.lock:
+            for key, (counts, total, count) in sorted(self.series.items()):
+                cumulative = 0
+                for bound, n in zip(self.buckets, counts):
+                    cumulative += n
+                    labels = _format_labels(self.labelnames, key, [("le", _format_value(bound))])
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+                lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def counter(self, name, help_text, labelnames=()):
+        metric = Counter(name, help_text, labelnames)
+        self.metrics.append(metric)
+        return metric
+
+    def histogram(self, name, help_text, buckets=LATENCY_BUCKETS, labelnames=()):
+        metric = Histogram(name, help_text, buckets, labelnames)
+        self.metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self.metrics: lines += metric.render()
+        return "\n".join(lines) + "\n"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+REGISTRY = Registry()
+
+# ------------------------------------------
+# 채팅 서버 지표 (app.py / asgi_app.py 공용)
+# ------------------------------------------
+CHAT_REQUESTS = REGISTRY.counter(
+    "chat_requests_total", "채팅 요청 수 (의도별, 엔드포인트별)", ["endpoint", "intent"])
+CHAT_SECONDS = REGISTRY.histogram(
+    "chat_request_seconds", "채팅 요청 처리 시간 (스트리밍은 마지막 토큰까지)", LATENCY_BUCKETS, ["endpoint", "intent"])
+LLM_SECONDS = REGISTRY.histogram(
+    "llm_chat_completion_seconds", "client.chat_completion 호출 시간 (스트리밍은 전체 수신까지)", LATENCY_BUCKETS, ["mode", "outcome"])
+SEARCH_WEB_SECONDS = REGISTRY.histogram(
+    "search_web_seconds", "search_web (DuckDuckGo) 호출 시간", LATENCY_BUCKETS, ["outcome"])
+SEARCH_DB_SECONDS = REGISTRY.histogram(
+    "search_db_seconds", "합격 DB 검색 시간 (요청당 1번, 답을 낸 방식별: tfidf / keyword)", FAST_BUCKETS, ["method"])
+CONTEXT_CHARS = REGISTRY.histogram(
+    "chat_context_chars", "요청 context 길이 (글자 수)", SIZE_BUCKETS, ["endpoint"])
+ERRORS = REGISTRY.counter(
+    "chat_errors_total", "실패 경로별 오류 수", ["path"])
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+
+# ==========================================
+# 생성 페이지 목록(manifest) 저장소
+# ==========================================
+# - 페이지를 쓸 때마다 (파일명, ID, 기관명, 제목, 마감일, 생성/수정 시각, 내용 해시)를 기록
+# - 목록(jobs.html)과 사이트맵은 폴더를 listdir/getmtime 으로 훑지 않고 이 기록만 읽어 만듦
+# - 기록 순서 = 마지막으로 쓴 순서 (기존 getmtime 최신순 정렬과 같은 결과, 정렬 불필요)
+# - manifest 파일이 없으면 기존 폴더의 html 을 한 번 훑어서 만듦 (첫 실행 1회)
+# - 저장은 임시 파일에 쓴 뒤 교체(os.replace)하므로 중간에 끊겨도 이전 기록이 남음
+# - 폴더에서 지워진 페이지는 목록을 만들거나 저장할 때 기록에서도 뺌 (listdir 1번, 죽은 링크 방지)
+
+MANIFEST_VERSION = 1
+
+_TITLE_RE = re.compile(r'<h1 class="job-title">(.*?)</h1>', re.S)
+_ORG_RE = re.compile(r'기관명: <strong>(.*?)</strong> \| 마감일: (.*?)</div>', re.S)
+
+def content_hash(text):
+    if isinstance(text, str): text = text.encode('utf-8')
+    return hashlib.sha1(text).hexdigest()
+
+def write_if_changed(path, content):
+    # 내용이 같으면 파일을 다시 쓰지 않음 (수정 시각/배포 변경 최소화). 새로 썼으면 True
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            if f.read() == content: return False
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(content)
+    return True
+
+class PageManifest:
+    def __init__(self, path, save_dir):
+        self.path = path
+        self.save_dir = save_dir
+        self.pages = {}   # 파일명 → 항목 (dict 순서 = 마지막으로 쓴 순서)
+        self.dirty = False
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for page in json.load(f).get("pages", []):
+                    self.pages[page["file"]] = page
+        else:
+            self.bootstrap()
+
+    def bootstrap(self):
+        # 기존 폴더의 페이지를 (수정 시각 순으로) 한 번만 읽어 manifest 초기화
+        if not os.path.exists(self.save_dir): return
+        files = [f for f in os.listdir(self.save_dir) if f.endswith(".html") and not f.startswith("db_data")]
+        files.sort(key=lambda x: os.path.getmtime(os.path.join(self.save_dir, x)))
+
+        for filename in files:
+            filepath = os.path.join(self.save_dir, filename)
+            with open(filepath, 'r', encoding='utf-8') as f: html = f.read()
+            if 'http-equiv="refresh"' in html: continue  # 옮겨진 페이지의 주소 안내 (목록에 넣지 않음)
+            stem = filename[:-len(".html")]
+            page_id, _, safe_name = stem.partition("_")
+            title_m, org_m = _TITLE_RE.search(html), _ORG_RE.search(html)
+            stamp = datetime.fromtimestamp(os.path.getmtime(filepath)).isoformat(timespec="seconds")
+            self.pages[filename] = {
+                "file": filename,
+                "id": page_id,
+                "org": org_m.group(1).strip() if org_m else (safe_name or stem),
+                "title": title_m.group(1).strip() if title_m else "",
+                "deadline": org_m.group(2).strip() if org_m else "",
+                "created": stamp,
+                "updated": stamp,
+                "hash": content_hash(html),
+            }
+        self.dirty = True
+        print(f"🗂️ [manifest] 기존 페이지 {len(self.pages)}개로 {self.path} 초기화")
+
+    def __len__(self):
+        return len(self.pages)
+
+    def get(self, filename):
+        return self.pages.get(filename)
+
+    def record(self, filename, page_id, org, title, deadline, html, source_hash=None):
+        # source_hash: 페이지를 만든 원본(상세 본문 등)의 해시 → 다음 실행에서 변경 여부 판단용
+        now = datetime.now().isoformat(timespec="seconds")
+        digest = content_hash(html)
+        old = self.pages.pop(filename, None)
+        entry = self.pages[filename] = {
+            "file": filename,
+            "id": page_id,
+            "org": org,
+            "title": title,
+            "deadline": deadline,
+            "created": old["created"] if old else now,
+            # 내용이 바뀐 경우에만 수정 시각 갱신 (사이트맵 lastmod 로 사용)
+            "updated": old["updated"] if old and old["hash"] == digest else now,
+            "hash": digest,
+        }
+        if source_hash is not None: entry["source_hash"] = source_hash
+        self.dirty = True
+
+    def remove(self, filename):
+        # 목록/사이트맵에서 뺄 페이지 (파일은 그대로 둠)
+        if self.pages.pop(filename, None) is not None: self.dirty = True
+
+    def prune(self):
+        # 폴더에 더 이상 없는 파일의 항목 제거 → 제거한 파일명 목록
+        existing = set(os.listdir(self.save_dir)) if os.path.isdir(self.save_dir) else set()
+        removed = [filename for filename in self.pages if filename not in existing]
+        for filename in removed: del self.pages[filename]
+        if removed:
+            self.dirty = True
+            print(f"🗂️ [manifest] 폴더에 없는 페이지 {len(removed)}개를 목록에서 제외")
+        return removed
+
+    def newest_first(self):
+        self.prune()
+        return list(reversed(self.pages.values()))
+
+    def save(self):
+        self.prune()
+        if not self.dirty: return
+        tmp_path = self.path + ".tmp"
+        # 페이지 하나당 한 줄 (git diff 에서 바뀐 페이지만 보이도록)
+        lines = ",\n".join(json.dumps(page, ensure_ascii=False) for page in self.pages.values())
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(f'{{"version": {MANIFEST_VERSION}, "pages": [\n{lines}\n]}}\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self.dirty = False
@@ -0,0 +1,125 @@
+import argparse
+import glob
+import gzip
+import json
+import os
+
+from page_manifest import content_hash
+
+try:
+    import brotli  # 선택: pip install brotli (없으면 .gz 만 만듦)
+except ImportError:
+    brotli = None
+
+# ==========================================
+# 생성 결과물 사전 압축 (.gz / .br)
+# ==========================================
+# - main.py / main_private.py 실행 뒤에 돌려 생성된 html / js / json / xml 옆에
+#   같은 이름 + .gz (+ brotli 가 설치되어 있으면 .br) 파일을 만듦
+#   → 웹 서버/CDN 이 요청마다 압축하지 않고 미리 압축된 파일을 그대로 보낼 수 있음
+# - gzip 헤더의 시각(mtime)은 0 으로 고정 → 내용이 같으면 압축 파일도 바이트 단위로 같음 (git 변경 없음)
+# - 원본 내용 해시를 STATE_FILE 에 기록해 두고, 해시가 같고 압축 파일이 있으면 다시 압축하지 않음
+# - 원본이 사라진 .gz / .br 는 삭제 (예: 정리된 DB 샤드)
+# - 종류별(상세 페이지 / DB / 목록 / 사이트맵)로 원본·압축 크기와 절약량 출력
+#
+# 사용법: python precompress.py [--force] [--no-brotli]
+
+STATE_FILE = "precompress_state.json"
+MIN_SIZE = 256   # 이보다 작은 파일은 압축 이득이 없어 건너뜀
+
+# 종류 → 대상 파일 패턴
+ARTIFACT_CLASSES = {
+    "상세 페이지": ["jobs_html/*.html", "jobs_private_html/*.html"],
+    "DB": ["jobs_html/db_data*.js", "jobs_private_html/db_data*.js",
+           "jobs_html/db/*.json", "jobs_private_html/db/*.json"],
+    "정적 파일": ["jobs_html/static/*.css", "jobs_html/static/*.js",
+                  "jobs_private_html/static/*.css", "jobs_private_html/static/*.js"],
+    "목록": ["jobs.html", "jobs_private.html"],
+    "사이트맵": ["sitemap.xml", "sitemap_private.xml"],
+}
+
+def load_state():
+    if not os.path.exists(STATE_FILE): return {}
+    with open(STATE_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_state(state):
+    tmp_path = STATE_FILE + ".tmp"
+    # 파일 하나당 한 줄 (git diff 에서 바뀐 파일만 보이도록)
+    lines = ",\n".join(f"{json.dumps(path, ensure_ascii=False)}: {json.dumps(digest)}" for path, digest in sorted(state.items()))
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(f"{{\n{lines}\n}}\n")
+    os.replace(tmp_path, STATE_FILE)
+
+def gzip_bytes(raw):
+    return gzip.compress(raw, compresslevel=9, mtime=0)
+
+def brotli_bytes(raw):
+    return brotli.compress(raw, quality=11)
+
+def sibling_size(path):
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+def precompress(force=False, use_brotli=True):
+    encoders = [(".gz", gzip_bytes)]
+    if use_brotli and brotli is not None: encoders.append((".br", brotli_bytes))
+    elif use_brotli:
+        print("ℹ️ [압축] brotli 모듈이 없어 .gz 만 만듭니다 (pip install brotli)")
+
+    old_state = load_state()
+    state = {}
+    report = {}
+
+    for label, patterns in ARTIFACT_CLASSES.items():
+        stat = report[label] = {"files": 0, "written": 0, "raw": 0, ".gz": 0, ".br": 0}
+        paths = sorted({p for pattern in patterns for p in glob.glob(pattern)})
+        for path in paths:
+            with open(path, 'rb') as f: raw = f.read()
+            if len(raw) < MIN_SIZE: continue
+            key = path.replace(os.sep, "/")
+            digest = state[key] = content_hash(raw)
+
+            up_to_date = (not force and old_state.get(key) == digest
+                          and all(os.path.exists(path + ext) for ext, _ in encoders))
+            if not up_to_date:
+                for ext, encode in encoders:
+                    with open(path + ext, 'wb') as f: f.write(encode(raw))
+                stat["written"] += 1
+
+            stat["files"] += 1
+            stat["raw"] += len(raw)
+            for ext, _ in encoders: stat[ext] += sibling_size(path + ext)
+
+    # 원본이 없어졌거나 더 이상 대상이 아닌 압축 파일 정리
+    removed = 0
+    for label, patterns in ARTIFACT_CLASSES.items():
+        for pattern in patterns:
+            for ext in (".gz", ".br"):
+                for path in glob.glob(pattern + ext):
+                    if path[:-len(ext)].replace(os.sep, "/") not in state:
+                        os.remove(path)
+                        removed += 1
+
+    save_state(state)
+    print_report(report, [ext for ext, _ in encoders], removed)
+    return report
+
+def print_report(report, exts, removed):
+    print(f"📦 [압축] {'종류':<8}{'파일':>6}{'새로':>6}{'원본 KB':>10}" + "".join(f"{ext + ' KB':>10}{'절약':>7}" for ext in exts))
+    total = {"files": 0, "written": 0, "raw": 0, ".gz": 0, ".br": 0}
+    for label, stat in list(report.items()) + [("합계", total)]:
+        if label != "합계":
+            for k in total: total[k] += stat[k]
+        cols = ""
+        for ext in exts:
+            saved = 1 - stat[ext] / stat["raw"] if stat["raw"] else 0
+            cols += f"{stat[ext] // 1024:>10}{saved:>7.0%}"
+        print(f"📦 [압축] {label:<8}{stat['files']:>6}{stat['written']:>6}{stat['raw'] // 1024:>10}{cols}")
+    if removed: print(f"🧹 [압축] 원본이 없는 압축 파일 {removed}개 삭제")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="생성된 html/js/json/xml 을 .gz/.br 로 미리 압축")
+    parser.add_argument("--force", action="store_true", help="내용 해시와 관계없이 전부 다시 압축")
+    parser.add_argument("--no-brotli", action="store_true", help=".br 은 만들지 않음")
+    args = parser.parse_args()
+    precompress(force=args.force, use_brotli=not args.no_brotli)
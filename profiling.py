@@ -0,0 +1,172 @@
+import contextvars
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+# ==========================================
+# 요청 단위 프로파일링 (선택 실행, /debug/profiles 로 조회)
+# ==========================================
+# - 느린 요청 하나가 의도 분류 / DB 검색 / 웹 검색 / LLM 중 어디서 시간을 썼는지 단계별로 기록
+# - 켜는 방법 (둘 다 없으면 아무것도 기록하지 않음)
+#   · 표본 추출: 환경변수 PROFILE_SAMPLE_RATE=0.05 → 요청의 5% 를 기록
+#   · 요청별:    PROFILE_TOKEN 을 정해 두고 요청 헤더 X-Profile: <토큰> 을 보내면 그 요청을 기록
+#                (X-Profile-Trace: 1 을 함께 보내거나 PROFILE_TRACE=1 이면 스택 샘플링 추적도 기록)
+# - 단계 기록: 코드 곳곳의 with stage("search_db"): ... (중첩되면 "build_messages>search_db" 처럼 경로로 기록)
+#   기록 중이 아닐 때 stage() 는 ContextVar 조회 1번 + 재사용 nullcontext → 사실상 비용 없음
+# - 스택 추적: 별도 스레드가 PROFILE_INTERVAL_MS 마다 sys._current_frames() 로 요청 스레드의 스택을 읽어
+#   "함수;함수;함수" 형태(flamegraph folded)로 횟수를 셈 (비동기 서버는 이벤트 루프 스레드 전체가 찍힘)
+# - 결과는 최근 PROFILE_BUFFER 건만 메모리 링 버퍼에 보관, /debug/profiles 로 조회
+#   (PROFILE_TOKEN 이 없으면 조회 경로도 닫힘, 헤더 X-Profile 또는 ?token= 으로 토큰 확인)
+
+_CURRENT = contextvars.ContextVar("profile", default=None)
+_NULL = nullcontext()
+TRACE_TOP = 50  # 추적 결과에 남길 스택 수 (많이 찍힌 순)
+
+def _header(headers, name):
+    # Flask 의 request.headers 또는 ASGI scope["headers"] (bytes 쌍 목록)
+    if headers is None: return None
+    if isinstance(headers, list):
+        target = name.lower().encode()
+        for key, value in headers:
+            if key.lower() == target: return value.decode("latin-1")
+        return None
+    return headers.get(name)
+
+class StackSampler(threading.Thread):
+    def __init__(self, thread_id, interval):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None: continue
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(names))] += 1
+            self.samples += 1
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        return {"samples": self.samples, "interval_ms": self.interval * 1000,
+                "stacks": [{"stack": stack, "count": n} for stack, n in self.stacks.most_common(TRACE_TOP)]}
+
+class Profile:
+    def __init__(self, endpoint, label, reason):
+        self.endpoint = endpoint
+        self.label = label
+        self.reason = reason
+        self.started = datetime.now().isoformat(timespec="milliseconds")
+        self.start = time.perf_counter()
+        self.stages = {}   # 경로 → [누적 초, 횟수] (기록 순서 유지)
+        self.path = []
+        self.attrs = {}
+
+    @contextmanager
+    def stage(self, name):
+        self.path.append(name)
+        key = ">".join(self.path)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = self.stages.setdefault(key, [0.0, 0])
+            entry[0] += time.perf_counter() - start
+            entry[1] += 1
+            self.path.pop()
+
+    def to_dict(self, total, trace):
+        result = {
+            "started": self.started,
+            "endpoint": self.endpoint,
+            "message": self.label[:30],
+            "reason": self.reason,
+            "total_ms": round(total * 1000, 2),
+            "stages": [{"stage": key, "ms": round(sec * 1000, 2), "calls": n} for key, (sec, n) in self.stages.items()],
+            **self.attrs,
+        }
+        if trace is not None: result["trace"] = trace
+        return result
+
+class Profiler:
+    def __init__(self, sample_rate=0.0, token=None, trace=False, buffer_size=100, interval_ms=5):
+        self.sample_rate = sample_rate
+        self.token = token
+        self.trace = trace
+        self.interval = interval_ms / 1000
+        self.lock = threading.Lock()
+        self.profiles = deque(maxlen=buffer_size)
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            sample_rate=float(os.environ.get("PROFILE_SAMPLE_RATE", 0)),
+            token=os.environ.get("PROFILE_TOKEN") or None,
+            trace=os.environ.get("PROFILE_TRACE", "") == "1",
+            buffer_size=int(os.environ.get("PROFILE_BUFFER", 100)),
+            interval_ms=float(os.environ.get("PROFILE_INTERVAL_MS", 5)),
+        )
+
+    @property
+    def enabled(self):
+        return self.sample_rate > 0 or self.token is not None
+
+    def authorized(self, headers, query_token=None):
+        # 조회 경로 접근 확인 (토큰이 정해져 있지 않으면 항상 거부)
+        if not self.token: return False
+        return self.token in (_header(headers, "X-Profile"), query_token)
+
+    def request(self, endpoint, label="", headers=None):
+        # with PROFILER.request("chat", user_msg, request.headers): ... → 이 요청을 기록할지 결정
+        if not self.enabled: return _NULL
+        if self.token and _header(headers, "X-Profile") == self.token:
+            reason, trace = "header", self.trace or _header(headers, "X-Profile-Trace") == "1"
+        elif self.sample_rate > 0 and random.random() < self.sample_rate:
+            reason, trace = "sampled", self.trace
+        else:
+            return _NULL
+        return self._record(endpoint, label, reason, trace)
+
+    @contextmanager
+    def _record(self, endpoint, label, reason, trace):
+        profile = Profile(endpoint, label, reason)
+        sampler = StackSampler(threading.get_ident(), self.interval) if trace else None
+        if sampler: sampler.start()
+        reset = _CURRENT.set(profile)
+        try:
+            yield profile
+        finally:
+            _CURRENT.reset(reset)
+            total = time.perf_counter() - profile.start
+            result = profile.to_dict(total, sampler.stop() if sampler else None)
+            with self.lock:
+                self.profiles.append(result)
+
+    def snapshot(self):
+        with self.lock:
+            return list(reversed(self.profiles))  # 최신순
+
+def stage(name):
+    # 기록 중인 요청이 있으면 단계 시간을 더하고, 없으면 아무 일도 하지 않음
+    profile = _CURRENT.get()
+    return profile.stage(name) if profile is not None else _NULL
+
+def annotate(**attrs):
+    # 기록 중인 요청에 값 추가 (예: intent, cache="hit")
+    profile = _CURRENT.get()
+    if profile is not None: profile.attrs.update(attrs)
+
+PROFILER = Profiler.from_env()
@@ -0,0 +1,38 @@
+import json
+import os
+
+from page_manifest import content_hash
+
+# ==========================================
+# 공고 페이지 공용 CSS / JS 정적 파일
+# ==========================================
+# - 예전: 공고 페이지마다 같은 <style> / <script> (약 20KB) 를 그대로 넣음
+#   → 페이지 수만큼 같은 바이트가 반복되고, 브라우저가 페이지 사이에서 캐시하지 못함
+# - 지금: <SAVE_DIR>/static/<이름>.<내용 해시>.css|js 로 한 번만 쓰고 페이지는 링크만 넣음
+#   · 파일명에 내용 해시 → 내용이 바뀌면 이름도 바뀜 (CDN/브라우저 캐시를 길게 둬도 안전)
+#   · 예전 해시 파일은 지우지 않음 (다시 만들지 않은 기존 페이지가 계속 참조)
+# - 페이지마다 다른 값(기관명, 서버 주소 등)은 <script type="application/json"> 한 블록으로 전달
+#   (공용 JS 가 PAGE = JSON.parse(...) 로 읽음)
+
+STATIC_DIR = "static"
+
+_published = {}  # (save_dir, 이름, 해시) → 페이지 기준 상대 경로
+
+def publish_asset(save_dir, name, text):
+    # name 예: "job.css" → static/job.<해시10>.css (같은 내용이면 다시 쓰지 않음)
+    digest = content_hash(text)[:10]
+    key = (save_dir, name, digest)
+    if key not in _published:
+        stem, ext = os.path.splitext(name)
+        rel_path = f"{STATIC_DIR}/{stem}.{digest}{ext}"
+        path = os.path.join(save_dir, rel_path)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(text)
+        _published[key] = rel_path
+    return _published[key]
+
+def inline_json(data):
+    # <script type="application/json"> 안에 넣을 JSON ('</script>' 등으로 블록이 끊기지 않게 < 를 이스케이프)
+    return json.dumps(data, ensure_ascii=False).replace("<", "\\u003c")
@@ -0,0 +1,91 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import app
+import asgi_app
+
+# ==========================================
+# 스트리밍 중복 질문 합치기: leader 가 도중에 끊겨도 기다리던 요청은 전체 답변을 받아야 함
+# ==========================================
+# LLM 은 토큰을 천천히 내보내는 가짜 스트림으로 바꾸고, DB/웹 검색(build_messages)은 건너뜀
+
+TOKENS = ["첫 ", "번째 ", "답변 ", "전체"]
+FULL_ANSWER = "".join(TOKENS)
+
+def _chunk(token):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=token))])
+
+def _wait_until(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "시간 초과"
+        time.sleep(0.01)
+
+def test_stream_follower_regenerates_when_leader_disconnects(monkeypatch):
+    message = "자기소개서 첨삭 부탁드립니다 (sync)"
+
+    def chat_completion(**kwargs):
+        for token in TOKENS:
+            time.sleep(0.01)
+            yield _chunk(token)
+
+    monkeypatch.setattr(app.client, "chat_completion", chat_completion)
+    monkeypatch.setattr(app, "build_messages", lambda user_input, context="": ("CONSULTING", []))
+
+    leader = app.ask_kim_pro_stream(message)
+    assert next(leader) == TOKENS[0]
+
+    shared_before = app.ANSWER_FLIGHT.shared
+    follower_result = []
+    follower = threading.Thread(target=lambda: follower_result.extend(app.ask_kim_pro_stream(message)))
+    follower.start()
+    _wait_until(lambda: app.ANSWER_FLIGHT.shared > shared_before)
+
+    leader.close()  # 첫 토큰만 받고 연결 끊김
+    follower.join(5)
+
+    assert "".join(follower_result) == FULL_ANSWER
+    key = app.answer_cache_key("CONSULTING", message, "")
+    assert app.ANSWER_CACHE.get(key) == FULL_ANSWER
+
+def test_async_stream_follower_regenerates_when_leader_disconnects(monkeypatch):
+    message = "자기소개서 첨삭 부탁드립니다 (async)"
+
+    async def stream():
+        for token in TOKENS:
+            await asyncio.sleep(0.01)
+            yield _chunk(token)
+
+    async def chat_completion(**kwargs):
+        return stream()
+
+    async def build_messages_async(user_input, context=""):
+        return "CONSULTING", []
+
+    monkeypatch.setattr(asgi_app.async_client, "chat_completion", chat_completion)
+    monkeypatch.setattr(asgi_app, "build_messages_async", build_messages_async)
+
+    async def collect():
+        return "".join([token async for token in asgi_app.ask_kim_pro_stream_async(message)])
+
+    async def scenario():
+        leader = asgi_app.ask_kim_pro_stream_async(message)
+        assert await leader.__anext__() == TOKENS[0]
+
+        shared_before = asgi_app.ASYNC_FLIGHT.shared
+        follower = asyncio.ensure_future(collect())
+        while asgi_app.ASYNC_FLIGHT.shared == shared_before:
+            await asyncio.sleep(0.01)
+
+        await leader.aclose()  # 첫 토큰만 받고 연결 끊김
+        return await asyncio.wait_for(follower, 5)
+
+    assert asyncio.run(scenario()) == FULL_ANSWER
+    key = app.answer_cache_key("CONSULTING", message, "")
+    assert app.ANSWER_CACHE.get(key) == FULL_ANSWER
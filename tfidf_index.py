@@ -0,0 +1,170 @@
+import hashlib
+import os
+import time
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:  # 선택: pip install numpy scipy (없으면 app.py 는 SubstringIndex 검색만 사용)
+    np = sparse = None
+
+# ==========================================
+# 합격 DB 관련도 순 검색 (문자 n-gram TF-IDF, 코사인 상위 k)
+# ==========================================
+# - 질문의 첫 단어 하나만 찾던 search_db() 대신, 질문 전체와 가장 비슷한 자소서를 점수 순으로 반환
+# - 띄어쓰기/조사 변화에 강하도록 단어가 아닌 문자 2~3-gram 을 씀 (공백은 한 칸으로 정리, 영문은 소문자)
+# - 어휘 사전 없이 n-gram 을 2^HASH_BITS 칸으로 해시 (feature hashing) → 문서 묶음별로 numpy 로 한 번에 계산
+# - 가중치: (1 + log tf) × idf, 문서별 L2 정규화 → 질의 벡터와의 내적 = 코사인 유사도
+# - 검색: 행렬을 열(n-gram) 기준(CSC)으로 보관하고 질의에 나온 열만 잘라 곱함 → 전체 문서를 훑지 않음
+#   상위 k 는 argpartition 으로 (10만 건에서 수 ms)
+# - 실제로 문서에 나온 n-gram 열만 남겨 번호를 0.. 으로 다시 매김 (used_cols: 정렬된 해시 열 번호)
+#   → 메모리와 저장본 크기가 2^HASH_BITS 가 아닌 쓰인 열 수에 비례 (작은 DB 는 수십 KB)
+# - 색인은 .npz 로 저장해 두고, DB 내용(지문)이 같으면 다음 시작 때 다시 만들지 않고 읽음
+
+NGRAMS = (2, 3)
+HASH_BITS = 20
+CHUNK_DOCS = 5000        # 한 번에 n-gram 을 뽑을 문서 수 (메모리 상한)
+FORMAT_VERSION = 2       # 색인 계산/저장 방식을 바꾸면 올려서 저장본을 무효화
+_SEP = "\x00"            # 문서 경계 (이 글자가 들어간 n-gram 은 버림)
+_MIX = 0x9E3779B97F4A7C15
+
+def available():
+    return np is not None
+
+def normalize(text):
+    return " ".join(str(text).split()).lower()
+
+def fingerprint(items):
+    # DB 내용 + 색인 설정의 지문 (저장본이 지금 DB 로 만든 것인지 확인)
+    digest = hashlib.sha1(f"{FORMAT_VERSION}|{NGRAMS}|{HASH_BITS}|{len(items)}".encode())
+    for item in items:
+        digest.update(str(item).encode("utf-8", "surrogatepass"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+def _hashed_grams(texts):
+    # texts → (문서 번호 배열, 해시된 n-gram 열 번호 배열). 문서 경계를 넘는 n-gram 은 제외
+    joined = _SEP.join(texts) + _SEP
+    codes = np.frombuffer(joined.encode("utf-32-le", "surrogatepass"), dtype=np.uint32).astype(np.uint64)
+    lengths = np.fromiter((len(t) + 1 for t in texts), dtype=np.int64, count=len(texts))
+    doc_of = np.repeat(np.arange(len(texts), dtype=np.int32), lengths)
+    is_sep = codes == ord(_SEP)
+
+    docs, cols = [], []
+    shift = np.uint64(64 - HASH_BITS)
+    for n in NGRAMS:
+        if len(codes) < n: continue
+        span = len(codes) - n + 1
+        gram = np.full(span, n, dtype=np.uint64)
+        bad = np.zeros(span, dtype=bool)
+        for j in range(n):
+            gram = gram * np.uint64(0x110000) + codes[j:j + span]  # 넘치면 2^64 로 감김 (해시라 무방)
+            bad |= is_sep[j:j + span]
+        keep = ~bad
+        docs.append(doc_of[:span][keep])
+        cols.append(((gram[keep] * np.uint64(_MIX)) >> shift).astype(np.int32))
+    if not docs: return np.zeros(0, np.int32), np.zeros(0, np.int32)
+    return np.concatenate(docs), np.concatenate(cols)
+
+class TfidfIndex:
+    def __init__(self, matrix, used_cols, idf, key=None):
+        self.matrix = matrix        # 문서 × 쓰인 n-gram 열 (CSC, float32, 행 L2 정규화)
+        self.used_cols = used_cols  # 열 i 의 해시 열 번호 (오름차순)
+        self.idf = idf              # 열 i 의 idf
+        self.key = key
+        # 어느 문서에도 없는 n-gram 의 idf (df=0). 질의 벡터 정규화에만 쓰임
+        self.unseen_idf = np.float32(np.log(1 + matrix.shape[0]) + 1)
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    @classmethod
+    def build(cls, items, key=None):
+        width = 1 << HASH_BITS
+        blocks = []
+        for start in range(0, len(items), CHUNK_DOCS):
+            texts = [normalize(item) for item in items[start:start + CHUNK_DOCS]]
+            rows, cols = _hashed_grams(texts)
+            block = sparse.csr_matrix((np.ones(len(rows), np.float32), (rows, cols)), shape=(len(texts), width))
+            block.sum_duplicates()  # 같은 칸 → tf
+            np.log(block.data, out=block.data)
+            block.data += 1
+            blocks.append(block)
+        matrix = sparse.vstack(blocks, format="csr") if blocks else sparse.csr_matrix((0, width), dtype=np.float32)
+
+        # 쓰인 열만 남김 (해시 열 번호 → 0..len(used_cols)-1, 순서 유지. 정렬 없이 조회 배열로 변환)
+        df = np.bincount(matrix.indices, minlength=width)
+        used_cols = np.flatnonzero(df).astype(np.int32)
+        local = np.zeros(width, np.int32)
+        local[used_cols] = np.arange(len(used_cols), dtype=np.int32)
+        matrix = sparse.csr_matrix((matrix.data, local[matrix.indices], matrix.indptr), shape=(matrix.shape[0], len(used_cols)))
+
+        idf = (np.log((1 + len(items)) / (1 + df[used_cols])) + 1).astype(np.float32)
+        matrix.data *= idf[matrix.indices]
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel()).astype(np.float32)
+        norms[norms == 0] = 1
+        matrix.data /= np.repeat(norms, np.diff(matrix.indptr))
+        return cls(matrix.tocsc(), used_cols, idf, key)
+
+    def query_vector(self, text):
+        # 질의 → (열 번호, 가중치) — 문서와 같은 방식으로 n-gram 해시 + tf-idf + 정규화
+        # 정규화는 문서에 없는 n-gram 까지 포함해서 하고, 반환은 문서에 있는 열만 (나머지는 내적이 0)
+        _, cols = _hashed_grams([normalize(text)])
+        if not len(cols) or not len(self.used_cols): return np.zeros(0, np.int32), np.zeros(0, np.float32)
+        cols, counts = np.unique(cols, return_counts=True)
+        pos = np.minimum(np.searchsorted(self.used_cols, cols), len(self.used_cols) - 1)
+        seen = self.used_cols[pos] == cols
+        weights = (1 + np.log(counts)).astype(np.float32) * np.where(seen, self.idf[pos], self.unseen_idf)
+        weights /= np.linalg.norm(weights)
+        return pos[seen], weights[seen]
+
+    def search(self, text, k=3, min_score=0.0):
+        # 질문과 코사인 유사도가 높은 문서 상위 k → [(문서 번호, 점수)]
+        # 점수가 0 이거나 min_score 미만인 문서는 제외 (해시 충돌·"습니" 같은 흔한 bigram 만 겹친 경우)
+        n_docs = len(self)
+        cols, weights = self.query_vector(text)
+        if not len(cols) or not n_docs: return []
+        scores = self.matrix[:, cols] @ weights  # 질의에 나온 열만 잘라 곱함
+        k = min(k, n_docs)
+        top = np.argpartition(-scores, k - 1)[:k] if k < n_docs else np.arange(n_docs)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(doc), float(scores[doc])) for doc in top if scores[doc] > 0 and scores[doc] >= min_score]
+
+    # ------------------------------------------
+    # 저장 / 불러오기 (.npz, 압축 없음 → 읽기 빠름)
+    # ------------------------------------------
+    def save(self, path):
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        m = self.matrix
+        np.savez(tmp_path, data=m.data, indices=m.indices, indptr=m.indptr, shape=np.array(m.shape),
+                 used_cols=self.used_cols, idf=self.idf, key=np.array(self.key or ""))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as f:
+            matrix = sparse.csc_matrix((f["data"], f["indices"], f["indptr"]), shape=tuple(f["shape"]))
+            return cls(matrix, f["used_cols"], f["idf"], str(f["key"]))
+
+    @classmethod
+    def load_or_build(cls, items, path):
+        # 저장본의 지문이 지금 DB 와 같으면 읽고, 아니면 새로 만들어 저장
+        key = fingerprint(items)
+        start = time.time()
+        if path and os.path.exists(path):
+            try:
+                index = cls.load(path)
+                if index.key == key:
+                    print(f"🧮 [서버] TF-IDF 색인 불러옴 ({len(index)}건, {time.time() - start:.2f}초)")
+                    return index
+            except (OSError, ValueError, KeyError) as e:
+                print(f"⚠ [주의] TF-IDF 색인 저장본을 읽지 못해 새로 만듭니다: {e}")
+        index = cls.build(items, key)
+        print(f"🧮 [서버] TF-IDF 색인 생성 완료 ({len(index)}건, {time.time() - start:.2f}초)")
+        if path:
+            try:
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                index.save(path)
+            except OSError as e:
+                print(f"⚠ [주의] TF-IDF 색인을 저장하지 못했습니다: {e}")
+        return index
@@ -0,0 +1,168 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+
+# ==========================================
+# 공용 캐시 도구: LRU + TTL 캐시 / 중복 호출 합치기(single-flight)
+# ==========================================
+
+class TTLCache:
+    # 최근 사용 순(LRU)으로 max_size 개까지 보관, ttl 초가 지나면 만료
+    # stale_ttl > 0 이면 만료된 값도 그 시간 동안 get_stale() 로 꺼낼 수 있음 (장애 시 대체용)
+    def __init__(self, max_size=512, ttl=3600, stale_ttl=0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.data = OrderedDict()  # key → (저장 시각, 값)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None):
+        now = time.time()
+        with self.lock:
+            entry = self.data.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self.data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None and now - entry[0] >= self.ttl + self.stale_ttl:
+                del self.data[key]
+                self.expirations += 1
+            self.misses += 1
+            return default
+
+    def get_stale(self, key, default=None):
+        # 만료되었더라도 stale_ttl 이내라면 마지막으로 저장된 값 (통계에는 반영하지 않음)
+        with self.lock:
+            entry = self.data.get(key)
+            if entry is None or time.time() - entry[0] >= self.ttl + self.stale_ttl:
+                return default
+            return entry[1]
+
+    def set(self, key, value):
+        with self.lock:
+            self.data[key] = (time.time(), value)
+            self.data.move_to_end(key)
+            while len(self.data) > self.max_size:
+                self.data.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self):
+        return len(self.data)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "size": len(self.data),
+            "max_size": self.max_size,
+            "ttl_sec": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+class LeaderCancelled(Exception):
+    # leader 가 결과를 다 만들기 전에 취소됨 (스트리밍 연결 끊김 등)
+    # → 기다리던 쪽은 받은 데까지의 부분 결과를 쓰지 않고 다시 시도 (직접 leader 가 될 수 있음)
+    def __init__(self):
+        super().__init__("같은 질문을 생성하던 요청이 중간에 취소되었습니다")
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    # 같은 key 로 동시에 들어온 호출은 첫 호출(leader) 하나만 실행하고 나머지는 결과를 공유
+    def __init__(self):
+        self.calls = {}
+        self.lock = threading.Lock()
+        self.shared = 0  # leader 결과를 받아 간 중복 호출 수
+
+    def begin(self, key):
+        # (call, leader 여부). leader 는 작업 후 반드시 finish() 를 호출해야 함
+        with self.lock:
+            call = self.calls.get(key)
+            if call is not None:
+                self.shared += 1
+                return call, False
+            call = self.calls[key] = _Call()
+            return call, True
+
+    def finish(self, key, call, result=None, error=None):
+        call.result, call.error = result, error
+        with self.lock:
+            self.calls.pop(key, None)
+        call.event.set()
+
+    def wait(self, call):
+        call.event.wait()
+        if call.error is not None: raise call.error
+        return call.result
+
+    def do(self, key, fn):
+        while True:
+            call, leader = self.begin(key)
+            if leader: break
+            try:
+                return self.wait(call)
+            except LeaderCancelled:
+                continue
+        try:
+            result = fn()
+        except Exception as e:
+            self.finish(key, call, error=e)
+            raise
+        self.finish(key, call, result=result)
+        return result
+
+class AsyncSingleFlight:
+    # SingleFlight 의 asyncio 버전 (asgi_app.py 용, 이벤트 루프 하나에서만 사용)
+    def __init__(self):
+        self.calls = {}
+        self.shared = 0
+
+    def begin(self, key):
+        future = self.calls.get(key)
+        if future is not None:
+            self.shared += 1
+            return future, False
+        future = self.calls[key] = asyncio.get_running_loop().create_future()
+        return future, True
+
+    def finish(self, key, future, result=None, error=None):
+        self.calls.pop(key, None)
+        if future.done(): return
+        # leader 취소를 future.cancel() 로 전하면 기다리던 쪽 태스크까지 취소된 것처럼 보이므로 예외로 전달
+        if isinstance(error, asyncio.CancelledError): error = LeaderCancelled()
+        if error is not None:
+            future.set_exception(error)
+            future.exception()  # 기다리는 쪽이 없어도 경고가 나지 않도록 소비
+        else:
+            future.set_result(result)
+
+    async def wait(self, future):
+        return await asyncio.shield(future)
+
+    async def do(self, key, coro_fn):
+        while True:
+            future, leader = self.begin(key)
+            if leader: break
+            try:
+                return await self.wait(future)
+            except LeaderCancelled:
+                continue
+        try:
+            result = await coro_fn()
+        except (Exception, asyncio.CancelledError) as e:
+            self.finish(key, future, error=e)
+            raise
+        self.finish(key, future, result=result)
+        return result
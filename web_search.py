@@ -0,0 +1,106 @@
+import os
+import threading
+import time
+
+from ttl_cache import TTLCache, SingleFlight
+
+# ==========================================
+# 웹 검색 계층: TTL 결과 캐시 + 중복 호출 합치기 + 회로 차단기
+# ==========================================
+# - 같은 검색어("연봉", "OO 전망" 등)는 ttl 동안 캐시에서 바로 응답
+# - 동시에 들어온 같은 검색어는 DuckDuckGo 호출 한 번으로 합침
+# - 연속 실패 시 회로를 열어(open) 타임아웃을 기다리지 않고,
+#   마지막으로 성공한 결과(stale)를 즉시 돌려줌
+# - backend 는 (query, max_results) → [{'title','body',...}] 형태의 함수면 무엇이든 가능
+#   예) WebSearch(backend=lambda q, n: [{"title": "가짜", "body": q}])  # 로컬 테스트용
+
+class SearchUnavailable(Exception):
+    pass
+
+def ddgs_backend(query, max_results):
+    # 무거운 라이브러리라 실제 검색 시점에만 불러옴
+    from duckduckgo_search import DDGS
+    with DDGS(timeout=int(os.environ.get("SEARCH_TIMEOUT", 10))) as ddgs:
+        return list(ddgs.text(query, max_results=max_results))
+
+class CircuitBreaker:
+    # closed(정상) → 연속 failure_threshold 회 실패 → open(차단)
+    # → reset_timeout 초 후 half_open(시험 호출 1회) → 성공 시 closed / 실패 시 다시 open
+    def __init__(self, failure_threshold=3, reset_timeout=60):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.state == "closed": return True
+            if self.state == "open" and time.time() - self.opened_at >= self.reset_timeout:
+                self.state = "half_open"
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.state = "closed"
+            self.failures = 0
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = time.time()
+
+class WebSearch:
+    def __init__(self, backend=ddgs_backend, max_results=2, ttl=600, stale_ttl=86400,
+                 max_size=256, failure_threshold=3, reset_timeout=60):
+        self.backend = backend
+        self.max_results = max_results
+        self.cache = TTLCache(max_size=max_size, ttl=ttl, stale_ttl=stale_ttl)
+        self.flight = SingleFlight()
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.backend_calls = 0
+        self.backend_failures = 0
+        self.stale_served = 0
+
+    def _stale_or_raise(self, key, reason):
+        stale = self.cache.get_stale(key)
+        if stale is None: raise SearchUnavailable(reason)
+        self.stale_served += 1
+        return stale
+
+    def _fetch(self, key):
+        self.backend_calls += 1
+        try:
+            results = self.backend(key, self.max_results)
+        except Exception as e:
+            self.backend_failures += 1
+            self.breaker.record_failure()
+            return self._stale_or_raise(key, e)
+        self.breaker.record_success()
+        self.cache.set(key, results)
+        return results
+
+    def search(self, query):
+        key = " ".join(query.split())
+        cached = self.cache.get(key)
+        if cached is not None: return cached
+
+        # 차단 중에는 외부 호출 없이 마지막 정상 결과만 사용
+        if not self.breaker.allow():
+            return self._stale_or_raise(key, "검색 서버 응답 불안정 (잠시 차단 중)")
+
+        return self.flight.do(key, lambda: self._fetch(key))
+
+    def stats(self):
+        return {
+            "cache": self.cache.stats(),
+            "breaker_state": self.breaker.state,
+            "backend_calls": self.backend_calls,
+            "backend_failures": self.backend_failures,
+            "stale_served": self.stale_served,
+            "single_flight_shared": self.flight.shared,
+        }